@@ -0,0 +1,396 @@
+from decimal import Decimal, getcontext
+
+from vector import Vector
+from hyperplane import Hyperplane
+from lu_factorization import LUFactorization
+from solver_stats import SolverStats, timed
+
+getcontext().prec = 30
+
+
+class AugmentedMatrix(object):
+
+    NO_SOLUTIONS_MSG = 'No solutions'
+    UNKNOWN_PIVOTING_STRATEGY_MSG = 'Unknown pivoting strategy'
+    ZERO_TOLERANCE = Decimal(1e-10)
+    ZERO = Decimal('0')
+    ONE = Decimal('1')
+
+    backend = 'decimal'
+    vector_class = Vector
+    factorization_class = LUFactorization
+
+    NO_PIVOTING = 'none'
+    PARTIAL_PIVOTING = 'partial'
+    SCALED_PARTIAL_PIVOTING = 'scaled_partial'
+    COMPLETE_PIVOTING = 'complete'
+    PIVOTING_STRATEGIES = (NO_PIVOTING, PARTIAL_PIVOTING, SCALED_PARTIAL_PIVOTING, COMPLETE_PIVOTING)
+
+    def __init__(self, rows, constants, dimension, leading_indices=None, pivoting=NO_PIVOTING):
+        """Initialize AugmentedMatrix object.
+
+        Gaussian elimination on a LinearSystem builds a new Vector and a new
+        Plane for every elementary row operation. AugmentedMatrix keeps the
+        coefficients in mutable lists instead and updates them in place, the
+        equations are only turned back into Hyperplane objects on request.
+
+        Rows are copied on write: a row may be any sequence, for instance the
+        coordinates of a normal vector shared with the input system, and it is
+        only turned into a list of its own when a row operation changes it.
+        Rows that are never changed are handed back as the planes they came from.
+
+        Args:
+            rows: list of coefficient lists, one per equation.
+            constants: list of constant terms, one per equation.
+            dimension: num of variables of each equation.
+            leading_indices: indices of first nonzero terms in each row if already known,
+                             they are kept up to date by row operations afterwards.
+            pivoting: strategy used to pick pivots during elimination
+                      'none' -> first row with nonzero coefficient (default)
+                      'partial' -> row with largest coefficient
+                      'scaled_partial' -> row with largest coefficient relative to its largest term
+                      'complete' -> largest coefficient of remaining rows and columns,
+                                    columns are exchanged and tracked by column_order
+
+        Raises:
+            Exception: thrown with msg 'Unknown pivoting strategy' when pivoting is not supported"""
+        if pivoting not in self.PIVOTING_STRATEGIES:
+            raise Exception(self.UNKNOWN_PIVOTING_STRATEGY_MSG)
+
+        self.rows = rows
+        self.constants = constants
+        self.dimension = dimension
+        self.pivoting = pivoting
+        self.column_order = list(range(dimension))
+        self.row_order = list(range(len(rows)))
+        self.row_scales = None
+        self.lower = None
+        self.planes = None
+        self.stats = None
+        self.threads = 1
+
+        if leading_indices is None:
+            leading_indices = [self.first_nonzero_index(row) for row in rows]
+        self.leading_indices = leading_indices
+
+    @classmethod
+    def from_planes(cls, planes, dimension, leading_indices=None, pivoting=NO_PIVOTING):
+        """Returns a new AugmentedMatrix holding coefficients of planes.
+
+        Coefficients of normal vectors from another backend are converted to the scalar type of this one."""
+        to_scalar = cls.vector_class.to_scalar
+        rows = [p.normal_vector.coordinates if p.normal_vector.backend == cls.backend
+                else [to_scalar(x) for x in p.normal_vector.coordinates] for p in planes]
+        constants = [to_scalar(p.constant_term) for p in planes]
+        if leading_indices is not None:
+            leading_indices = list(leading_indices)
+        matrix = cls(rows, constants, dimension, leading_indices, pivoting)
+        matrix.planes = list(planes)
+        return matrix
+
+    def to_hyperplanes(self):
+        """Returns a list of Hyperplanes, one per row, in the original variable order."""
+        self.restore_column_order()
+        planes = self.planes or [None] * len(self.rows)
+        return [p if p is not None else Hyperplane(normal_vector=self.vector_class(row), constant_term=k)
+                for p, row, k in zip(planes, self.rows, self.constants)]
+
+    def restore_column_order(self):
+        """Undo column exchanges made by complete pivoting."""
+        order = self.column_order
+        if order == list(range(self.dimension)):
+            return
+
+        for i, row in enumerate(self.rows):
+            restored = [None] * self.dimension
+            for k, x in zip(order, row):
+                restored[k] = x
+            self.rows[i] = restored
+
+        self.planes = None
+        self.column_order = list(range(self.dimension))
+        self.leading_indices = [self.first_nonzero_index(row) for row in self.rows]
+
+    def swap_rows(self, row1, row2):
+        """Swap rows in equations."""
+        rows = self.rows
+        constants = self.constants
+        rows[row1], rows[row2] = rows[row2], rows[row1]
+        constants[row1], constants[row2] = constants[row2], constants[row1]
+        indices = self.leading_indices
+        indices[row1], indices[row2] = indices[row2], indices[row1]
+        order = self.row_order
+        order[row1], order[row2] = order[row2], order[row1]
+        scales = self.row_scales
+        if scales is not None:
+            scales[row1], scales[row2] = scales[row2], scales[row1]
+        lower = self.lower
+        if lower is not None:
+            lower[row1], lower[row2] = lower[row2], lower[row1]
+        planes = self.planes
+        if planes is not None:
+            planes[row1], planes[row2] = planes[row2], planes[row1]
+        if self.stats is not None:
+            self.stats.count_row_swap()
+
+    def mutable_row(self, row):
+        """Returns row as a list that can be updated in place, copying it on first write."""
+        r = self.rows[row]
+        if not isinstance(r, list):
+            r = self.rows[row] = list(r)
+        if self.planes is not None:
+            self.planes[row] = None
+        return r
+
+    def append_row(self, coefficients, constant_term):
+        """Append an equation at the bottom, returns its row."""
+        to_scalar = self.vector_class.to_scalar
+        row = len(self.rows)
+        self.rows.append([to_scalar(x) for x in coefficients])
+        self.constants.append(to_scalar(constant_term))
+        self.leading_indices.append(self.first_nonzero_index(self.rows[row]))
+        self.row_order.append(row)
+        if self.planes is not None:
+            self.planes.append(None)
+        return row
+
+    def pop_row(self):
+        """Remove the equation at the bottom."""
+        self.rows.pop()
+        self.constants.pop()
+        self.leading_indices.pop()
+        self.row_order.pop()
+        if self.planes is not None:
+            self.planes.pop()
+
+    def coefficient(self, row, col):
+        """Returns coefficient of variable col in row."""
+        return self.rows[row][col]
+
+    def is_nonzero(self, x):
+        """Returns whether x is nonzero, that is not smaller than ZERO_TOLERANCE."""
+        return bool(x) and abs(x) >= self.ZERO_TOLERANCE
+
+    def swap_columns(self, col1, col2):
+        """Swap coefficients of two variables in every equation, remembering the exchange in column_order."""
+        for i in range(len(self.rows)):
+            r = self.mutable_row(i)
+            r[col1], r[col2] = r[col2], r[col1]
+        order = self.column_order
+        order[col1], order[col2] = order[col2], order[col1]
+
+        low = min(col1, col2)
+        indices = self.leading_indices
+        for i, index in enumerate(indices):
+            if index >= low:
+                indices[i] = self.first_nonzero_index(self.rows[i], low)
+
+    def multiply_coefficient_and_row(self, coefficient, row, start=0):
+        """Multiply a row with coefficient in equations.
+
+        Coefficients before column start are assumed to be zero and left untouched."""
+        r = self.mutable_row(row)
+        r[start:] = [coefficient * x for x in r[start:]]
+        self.constants[row] *= coefficient
+        self.update_leading_index(row, start)
+        if self.stats is not None:
+            self.stats.count_row_scalings(1, len(r) - start + 1)
+
+    def add_multiple_times_row_to_row(self, coefficient, row_to_add, row_to_be_added_to, start=0):
+        """Multiply a row_to_add with coefficient and add it to row_to_be_added_to in equations.
+
+        Coefficients of row_to_add before column start are assumed to be zero
+        and are skipped."""
+        source = self.rows[row_to_add]
+        target = self.mutable_row(row_to_be_added_to)
+        target[start:] = [y + coefficient * x for x, y in zip(source[start:], target[start:])]
+        self.constants[row_to_be_added_to] += coefficient * self.constants[row_to_add]
+        self.update_leading_index(row_to_be_added_to, start)
+        if self.stats is not None:
+            self.stats.count_row_additions(1, len(source) - start + 1)
+
+    def update_leading_index(self, row, start):
+        """Refresh leading index of row after coefficients from column start have changed."""
+        index = self.leading_indices[row]
+        if 0 <= index < start:
+            return
+        self.leading_indices[row] = self.first_nonzero_index(self.rows[row], start)
+
+    def indices_of_first_nonzero_terms_in_each_row(self):
+        """Returns indices of first nonzero terms in each row."""
+        return list(self.leading_indices)
+
+    def find_pivot_row(self, row, col):
+        """Returns row at or below row chosen as pivot for column col, -1 if all coefficients are zero.
+
+        Rows at or below row must already be cleared left of column col."""
+        indices = self.leading_indices
+        candidates = [j for j in range(row, len(indices)) if indices[j] == col]
+        if not candidates:
+            return -1
+
+        if self.pivoting == self.PARTIAL_PIVOTING:
+            return max(candidates, key=lambda j: abs(self.rows[j][col]))
+        if self.pivoting == self.SCALED_PARTIAL_PIVOTING:
+            scales = self.row_scales
+            return max(candidates, key=lambda j: abs(self.rows[j][col]) / scales[j])
+        return candidates[0]
+
+    def find_complete_pivot(self, row, col):
+        """Returns (row, column) of largest coefficient at or below row and right of col, (-1, -1) if all are zero."""
+        pivot = (-1, -1)
+        largest = self.ZERO
+        for j in range(row, len(self.rows)):
+            r = self.rows[j]
+            for k in range(col, self.dimension):
+                magnitude = abs(r[k])
+                if magnitude > largest:
+                    pivot = (j, k)
+                    largest = magnitude
+
+        if largest < self.ZERO_TOLERANCE:
+            return -1, -1
+        return pivot
+
+    def clear_coefficients_below(self, row, col):
+        """Eliminate the coefficients in column col underneath row, row must hold the pivot of col."""
+        rows = self.rows
+        lower = self.lower
+        pivot = rows[row][col]
+        for j in range(row + 1, len(rows)):
+            c = rows[j][col]
+            if not c:
+                continue
+            factor = c / pivot
+            if lower is not None:
+                lower[j][row] = factor
+
+            # the leading term is cleared by hand, so its index has to be looked up again
+            self.mutable_row(j)[col] = self.ZERO
+            self.leading_indices[j] = -1
+            self.add_multiple_times_row_to_row(-factor, row, j, start=col + 1)
+
+    def clear_coefficients_above(self, row, col):
+        """Eliminate the coefficients in column col above row, row must hold a pivot equal to 1."""
+        rows = self.rows
+        for j in range(row):
+            c = rows[j][col]
+            if not c:
+                continue
+            self.mutable_row(j)[col] = self.ZERO
+            self.add_multiple_times_row_to_row(-c, row, j, start=col + 1)
+
+    def compute_triangular_form(self):
+        """Reduce self to triangular form in place."""
+        num_equations = len(self.rows)
+        row = 0
+
+        if self.pivoting == self.SCALED_PARTIAL_PIVOTING:
+            self.row_scales = [max(abs(x) for x in r) for r in self.rows]
+
+        for col in range(self.dimension):
+            if row >= num_equations:
+                break
+
+            # find a row with nonzero coefficient in this column and move it up
+            if self.pivoting == self.COMPLETE_PIVOTING:
+                pivot_row, pivot_col = self.find_complete_pivot(row, col)
+                if pivot_row < 0:
+                    break
+                if pivot_col != col:
+                    self.swap_columns(col, pivot_col)
+            else:
+                pivot_row = self.find_pivot_row(row, col)
+                if pivot_row < 0:
+                    continue
+
+            if pivot_row != row:
+                self.swap_rows(row, pivot_row)
+            if self.stats is not None:
+                self.stats.record_pivot(self.rows[row][col])
+
+            self.clear_coefficients_below(row, col)
+            row += 1
+
+        self.row_scales = None
+
+    def compute_lu_factorization(self):
+        """Reduce self to triangular form in place recording the multipliers used,
+        returns the resulting LUFactorization.
+
+        Constant terms take part in the elimination as usual, but the factorization
+        only depends on the coefficients and can solve any new constant terms."""
+        num_equations = len(self.rows)
+        self.lower = [[self.ZERO] * num_equations for _ in range(num_equations)]
+        self.compute_triangular_form()
+        return self.factorization_class(self)
+
+    def compute_rref(self):
+        """Reduce self to reduced row-echelon form in place."""
+        with timed(self.stats, SolverStats.TRIANGULAR_FORM):
+            self.compute_triangular_form()
+
+        with timed(self.stats, SolverStats.BACK_SUBSTITUTION):
+            pivot_indices = self.leading_indices
+            for i in range(len(self.rows))[::-1]:
+                col = pivot_indices[i]
+                if col < 0:
+                    continue
+
+                # scale to make coefficient equal 1
+                self.multiply_coefficient_and_row(self.ONE / self.rows[i][col], i, start=col + 1)
+                self.mutable_row(i)[col] = self.ONE
+
+                self.clear_coefficients_above(i, col)
+
+    def extract_direction_vectors_for_parametrization(self):
+        """Returns direction vectors for parametrization, self must be in reduced row-echelon form."""
+        num_variables = self.dimension
+        pivot_indices = self.leading_indices
+        order = self.column_order
+        free_variable_indices = sorted(set(range(num_variables)) - set(pivot_indices), key=order.__getitem__)
+
+        direction_vectors = []
+
+        for free_var in free_variable_indices:
+            vector_coords = [0] * num_variables
+            vector_coords[order[free_var]] = 1
+            for i, row in enumerate(self.rows):
+                pivot_var = pivot_indices[i]
+                if pivot_var < 0:
+                    break
+                vector_coords[order[pivot_var]] = -row[free_var]
+            direction_vectors.append(self.vector_class(vector_coords))
+
+        return direction_vectors
+
+    def extract_basepoint_for_parametrization(self):
+        """Returns basepoint vector for parametrization, self must be in reduced row-echelon form."""
+        pivot_indices = self.leading_indices
+        order = self.column_order
+
+        basepoint_coords = [0] * self.dimension
+
+        for i, k in enumerate(self.constants):
+            pivot_var = pivot_indices[i]
+            if pivot_var < 0:
+                break
+            basepoint_coords[order[pivot_var]] = k
+
+        return self.vector_class(basepoint_coords)
+
+    def raise_exception_if_contradictory_equation(self):
+        """Raise exception with msg 'No solutions' when contradictory equation is found."""
+        tolerance = self.ZERO_TOLERANCE
+        for i, k in enumerate(self.constants):
+            if self.leading_indices[i] < 0 and abs(k) >= tolerance:
+                raise Exception(self.NO_SOLUTIONS_MSG)
+
+    @staticmethod
+    def first_nonzero_index(row, start=0):
+        """Returns index of first nonzero term in row from column start, -1 if there is none."""
+        tolerance = AugmentedMatrix.ZERO_TOLERANCE
+        for k in range(start, len(row)):
+            if abs(row[k]) >= tolerance:
+                return k
+        return -1
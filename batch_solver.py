@@ -0,0 +1,179 @@
+from decimal import Decimal, getcontext, localcontext
+from fractions import Fraction
+from multiprocessing import cpu_count
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:
+    ProcessPoolExecutor = None
+
+from sparse_vector import SparseVector
+from parametrization import Parametrization
+from linear_system import LinearSystem
+
+
+class BatchSolver(object):
+
+    CHUNKS_PER_WORKER = 4
+    PROCESS_POOL_REQUIRED_MSG = 'Solving in parallel requires concurrent.futures'
+    MAX_WORKERS_MUST_BE_POSITIVE_MSG = 'The max num of workers must be positive'
+    CHUNK_SIZE_MUST_BE_POSITIVE_MSG = 'The chunk size must be positive'
+
+    def __init__(self, max_workers=None, chunk_size=None):
+        """Initialize BatchSolver object.
+
+        A BatchSolver solves many independent linear systems on a pool of worker processes.
+        Systems are not pickled as Hyperplane, Vector and Decimal objects: each is sent as
+        its backend, pivoting strategy, dimension and rows of plain numbers (floats for the
+        float64 backend, exact strings for the others, nonzeros only for the sparse backend),
+        and solutions come back the same way. Workers solve the rows as an AugmentedMatrix
+        at the Decimal precision of the caller, so results are the same as compute_solution.
+
+        Args:
+            max_workers: num of worker processes, num of CPUs when None (default).
+            chunk_size: num of systems sent to a worker at once, None to split the batch
+                        into CHUNKS_PER_WORKER chunks per worker (default).
+
+        Raises:
+            Exception: thrown with msg 'Solving in parallel requires concurrent.futures'
+                       when concurrent.futures is not available
+            Exception: thrown with msg 'The max num of workers must be positive' when max_workers < 1
+            Exception: thrown with msg 'The chunk size must be positive' when chunk_size < 1"""
+        if ProcessPoolExecutor is None:
+            raise Exception(self.PROCESS_POOL_REQUIRED_MSG)
+        if max_workers is not None and max_workers < 1:
+            raise Exception(self.MAX_WORKERS_MUST_BE_POSITIVE_MSG)
+        if chunk_size is not None and chunk_size < 1:
+            raise Exception(self.CHUNK_SIZE_MUST_BE_POSITIVE_MSG)
+
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+
+    def solve(self, systems):
+        """Returns what compute_solution returns for each of systems, in the same order.
+
+        Args:
+            systems: iterable of LinearSystems.
+
+        Returns:
+            A list holding for each system a Parametrization or 'No solutions'
+
+        Raises:
+            Exception: inner Exception of a worker whose msg is not 'No solutions'"""
+        encoded = [self.encode_system(system) for system in systems]
+        if not encoded:
+            return []
+
+        workers = self.max_workers or cpu_count()
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            chunk_size = max(1, -(-len(encoded) // (workers * self.CHUNKS_PER_WORKER)))
+
+        precision = getcontext().prec
+        tasks = [(precision, encoded[i:i + chunk_size]) for i in range(0, len(encoded), chunk_size)]
+        results = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk in executor.map(solve_chunk, tasks):
+                results.extend(chunk)
+
+        return [self.decode_solution(system[0], result) for system, result in zip(encoded, results)]
+
+    @staticmethod
+    def encode_system(system):
+        """Returns (backend, pivoting, dimension, rows, constants) of system holding plain numbers only.
+
+        Coefficients are converted to the scalar type of the backend of system first, then to
+        floats for the float64 backend and to strings for the others, which read back exactly.
+        Rows of the sparse backend are tuples of (index of variable, coefficient) of nonzeros."""
+        backend = system.backend
+        to_scalar = LinearSystem.MATRIX_CLASSES[backend].vector_class.to_scalar
+        encode = float if backend == LinearSystem.FLOAT64_BACKEND else lambda x: str(to_scalar(x))
+        # coordinates of vectors of the same backend already have its scalar type
+        encode_native = float if backend == LinearSystem.FLOAT64_BACKEND else str
+
+        planes = system.planes
+        if backend == LinearSystem.SPARSE_BACKEND:
+            rows = tuple([tuple([(i, encode(x)) for i, x in SparseVector.entries_of(p.normal_vector).items()])
+                          for p in planes])
+        else:
+            rows = tuple([tuple(map(encode_native if p.normal_vector.backend == backend else encode,
+                                    p.normal_vector.coordinates)) for p in planes])
+        constants = tuple([encode(p.constant_term) for p in planes])
+        return backend, system.pivoting, system.dimension, rows, constants
+
+    @staticmethod
+    def decode_system(encoded):
+        """Returns the AugmentedMatrix of the backend of encoded holding its rows, see encode_system."""
+        backend, pivoting, dimension, rows, constants = encoded
+        matrix_class = LinearSystem.MATRIX_CLASSES[backend]
+        if backend == LinearSystem.FLOAT64_BACKEND:
+            return matrix_class(rows, constants, dimension, None, pivoting)
+
+        # strings are read back by the scalar type itself, skipping the type checks of to_scalar
+        scalar_type = Fraction if backend == LinearSystem.FRACTION_BACKEND else Decimal
+        if backend == LinearSystem.SPARSE_BACKEND:
+            rows = [dict((i, scalar_type(x)) for i, x in row) for row in rows]
+        else:
+            rows = [list(map(scalar_type, row)) for row in rows]
+        return matrix_class(rows, list(map(scalar_type, constants)), dimension, None, pivoting)
+
+    @staticmethod
+    def encode_vector(v, backend):
+        """Returns coordinates of v, a vector of backend, as plain numbers, see encode_system."""
+        if backend == LinearSystem.FLOAT64_BACKEND:
+            return tuple(v.coordinates.tolist())
+        if backend == LinearSystem.SPARSE_BACKEND:
+            return tuple([(i, str(x)) for i, x in v.entries.items()])
+        return tuple([str(x) for x in v.coordinates])
+
+    @staticmethod
+    def decode_vector(coordinates, backend, dimension):
+        """Returns the vector of backend holding coordinates encoded by encode_vector."""
+        vector_class = LinearSystem.MATRIX_CLASSES[backend].vector_class
+        if backend == LinearSystem.SPARSE_BACKEND:
+            return SparseVector.from_entries(dict(coordinates), dimension)
+        return vector_class(coordinates)
+
+    @staticmethod
+    def decode_solution(backend, result):
+        """Returns the Parametrization encoded by solve_chunk as result, or 'No solutions'."""
+        if result == LinearSystem.NO_SOLUTIONS_MSG:
+            return result
+
+        dimension, basepoint, direction_vectors = result
+        decode = BatchSolver.decode_vector
+        return Parametrization(basepoint=decode(basepoint, backend, dimension),
+                               direction_vectors=[decode(v, backend, dimension) for v in direction_vectors])
+
+
+def solve_chunk(task):
+    """Returns encoded solutions of systems encoded by BatchSolver.encode_system, run by worker processes.
+
+    Args:
+        task: (Decimal precision, list of encoded systems).
+
+    Returns:
+        A list holding for each system 'No solutions' or (dimension, basepoint, direction vectors)
+        with vectors encoded by BatchSolver.encode_vector"""
+    precision, systems = task
+    results = []
+    with localcontext() as context:
+        context.prec = precision
+        for encoded in systems:
+            backend = encoded[0]
+            matrix = BatchSolver.decode_system(encoded)
+            try:
+                matrix.compute_rref()
+                matrix.raise_exception_if_contradictory_equation()
+            except Exception as e:
+                if str(e) == LinearSystem.NO_SOLUTIONS_MSG:
+                    results.append(str(e))
+                    continue
+                raise e
+
+            encode = BatchSolver.encode_vector
+            direction_vectors = matrix.extract_direction_vectors_for_parametrization()
+            basepoint = matrix.extract_basepoint_for_parametrization()
+            results.append((matrix.dimension, encode(basepoint, backend),
+                            tuple([encode(v, backend) for v in direction_vectors])))
+    return results
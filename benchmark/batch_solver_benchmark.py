@@ -0,0 +1,57 @@
+"""Timings of BatchSolver on a batch of small independent systems, from 1 worker process to the num of CPUs.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmark/batch_solver_benchmark.py
+"""
+from __future__ import print_function
+import time
+from multiprocessing import cpu_count
+
+from vector import Vector
+from hyperplane import Hyperplane
+from linear_system import LinearSystem
+from batch_solver import BatchSolver
+from linear_system_benchmark import build_equations
+from timing import record
+
+BATCH_SIZE = 2000
+SIZE = 5
+
+
+def build_batch(batch_size=BATCH_SIZE, size=SIZE):
+    """Returns batch_size systems of size equations cycling through unique, infinite and no solutions."""
+    cases = ('unique', 'infinite', 'none')
+    systems = []
+    for i in range(batch_size):
+        rows, constant_terms = build_equations(size, cases[i % len(cases)], False, seed=i)
+        systems.append(LinearSystem([Hyperplane(normal_vector=Vector(row), constant_term=k)
+                                     for row, k in zip(rows, constant_terms)]))
+    return systems
+
+
+def best_of(func, repeat):
+    """Returns best seconds of repeat calls of func, a batch is too slow for timeit to call it many times."""
+    seconds = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        seconds.append(time.time() - start)
+    return min(seconds)
+
+
+def run(repeat=3, batch_size=BATCH_SIZE, size=SIZE):
+    """Returns result records of solving the batch one system after another and on 1 to num of CPUs workers."""
+    systems = build_batch(batch_size, size)
+    results = [record('batch_solver.serial', best_of(lambda: [s.compute_solution() for s in systems], repeat),
+                      workers=0, batch_size=batch_size, size=size)]
+    for workers in range(1, cpu_count() + 1):
+        solver = BatchSolver(max_workers=workers)
+        results.append(record('batch_solver.solve', best_of(lambda: solver.solve(systems), repeat),
+                              workers=workers, batch_size=batch_size, size=size))
+    return results
+
+
+if __name__ == '__main__':
+    for result in run():
+        print('{benchmark:<20} {workers:>3} workers {batch_size:>6} systems {size:>3} variables '
+              '{seconds:.3f}s'.format(**result))
@@ -0,0 +1,146 @@
+"""Timings of LinearSystem elimination across sizes, solution cases, inputs and backends.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmark/linear_system_benchmark.py
+"""
+from __future__ import print_function
+import os
+import random
+from multiprocessing import cpu_count
+
+from vector import Vector
+from float_vector import numpy, FloatVector
+from sparse_vector import SparseVector
+from hyperplane import Hyperplane
+from parametrization import Parametrization
+from linear_system import LinearSystem
+from timing import measure, record
+
+SIZES = (3, 10, 50, 200)
+CASES = ('unique', 'infinite', 'none')
+METHODS = ('compute_triangular_form', 'compute_rref', 'compute_solution')
+NONZEROS_PER_SPARSE_ROW = 3
+BLOCKED_SIZE = 600
+RENDERED_SIZE = 2000
+RENDERED_FREE_VARIABLES = 10
+
+
+def random_rows(size, sparse, rng):
+    """Returns size rows of integer coefficients with a dominant diagonal, so they are independent."""
+    rows = []
+    for i in range(size):
+        if sparse:
+            row = [0] * size
+            for _ in range(NONZEROS_PER_SPARSE_ROW - 1):
+                row[rng.randrange(size)] = rng.randint(-9, 9)
+        else:
+            row = [rng.randint(-9, 9) for _ in range(size)]
+        row[i] = 10 * NONZEROS_PER_SPARSE_ROW if sparse else 10 * size
+        rows.append(row)
+    return rows
+
+
+def build_equations(size, case, sparse, seed=0):
+    """Returns coefficient rows and constant terms of a system with one, infinite or no solutions.
+
+    For infinite and no solutions the last row is replaced by the sum of the first
+    two rows, and its constant term by the sum of theirs (plus one for no solutions)."""
+    rng = random.Random(seed)
+    rows = random_rows(size, sparse, rng)
+    constant_terms = [rng.randint(-99, 99) for _ in range(size)]
+
+    if case != 'unique' and size >= 3:
+        rows[-1] = [x + y for x, y in zip(rows[0], rows[1])]
+        constant_terms[-1] = constant_terms[0] + constant_terms[1] + (1 if case == 'none' else 0)
+    return rows, constant_terms
+
+
+def configurations():
+    """Returns (input, vector class, backend) to benchmark, dense inputs also run on float64 if numpy is installed."""
+    configs = [('dense', Vector, LinearSystem.DECIMAL_BACKEND),
+               ('sparse', Vector, LinearSystem.DECIMAL_BACKEND),
+               ('sparse', SparseVector, LinearSystem.SPARSE_BACKEND)]
+    if numpy is not None:
+        configs.append(('dense', Vector, LinearSystem.FLOAT64_BACKEND))
+    return configs
+
+
+def run(sizes=SIZES, repeat=3):
+    """Returns result records of every LinearSystem benchmark."""
+    results = []
+    for size in sizes:
+        for case in CASES:
+            for name, vector_class, backend in configurations():
+                rows, constant_terms = build_equations(size, case, name == 'sparse')
+                planes = [Hyperplane(normal_vector=vector_class(row), constant_term=k)
+                          for row, k in zip(rows, constant_terms)]
+                system = LinearSystem(planes, backend=backend)
+
+                for method in METHODS:
+                    seconds = measure(getattr(system, method), repeat)
+                    results.append(record('linear_system.' + method, seconds,
+                                          size=size, case=case, input=name, backend=backend))
+    return results
+
+
+def run_blocked(size=BLOCKED_SIZE, repeat=3):
+    """Returns result records of compute_triangular_form of one dense float64 system,
+    column by column and blocked on 1 to num of CPUs threads, empty if numpy is not installed."""
+    if numpy is None:
+        return []
+
+    rows, constant_terms = build_equations(size, 'unique', False)
+    planes = [Hyperplane(normal_vector=FloatVector(row), constant_term=k) for row, k in zip(rows, constant_terms)]
+    results = []
+    for threads in range(cpu_count() + 1):
+        system = LinearSystem(planes, pivoting=LinearSystem.PARTIAL_PIVOTING, threads=max(threads, 1))
+
+        def compute_triangular_form():
+            matrix = system.to_augmented_matrix()
+            # zero threads stands for column by column elimination
+            if threads == 0:
+                matrix.BLOCKED_MIN_ROWS = size + 1
+            matrix.compute_triangular_form()
+
+        seconds = measure(compute_triangular_form, repeat)
+        results.append(record('linear_system.blocked_triangular_form', seconds, size=size, threads=threads))
+    return results
+
+
+
+def run_rendering(size=RENDERED_SIZE, repeat=3):
+    """Returns result records of writing a sparse system of size equations and a parametrization
+    of size variables and RENDERED_FREE_VARIABLES free variables to os.devnull."""
+    rows, constant_terms = build_equations(size, 'unique', True)
+    rng = random.Random(0)
+    results = []
+    with open(os.devnull, 'w') as stream:
+        for name, vector_class, backend in configurations():
+            if name != 'sparse' and backend != LinearSystem.FLOAT64_BACKEND:
+                continue
+            if backend == LinearSystem.FLOAT64_BACKEND:
+                vector_class = FloatVector
+            planes = [Hyperplane(normal_vector=vector_class(row), constant_term=k)
+                      for row, k in zip(rows, constant_terms)]
+            system = LinearSystem(planes, backend=backend)
+            seconds = measure(lambda: system.write(stream), repeat)
+            # equations never write zero terms
+            results.append(record('linear_system.write', seconds, size=size, backend=backend, skip_zeros=True))
+
+            solution = Parametrization(basepoint=vector_class(rows[0]),
+                                       direction_vectors=[vector_class(rng.choice(rows))
+                                                          for _ in range(RENDERED_FREE_VARIABLES)])
+            for skip_zeros in (False, True):
+                seconds = measure(lambda: solution.write(stream, skip_zeros), repeat)
+                results.append(record('parametrization.write', seconds, size=size, backend=backend,
+                                      skip_zeros=skip_zeros))
+    return results
+
+
+if __name__ == '__main__':
+    for result in run():
+        print('{benchmark:<38} {case:<8} {input:<7} {backend:<8} {size:>5} {seconds:.3e}s'.format(**result))
+    for result in run_blocked():
+        print('{benchmark:<38} {threads:>2} threads {size:>5} {seconds:.3e}s'.format(**result))
+    for result in run_rendering():
+        print('{benchmark:<38} {backend:<8} skip zeros {skip_zeros!s:<5} {size:>5} {seconds:.3e}s'.format(**result))
@@ -0,0 +1,84 @@
+"""Timings of EquationParser reading a million equations from a file, in text and matrix format.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmark/parser_benchmark.py
+"""
+from __future__ import print_function
+import collections
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from linear_system import LinearSystem
+from equation_parser import EquationParser
+from timing import record
+
+NUM_EQUATIONS = 1000000
+# run_all_benchmarks streams fewer equations, to take about as long as the other benchmarks
+SUITE_NUM_EQUATIONS = 20000
+DIMENSION = 10
+TERMS_PER_EQUATION = 4
+COEFFICIENTS = (1, -1, 2, -3, 7, 0.5, -2.25)
+
+
+def write_equations(path, file_format, num_equations=NUM_EQUATIONS, seed=0):
+    """Write num_equations random equations of TERMS_PER_EQUATION terms in DIMENSION variables to path."""
+    rng = random.Random(seed)
+    with open(path, 'w') as f:
+        for _ in range(num_equations):
+            terms = dict((i, rng.choice(COEFFICIENTS)) for i in rng.sample(range(DIMENSION), TERMS_PER_EQUATION))
+            k = rng.randint(-99, 99)
+            if file_format == EquationParser.MATRIX_FORMAT:
+                f.write(','.join([str(terms.get(i, 0)) for i in range(DIMENSION)] + [str(k)]) + '\n')
+                continue
+
+            output = []
+            for i in sorted(terms):
+                c = terms[i]
+                sign = '-' if c < 0 else '+'
+                if not output:
+                    sign = '-' if c < 0 else ''
+                output.append('{}{}x_{}'.format(sign + ' ' if output else sign, '' if abs(c) == 1 else abs(c), i + 1))
+            f.write('{} = {}\n'.format(' '.join(output), k))
+
+
+def best_of(func, repeat):
+    """Returns best seconds of repeat calls of func."""
+    seconds = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        seconds.append(time.time() - start)
+    return min(seconds)
+
+
+def run(repeat=1, num_equations=NUM_EQUATIONS):
+    """Returns result records of streaming the rows of num_equations equations through EquationParser.rows,
+    seconds are per equation."""
+    directory = tempfile.mkdtemp()
+    results = []
+    try:
+        for file_format in EquationParser.FORMATS:
+            path = os.path.join(directory, 'equations.' + file_format)
+            write_equations(path, file_format, num_equations)
+            for backend in (LinearSystem.DECIMAL_BACKEND, LinearSystem.FLOAT64_BACKEND, LinearSystem.SPARSE_BACKEND):
+                parser = EquationParser(file_format, DIMENSION, backend)
+
+                def stream():
+                    with open(path) as f:
+                        collections.deque(parser.rows(f), maxlen=0)
+
+                seconds = best_of(stream, repeat)
+                results.append(record('equation_parser.rows', seconds / num_equations,
+                                      format=file_format, backend=backend, num_equations=num_equations))
+    finally:
+        shutil.rmtree(directory)
+    return results
+
+
+if __name__ == '__main__':
+    for result in run():
+        print('{benchmark:<22} {format:<7} {backend:<8} {num_equations:>8} equations '
+              '{seconds:.3e}s per equation'.format(**result))
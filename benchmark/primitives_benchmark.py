@@ -0,0 +1,68 @@
+"""Timings of Vector operations, VectorBatch operations and Hyperplane construction.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmark/primitives_benchmark.py
+"""
+from __future__ import print_function
+import random
+
+from vector import Vector
+from sparse_vector import SparseVector
+from hyperplane import Hyperplane
+from vector_batch import VectorBatch, numpy
+from timing import measure, record
+
+SIZES = (3, 10, 50, 200)
+VECTOR_CLASSES = (('dense', Vector), ('sparse', SparseVector))
+BATCH_SIZE = 1000
+
+
+def random_coordinates(size, seed, density=1.0):
+    """Returns size random coordinates, each one nonzero with probability density."""
+    rng = random.Random(seed)
+    return [rng.uniform(-10, 10) if rng.random() < density else 0 for _ in range(size)]
+
+
+def run(sizes=SIZES, repeat=3):
+    """Returns result records of every Vector and Hyperplane benchmark."""
+    results = []
+    for size in sizes:
+        for name, vector_class in VECTOR_CLASSES:
+            density = 1.0 if name == 'dense' else min(1.0, 3.0 / size)
+            u = random_coordinates(size, 1, density)
+            w = random_coordinates(size, 2, density)
+            u[0] = w[0] = 1
+            v1 = vector_class(u)
+            v2 = vector_class(w)
+
+            cases = [('vector.dot', lambda: v1.dot(v2)),
+                     ('vector.normalized', lambda: v1.normalized()),
+                     ('vector.angle_with', lambda: v1.angle_with(v2)),
+                     ('hyperplane.construct', lambda: Hyperplane(normal_vector=vector_class(u), constant_term=1))]
+            if size == 3:
+                cases.append(('vector.cross', lambda: v1.cross(v2)))
+
+            for benchmark, func in cases:
+                results.append(record(benchmark, measure(func, repeat), size=size, input=name))
+
+        if numpy is not None:
+            results.extend(run_batch(size, repeat))
+    return results
+
+
+def run_batch(size, repeat=3):
+    """Returns result records of VectorBatch benchmarks, seconds are per pair of vectors."""
+    b1 = VectorBatch([random_coordinates(size, seed) for seed in range(BATCH_SIZE)])
+    b2 = VectorBatch([random_coordinates(size, seed) for seed in range(BATCH_SIZE, 2 * BATCH_SIZE)])
+    cases = [('vector_batch.dot', lambda: b1.dot(b2)),
+             ('vector_batch.normalized', lambda: b1.normalized()),
+             ('vector_batch.angle_with', lambda: b1.angle_with(b2))]
+    if size == 3:
+        cases.append(('vector_batch.cross', lambda: b1.cross(b2)))
+    return [record(benchmark, measure(func, repeat) / BATCH_SIZE, size=size, input='batch')
+            for benchmark, func in cases]
+
+
+if __name__ == '__main__':
+    for result in run():
+        print('{benchmark:<22} {input:<7} {size:>5} {seconds:.3e}s'.format(**result))
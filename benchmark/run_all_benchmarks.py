@@ -0,0 +1,51 @@
+"""Runs every benchmark and writes the results as JSON, so runs can be diffed over time.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmark/run_all_benchmarks.py --output results.json
+"""
+from __future__ import print_function
+import argparse
+import json
+import platform
+import sys
+import time
+
+import primitives_benchmark
+import linear_system_benchmark
+import vector_memory_benchmark
+import batch_solver_benchmark
+import parser_benchmark
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(linear_system_benchmark.SIZES),
+                        help='num of variables to benchmark (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=3, help='timing rounds, the best one is kept (default: 3)')
+    parser.add_argument('--output', help='file to write JSON results to (default: stdout)')
+    args = parser.parse_args(argv)
+
+    results = []
+    results.extend(primitives_benchmark.run(args.sizes, args.repeat))
+    results.extend(linear_system_benchmark.run(args.sizes, args.repeat))
+    results.extend(linear_system_benchmark.run_blocked(repeat=args.repeat))
+    results.extend(linear_system_benchmark.run_rendering(repeat=args.repeat))
+    results.extend(vector_memory_benchmark.run())
+    results.extend(batch_solver_benchmark.run(args.repeat))
+    results.extend(parser_benchmark.run(args.repeat, parser_benchmark.SUITE_NUM_EQUATIONS))
+
+    report = {'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+              'python': platform.python_version(),
+              'platform': platform.platform(),
+              'results': results}
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    else:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,18 @@
+"""Helpers shared by the benchmarks."""
+import timeit
+
+
+def measure(func, repeat=3):
+    """Returns best seconds per call of func over repeat rounds.
+
+    Each round calls func often enough to run for at least 0.2 seconds, as timeit does."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def record(benchmark, seconds, **params):
+    """Returns a result record, a flat dict of benchmark name, params and seconds per call."""
+    result = {'benchmark': benchmark, 'seconds': seconds}
+    result.update(params)
+    return result
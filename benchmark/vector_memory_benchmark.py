@@ -0,0 +1,64 @@
+"""Memory footprint of a single Vector at several dimensions.
+
+Each vector is compared with a subclass that drops __slots__ and so carries
+a per-instance __dict__ again, the way Vector was stored before.
+
+Run from the repository root:
+    PYTHONPATH=. python benchmark/vector_memory_benchmark.py
+"""
+from __future__ import print_function
+import gc
+import tracemalloc
+
+from vector import Vector
+from float_vector import FloatVector, numpy
+
+DIMENSIONS = (3, 100, 10000)
+NUM_OF_SCALARS = 300000
+
+
+class DictVector(Vector):
+    pass
+
+
+class DictFloatVector(FloatVector):
+    pass
+
+
+def bytes_per_instance(vector_class, dimension):
+    """Returns average traced bytes of a vector_class instance of dimension, its scalars included."""
+    count = max(1, NUM_OF_SCALARS // dimension)
+    coordinates = list(range(dimension))
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    vectors = [vector_class(coordinates) for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del vectors
+    return float(after - before) / count
+
+
+def run():
+    """Returns result records of per-instance bytes, with and without __slots__."""
+    classes = [('Vector', Vector, DictVector)]
+    if numpy is not None:
+        classes.append(('FloatVector', FloatVector, DictFloatVector))
+
+    results = []
+    for name, slotted_class, dict_class in classes:
+        for dimension in DIMENSIONS:
+            results.append({'benchmark': 'vector.memory', 'class': name, 'size': dimension,
+                            'bytes': bytes_per_instance(slotted_class, dimension),
+                            'bytes_with_dict': bytes_per_instance(dict_class, dimension)})
+    return results
+
+
+if __name__ == '__main__':
+    print('{:<12} {:>9} {:>14} {:>14} {:>10}'.format('class', 'dimension', 'bytes', 'with __dict__', 'saved'))
+    for result in run():
+        print('{:<12} {:>9} {:>14.1f} {:>14.1f} {:>9.1f}%'.format(
+            result['class'], result['size'], result['bytes'], result['bytes_with_dict'],
+            100 * (result['bytes_with_dict'] - result['bytes']) / result['bytes_with_dict']))
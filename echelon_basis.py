@@ -0,0 +1,102 @@
+from parametrization import Parametrization
+from augmented_matrix import AugmentedMatrix
+
+
+class EchelonBasis(object):
+
+    ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG = 'All planes in the system should live in the same dimension'
+    NO_SOLUTIONS_MSG = AugmentedMatrix.NO_SOLUTIONS_MSG
+
+    def __init__(self, dimension, matrix_class=AugmentedMatrix, pivoting=AugmentedMatrix.NO_PIVOTING):
+        """Initialize EchelonBasis object.
+
+        An EchelonBasis reduces equations one at a time as they arrive (online row reduction),
+        so equations never have to be held all at once. Its matrix is always in reduced
+        row-echelon form with rows sorted by pivot variable: it only keeps one equation per
+        pivot variable, plus a single contradictory equation '0 = k' once one shows up.
+        Equations that reduce to '0 = 0' are dropped.
+
+        Args:
+            dimension: num of variables of every equation.
+            matrix_class: AugmentedMatrix class of the numeric backend used for reduction.
+            pivoting: pivoting strategy passed on to the matrix, every pivot is the leading
+                      term of a new equation so it does not change the reduction."""
+        self.dimension = dimension
+        self.matrix = matrix_class([], [], dimension, [], pivoting)
+        self.contradictory = False
+
+    def add(self, coefficients, constant_term):
+        """Reduce an equation against the basis and add what is left of it.
+
+        Args:
+            coefficients: sequence of coefficients of the equation, one per variable,
+                          the sparse backend also takes a dict mapping index of variable to coefficient.
+            constant_term: constant term of the equation.
+
+        Returns:
+            True when the equation was independent of the basis or contradicts it, False when it was dropped.
+
+        Raises:
+            Exception: thrown with msg 'All planes in the system should live in the same dimension'
+                       when the equation is not in the dimension of the basis"""
+        if not hasattr(coefficients, 'items') and len(coefficients) != self.dimension:
+            raise Exception(self.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+
+        matrix = self.matrix
+        leading_indices = matrix.leading_indices
+        row = matrix.append_row(coefficients, constant_term)
+
+        # pivot rows have no other pivot variables, one pass clears them all from the new row
+        for i in range(row):
+            col = leading_indices[i]
+            if col < 0:
+                break
+            c = matrix.coefficient(row, col)
+            if matrix.is_nonzero(c):
+                matrix.add_multiple_times_row_to_row(-c, i, row)
+
+        col = leading_indices[row]
+        if col < 0:
+            if self.contradictory or not matrix.is_nonzero(matrix.constants[row]):
+                matrix.pop_row()
+                return False
+            self.contradictory = True
+            return True
+
+        matrix.multiply_coefficient_and_row(matrix.ONE / matrix.coefficient(row, col), row)
+        matrix.mutable_row(row)[col] = matrix.ONE
+        for i in range(row):
+            c = matrix.coefficient(i, col)
+            if matrix.is_nonzero(c):
+                matrix.add_multiple_times_row_to_row(-c, row, i)
+
+        # keep rows sorted by pivot variable, the contradictory equation stays at the bottom
+        while row > 0 and (leading_indices[row - 1] < 0 or leading_indices[row - 1] > col):
+            matrix.swap_rows(row - 1, row)
+            row -= 1
+        return True
+
+    def extend(self, rows):
+        """Add every (coefficients, constant_term) pair of rows, see add."""
+        for coefficients, constant_term in rows:
+            self.add(coefficients, constant_term)
+
+    def rank(self):
+        """Returns num of independent equations added so far."""
+        return len(self.matrix.rows) - (1 if self.contradictory else 0)
+
+    def is_consistent(self):
+        """Returns whether equations added so far have a solution."""
+        return not self.contradictory
+
+    def compute_solution(self):
+        """Returns parametrized solution of equations added so far, see LinearSystem.compute_solution."""
+        if self.contradictory:
+            return self.NO_SOLUTIONS_MSG
+
+        matrix = self.matrix
+        return Parametrization(basepoint=matrix.extract_basepoint_for_parametrization(),
+                               direction_vectors=matrix.extract_direction_vectors_for_parametrization())
+
+    def __len__(self):
+        return len(self.matrix.rows)
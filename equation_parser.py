@@ -0,0 +1,248 @@
+from decimal import Decimal
+from fractions import Fraction
+
+from sparse_vector import SparseVector
+from float_vector import FloatVector
+from hyperplane import Hyperplane
+from linear_system import LinearSystem
+
+
+class EquationParser(object):
+
+    TEXT_FORMAT = 'text'
+    MATRIX_FORMAT = 'matrix'
+    FORMATS = (TEXT_FORMAT, MATRIX_FORMAT)
+
+    INVALID_EQUATION_MSG = 'Invalid equation'
+    UNKNOWN_FORMAT_MSG = 'Unknown equation format'
+    DIMENSION_REQUIRED_MSG = 'The dimension is required to stream equations in text format'
+
+    DIGITS = '0123456789'
+    SIGNS = ('+', '-')
+    MAX_CACHED_SCALARS = 4096
+    SCALAR_TYPES = {LinearSystem.DECIMAL_BACKEND: Decimal,
+                    LinearSystem.SPARSE_BACKEND: Decimal,
+                    LinearSystem.FLOAT64_BACKEND: float,
+                    LinearSystem.FRACTION_BACKEND: Fraction}
+
+    def __init__(self, format=TEXT_FORMAT, dimension=None, backend=LinearSystem.DECIMAL_BACKEND,
+                 pivoting=LinearSystem.NO_PIVOTING):
+        """Initialize EquationParser object.
+
+        An EquationParser reads equations one line at a time, in either format:
+            TEXT_FORMAT -> equations as written by Hyperplane.__str__, e.g. 'x_1 + 2x_2 - x_3 = 4',
+                           terms may come in any order, missing variables have coefficient 0
+                           and '0 = k' or ' = k' is an equation without terms
+            MATRIX_FORMAT -> coefficients followed by the constant term, separated by commas
+                             and/or whitespace, e.g. '1, 2, -1, 4' or '1 2 -1 4'
+        Blank lines and lines starting with '#' are skipped.
+
+        Args:
+            format: format of the equations, TEXT_FORMAT (default) or MATRIX_FORMAT.
+            dimension: num of variables, None to take the largest variable of text format
+                       or the num of coefficients of the first equation of matrix format (default).
+            backend: numeric backend of the parsed LinearSystem, see LinearSystem (default DECIMAL_BACKEND).
+            pivoting: pivoting strategy of the parsed LinearSystem, see LinearSystem.
+
+        Raises:
+            Exception: thrown with msg 'Unknown equation format' when format is not supported
+            Exception: thrown with msg 'Unknown numeric backend' when backend is not supported"""
+        if format not in self.FORMATS:
+            raise Exception(self.UNKNOWN_FORMAT_MSG)
+        if backend not in self.SCALAR_TYPES:
+            raise Exception(LinearSystem.UNKNOWN_BACKEND_MSG)
+
+        self.format = format
+        self.dimension = dimension
+        self.backend = backend
+        self.pivoting = pivoting
+        self.scalar_type = self.SCALAR_TYPES[backend]
+        self.cache = {}
+
+    def parse_equation(self, line):
+        """Returns (coefficients, constant term) of the equation on line, None for a blank or comment line.
+
+        Coefficients are a dict mapping index of variable to coefficient for text format, coefficients
+        of repeated variables are added up, and a list of coefficients for matrix format.
+        Numbers are converted to the scalar type of the backend.
+
+        Raises:
+            Exception: thrown with msg starting with 'Invalid equation' when line cannot be parsed"""
+        line = line.strip()
+        if not line or line[0] == '#':
+            return None
+
+        scalar_type = self.scalar_type
+        try:
+            if self.format == self.MATRIX_FORMAT:
+                fields = line.replace(',', ' ').split()
+                if len(fields) < 2:
+                    raise ValueError
+                return [scalar_type(x) for x in fields[:-1]], scalar_type(fields[-1])
+
+            left, equals, right = line.partition('=')
+            if not equals:
+                raise ValueError
+
+            terms = {}
+            left = ''.join(left.split())
+            # Hyperplane.__str__ writes an equation without terms as '0 = k', or ' = k' when its terms round to 0
+            if left and left != '0':
+                # 'x_1-2.5x_3' -> ['', '1-2.5', '3']: each piece holds the index of a variable
+                # followed by the coefficient of the next one
+                pieces = left.split('x_')
+                if len(pieces) < 2:
+                    raise ValueError
+                cache = self.cache
+                digits = self.DIGITS
+                signs = self.SIGNS
+                coefficient = pieces[0]
+                first = True
+                for piece in pieces[1:]:
+                    rest = piece.lstrip(digits)
+                    # every term but the first one needs a sign
+                    if not first and coefficient[:1] not in signs:
+                        raise ValueError
+                    first = False
+
+                    x = cache.get(coefficient)
+                    if x is None:
+                        x = self.cached_scalar(coefficient)
+                    i = int(piece[:-len(rest)] if rest else piece) - 1
+                    if i < 0:
+                        raise ValueError
+                    if i in terms:
+                        x += terms[i]
+                    terms[i] = x
+                    coefficient = rest
+                if coefficient:
+                    raise ValueError
+
+            # a sign or '*' alone is only a coefficient
+            right = right.strip()
+            if not right or right[-1] in '+-*':
+                raise ValueError
+            x = self.cache.get(right)
+            if x is None:
+                x = self.cached_scalar(right)
+            return terms, x
+
+        except (ValueError, ArithmeticError):
+            # Decimal raises InvalidOperation, an ArithmeticError
+            raise Exception('{}: {!r}'.format(self.INVALID_EQUATION_MSG, line))
+
+    def cached_scalar(self, text):
+        """Returns text of a coefficient or constant term converted to the scalar type of the backend,
+        remembering it for the next equations: most files hold few distinct numbers.
+
+        text of a coefficient may end with '*' and may be a sign only, e.g. '-2.5*' -> -2.5, '-' -> -1."""
+        number = text[:-1] if text.endswith('*') else text
+        if number in ('', '+', '-'):
+            number += '1'
+        x = self.scalar_type(number)
+        if len(self.cache) < self.MAX_CACHED_SCALARS:
+            self.cache[text] = x
+        return x
+
+    def rows(self, lines):
+        """Returns a generator of (coefficients, constant_term) pairs, one per equation of lines.
+
+        Coefficients are a list of dimension scalars, or for the sparse backend a dict mapping
+        index of variable to its nonzero coefficient, so rows can be fed to LinearSystem.from_rows
+        or EchelonBasis without holding every equation in memory.
+
+        Raises:
+            Exception: thrown with msg 'The dimension is required to stream equations in text format'
+                       when the format is text and the dimension of the parser is None
+            Exception: thrown with msg starting with 'Invalid equation' when a line cannot be parsed
+            Exception: thrown with msg 'All planes in the system should live in the same dimension'
+                       when an equation is not in the dimension"""
+        for _, row, constant_term in self.rows_in_dimension(lines):
+            yield row, constant_term
+
+    def rows_in_dimension(self, lines):
+        """Returns a generator of (dimension, coefficients, constant_term) of each equation of lines, see rows.
+
+        The dimension is the one of the parser, or the num of coefficients of the first equation
+        of matrix format when it is None."""
+        dimension = self.dimension
+        if dimension is None and self.format == self.TEXT_FORMAT:
+            raise Exception(self.DIMENSION_REQUIRED_MSG)
+
+        sparse = self.backend == LinearSystem.SPARSE_BACKEND
+        for line in lines:
+            parsed = self.parse_equation(line)
+            if parsed is None:
+                continue
+
+            coefficients, constant_term = parsed
+            if dimension is None:
+                # matrix format, the first equation tells the dimension
+                dimension = len(coefficients)
+            yield dimension, self.to_row(coefficients, dimension, sparse), constant_term
+
+    def to_row(self, coefficients, dimension, sparse):
+        """Returns coefficients parsed by parse_equation as a dict of nonzeros if sparse, else as a list of dimension.
+
+        Raises:
+            Exception: thrown with msg 'All planes in the system should live in the same dimension'
+                       when coefficients are not in dimension"""
+        if hasattr(coefficients, 'items'):
+            if coefficients and max(coefficients) >= dimension:
+                raise Exception(LinearSystem.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+            if sparse:
+                return dict((i, x) for i, x in coefficients.items() if x)
+            row = [self.scalar_type(0)] * dimension
+            for i, x in coefficients.items():
+                row[i] = x
+            return row
+
+        if len(coefficients) != dimension:
+            raise Exception(LinearSystem.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+        if sparse:
+            return dict((i, x) for i, x in enumerate(coefficients) if x)
+        return coefficients
+
+    def parse(self, lines):
+        """Returns a LinearSystem of the equations of lines, any iterable of strings such as an open file.
+
+        Lines are parsed as they are read and each Hyperplane is built as soon as its line is parsed,
+        except when the dimension of the parser is None and the format is text: then the terms of
+        every equation are kept until the last one tells the dimension.
+
+        Raises:
+            Exception: thrown with msg starting with 'Invalid equation' when a line cannot be parsed
+            Exception: thrown with msg 'All planes in the system should live in the same dimension'
+                       when there are no equations or they are not in the same dimension"""
+        sparse = self.backend == LinearSystem.SPARSE_BACKEND
+        if self.dimension is None and self.format == self.TEXT_FORMAT:
+            parsed = [p for p in (self.parse_equation(line) for line in lines) if p is not None]
+            dimension = max([max(terms) + 1 for terms, _ in parsed if terms] or [0])
+            if not dimension:
+                raise Exception(LinearSystem.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+            planes = [self.to_hyperplane(self.to_row(terms, dimension, sparse), constant_term, dimension)
+                      for terms, constant_term in parsed]
+        else:
+            planes = [self.to_hyperplane(row, constant_term, dimension)
+                      for dimension, row, constant_term in self.rows_in_dimension(lines)]
+
+        if not planes:
+            raise Exception(LinearSystem.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+        return LinearSystem(planes, pivoting=self.pivoting, backend=self.backend)
+
+    def parse_file(self, path):
+        """Returns a LinearSystem of the equations of the file at path, read line by line, see parse."""
+        with open(path) as f:
+            return self.parse(f)
+
+    def to_hyperplane(self, coefficients, constant_term, dimension):
+        """Returns a Hyperplane with normal vector of the backend of the parser,
+        coefficients are a row returned by to_row."""
+        backend = self.backend
+        if backend == LinearSystem.SPARSE_BACKEND:
+            normal_vector = SparseVector.from_entries(coefficients, dimension)
+        elif backend == LinearSystem.FLOAT64_BACKEND:
+            normal_vector = FloatVector(coefficients)
+        else:
+            normal_vector = LinearSystem.MATRIX_CLASSES[backend].vector_class.from_decimals(tuple(coefficients))
+        return Hyperplane(normal_vector=normal_vector, constant_term=constant_term)
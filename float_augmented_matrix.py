@@ -0,0 +1,300 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
+from float_vector import FloatVector
+from augmented_matrix import AugmentedMatrix
+from lu_factorization import FloatLUFactorization
+
+
+class FloatAugmentedMatrix(AugmentedMatrix):
+
+    ZERO_TOLERANCE = 1e-10
+    ZERO = 0.0
+    ONE = 1.0
+    BLOCK_SIZE = 64
+    BLOCKED_MIN_ROWS = 2 * BLOCK_SIZE
+
+    backend = 'float64'
+    vector_class = FloatVector
+    factorization_class = FloatLUFactorization
+
+    def __init__(self, rows, constants, dimension, leading_indices=None, pivoting=AugmentedMatrix.NO_PIVOTING):
+        """Initialize FloatAugmentedMatrix object.
+
+        Same as AugmentedMatrix, but rows are stored in a float64 numpy array of shape
+        (num of equations, dimension) and elimination updates whole blocks of rows at once.
+
+        Raises:
+            Exception: thrown with msg 'The float64 backend requires numpy' when numpy is not installed"""
+        if numpy is None:
+            raise Exception(FloatVector.NUMPY_REQUIRED_MSG)
+
+        rows = numpy.array(rows, dtype=numpy.float64).reshape(len(constants), dimension)
+        constants = numpy.array(constants, dtype=numpy.float64)
+        AugmentedMatrix.__init__(self, rows, constants, dimension, leading_indices, pivoting)
+
+    @classmethod
+    def from_planes(cls, planes, dimension, leading_indices=None, pivoting=AugmentedMatrix.NO_PIVOTING):
+        """Returns a new FloatAugmentedMatrix holding coefficients of planes."""
+        rows = [p.normal_vector.coordinates for p in planes]
+        constants = [p.constant_term for p in planes]
+        if leading_indices is not None:
+            leading_indices = list(leading_indices)
+        return cls(rows, constants, dimension, leading_indices, pivoting)
+
+    def restore_column_order(self):
+        """Undo column exchanges made by complete pivoting."""
+        order = self.column_order
+        if order == list(range(self.dimension)):
+            return
+
+        restored = numpy.empty_like(self.rows)
+        restored[:, order] = self.rows
+        self.rows = restored
+
+        self.column_order = list(range(self.dimension))
+        self.leading_indices = [self.first_nonzero_index(row) for row in self.rows]
+
+    def swap_rows(self, row1, row2):
+        """Swap rows in equations."""
+        self.rows[[row1, row2]] = self.rows[[row2, row1]]
+        self.constants[[row1, row2]] = self.constants[[row2, row1]]
+        indices = self.leading_indices
+        indices[row1], indices[row2] = indices[row2], indices[row1]
+        order = self.row_order
+        order[row1], order[row2] = order[row2], order[row1]
+        scales = self.row_scales
+        if scales is not None:
+            scales[row1], scales[row2] = scales[row2], scales[row1]
+        if self.lower is not None:
+            self.lower[[row1, row2]] = self.lower[[row2, row1]]
+        if self.stats is not None:
+            self.stats.count_row_swap()
+
+    def append_row(self, coefficients, constant_term):
+        """Append an equation at the bottom, returns its row."""
+        row = len(self.rows)
+        self.rows = numpy.vstack([self.rows, numpy.asarray(coefficients, dtype=numpy.float64)])
+        self.constants = numpy.append(self.constants, float(constant_term))
+        self.leading_indices.append(self.first_nonzero_index(self.rows[row]))
+        self.row_order.append(row)
+        return row
+
+    def pop_row(self):
+        """Remove the equation at the bottom."""
+        self.rows = self.rows[:-1]
+        self.constants = self.constants[:-1]
+        self.leading_indices.pop()
+        self.row_order.pop()
+
+    def mutable_row(self, row):
+        """Returns row as a view that can be updated in place, rows are copied into an array up front."""
+        return self.rows[row]
+
+    def swap_columns(self, col1, col2):
+        """Swap coefficients of two variables in every equation, remembering the exchange in column_order."""
+        self.rows[:, [col1, col2]] = self.rows[:, [col2, col1]]
+        order = self.column_order
+        order[col1], order[col2] = order[col2], order[col1]
+
+        low = min(col1, col2)
+        indices = self.leading_indices
+        for i, index in enumerate(indices):
+            if index >= low:
+                indices[i] = self.first_nonzero_index(self.rows[i], low)
+
+    def multiply_coefficient_and_row(self, coefficient, row, start=0):
+        """Multiply a row with coefficient in equations, see AugmentedMatrix.multiply_coefficient_and_row."""
+        coefficient = float(coefficient)
+        self.rows[row, start:] *= coefficient
+        self.constants[row] *= coefficient
+        self.update_leading_index(row, start)
+        if self.stats is not None:
+            self.stats.count_row_scalings(1, self.dimension - start + 1)
+
+    def add_multiple_times_row_to_row(self, coefficient, row_to_add, row_to_be_added_to, start=0):
+        """Multiply a row_to_add with coefficient and add it to row_to_be_added_to in equations,
+        see AugmentedMatrix.add_multiple_times_row_to_row."""
+        coefficient = float(coefficient)
+        self.rows[row_to_be_added_to, start:] += coefficient * self.rows[row_to_add, start:]
+        self.constants[row_to_be_added_to] += coefficient * self.constants[row_to_add]
+        self.update_leading_index(row_to_be_added_to, start)
+        if self.stats is not None:
+            self.stats.count_row_additions(1, self.dimension - start + 1)
+
+    def find_complete_pivot(self, row, col):
+        """Returns (row, column) of largest coefficient at or below row and right of col, (-1, -1) if all are zero."""
+        block = numpy.abs(self.rows[row:, col:])
+        if block.size == 0:
+            return -1, -1
+
+        j, k = numpy.unravel_index(numpy.argmax(block), block.shape)
+        if block[j, k] < self.ZERO_TOLERANCE:
+            return -1, -1
+        return row + int(j), col + int(k)
+
+    def clear_coefficients_below(self, row, col):
+        """Eliminate the coefficients in column col underneath row, row must hold the pivot of col."""
+        rows = self.rows
+        below = slice(row + 1, len(rows))
+        factors = rows[below, col] / rows[row, col]
+        if self.lower is not None:
+            self.lower[below, row] = factors
+
+        rows[below, col + 1:] -= numpy.outer(factors, rows[row, col + 1:])
+        rows[below, col] = 0.0
+        self.constants[below] -= factors * self.constants[row]
+        if self.stats is not None:
+            self.stats.count_row_additions(len(factors), self.dimension - col)
+
+        # every row below is cleared up to column col, look their leading terms up from there
+        self.leading_indices[below] = self.leading_indices_from(rows[below], col + 1)
+
+    def compute_triangular_form(self):
+        """Reduce self to triangular form in place.
+
+        Systems of at least BLOCKED_MIN_ROWS equations are reduced by blocked elimination,
+        unless pivoting is complete: columns are taken BLOCK_SIZE at a time (a panel), the
+        panel is reduced column by column as usual, but rows below it are updated right of
+        it only once per panel, by a single matrix product instead of one outer product per
+        column. With threads > 1 the product is split by rows across a thread pool, numpy
+        releases the GIL while it runs. Pivots are chosen as by column by column elimination.
+        BLOCKED_MIN_ROWS may be set on an instance to change the threshold of that matrix only."""
+        num_equations = len(self.rows)
+        if self.pivoting == self.COMPLETE_PIVOTING or num_equations < self.BLOCKED_MIN_ROWS:
+            AugmentedMatrix.compute_triangular_form(self)
+            return
+
+        if self.pivoting == self.SCALED_PARTIAL_PIVOTING:
+            self.row_scales = numpy.abs(self.rows).max(axis=1).tolist()
+
+        executor = None
+        if self.threads > 1 and ThreadPoolExecutor is not None:
+            executor = ThreadPoolExecutor(max_workers=self.threads)
+        try:
+            row = 0
+            for start in range(0, self.dimension, self.BLOCK_SIZE):
+                if row >= num_equations:
+                    break
+                end = min(start + self.BLOCK_SIZE, self.dimension)
+                factors = numpy.zeros((num_equations, end - start))
+                panel_row = row
+                row = self.reduce_panel(row, start, end, factors)
+                self.update_rows_right_of_panel(panel_row, row, end, factors[:, :row - panel_row], executor)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.row_scales = None
+
+    def reduce_panel(self, row, start, end, factors):
+        """Reduce columns start to end of rows at or below row, returns row after the last pivot row.
+
+        Coefficients right of the panel are left as they are, factors[i][k] records the multiple
+        of the k-th pivot row of the panel subtracted from row i, see update_rows_right_of_panel."""
+        rows = self.rows
+        constants = self.constants
+        num_equations = len(rows)
+        panel_row = row
+        for col in range(start, end):
+            if row >= num_equations:
+                break
+
+            pivot_row = self.find_pivot_row(row, col)
+            if pivot_row < 0:
+                continue
+            if pivot_row != row:
+                self.swap_rows(row, pivot_row)
+                factors[[row, pivot_row]] = factors[[pivot_row, row]]
+            if self.stats is not None:
+                self.stats.record_pivot(rows[row, col])
+
+            below = slice(row + 1, num_equations)
+            column = rows[below, col] / rows[row, col]
+            if self.lower is not None:
+                self.lower[below, row] = column
+            factors[below, row - panel_row] = column
+
+            rows[below, col + 1:end] -= numpy.outer(column, rows[row, col + 1:end])
+            rows[below, col] = 0.0
+            constants[below] -= column * constants[row]
+            if self.stats is not None:
+                self.stats.count_row_additions(len(column), self.dimension - col)
+
+            # leading terms right of the panel are not known until those coefficients are updated
+            self.leading_indices[below] = self.leading_indices_from(rows[below, :end], col + 1)
+            row += 1
+        return row
+
+    def update_rows_right_of_panel(self, panel_row, row, end, factors, executor=None):
+        """Apply the row additions made by reduce_panel to the coefficients right of column end.
+
+        Pivot rows panel_row to row are updated one after another, since each one depends on
+        the pivot rows above it, then every row below them at once by a matrix product,
+        split across executor when there is one."""
+        rows = self.rows
+        num_equations = len(rows)
+        if row == panel_row or end >= self.dimension:
+            return
+
+        upper = rows[panel_row:row, end:]
+        for k in range(1, row - panel_row):
+            upper[k] -= factors[panel_row + k, :k].dot(upper[:k])
+        if row >= num_equations:
+            return
+
+        def update(chunk):
+            rows[chunk, end:] -= factors[chunk].dot(upper)
+
+        if executor is None:
+            update(slice(row, num_equations))
+        else:
+            size = -(-(num_equations - row) // self.threads)
+            chunks = [slice(i, min(i + size, num_equations)) for i in range(row, num_equations, size)]
+            list(executor.map(update, chunks))
+
+        self.leading_indices[row:] = self.leading_indices_from(rows[row:], end)
+
+    def compute_lu_factorization(self):
+        """Reduce self to triangular form in place recording the multipliers used,
+        see AugmentedMatrix.compute_lu_factorization."""
+        num_equations = len(self.rows)
+        self.lower = numpy.zeros((num_equations, num_equations))
+        self.compute_triangular_form()
+        return self.factorization_class(self)
+
+    def clear_coefficients_above(self, row, col):
+        """Eliminate the coefficients in column col above row, row must hold a pivot equal to 1."""
+        rows = self.rows
+        factors = rows[:row, col].copy()
+
+        rows[:row, col + 1:] -= numpy.outer(factors, rows[row, col + 1:])
+        rows[:row, col] = 0.0
+        self.constants[:row] -= factors * self.constants[row]
+        if self.stats is not None:
+            self.stats.count_row_additions(row, self.dimension - col)
+
+    def leading_indices_from(self, rows, start):
+        """Returns indices of first nonzero terms at or after column start for each of rows."""
+        if start >= rows.shape[1]:
+            return [-1] * len(rows)
+
+        nonzero = numpy.abs(rows[:, start:]) >= self.ZERO_TOLERANCE
+        found = nonzero.any(axis=1)
+        first = nonzero.argmax(axis=1) + start
+        return [int(k) if f else -1 for k, f in zip(first, found)]
+
+    @staticmethod
+    def first_nonzero_index(row, start=0):
+        """Returns index of first nonzero term in row from column start, -1 if there is none."""
+        nonzero = numpy.flatnonzero(numpy.abs(row[start:]) >= FloatAugmentedMatrix.ZERO_TOLERANCE)
+        if len(nonzero) == 0:
+            return -1
+        return start + int(nonzero[0])
@@ -0,0 +1,122 @@
+from math import pi
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from vector import Vector
+
+
+class FloatVector(Vector):
+
+    NUMPY_REQUIRED_MSG = 'The float64 backend requires numpy'
+
+    backend = 'float64'
+
+    __slots__ = ()
+
+    def __init__(self, coordinates):
+        """Initialize FloatVector object.
+
+        Same API as Vector, but coordinates are stored in a float64 numpy array and
+        every operation runs vectorized on hardware floats instead of on Decimals.
+
+        Raises:
+            Exception: thrown with msg 'The float64 backend requires numpy' when numpy is not installed
+            ValueError: thrown with msg 'The coordinates must be nonempty'
+            TypeError: thrown with msg 'The coordinates must be an iterable'"""
+        if numpy is None:
+            raise Exception(self.NUMPY_REQUIRED_MSG)
+
+        try:
+            if coordinates is None or len(coordinates) == 0:
+                raise ValueError
+            self.coordinates = numpy.array(coordinates, dtype=numpy.float64)
+            self.dimension = len(coordinates)
+
+        except ValueError:
+            raise ValueError('The coordinates must be nonempty')
+
+        except TypeError:
+            raise TypeError('The coordinates must be an iterable')
+
+    @staticmethod
+    def to_scalar(x):
+        """Returns x converted to the scalar type of this backend."""
+        return float(x)
+
+    def coordinate_list(self):
+        """Returns coordinates as a list of floats, zeros included."""
+        return self.coordinates.tolist()
+
+    def nonzero_terms(self):
+        """Returns (index, coordinate) of nonzero coordinates as a list, in order of index."""
+        indices = numpy.flatnonzero(self.coordinates)
+        return list(zip(indices.tolist(), self.coordinates[indices].tolist()))
+
+    def magnitude(self):
+        """Returns a float with value of magnitude."""
+        return float(numpy.sqrt(numpy.dot(self.coordinates, self.coordinates)))
+
+    def normalized(self):
+        """Returns a normalized FloatVector of self.
+
+                Raises:
+                    Exception: Throws with msg 'Cannot normalize the zero vector'
+                               when call this func on a zero vector
+                """
+        magnitude = self.magnitude()
+        if magnitude == 0:
+            raise Exception(self.CANNOT_NORMALIZE_ZERO_VECTOR_MSG)
+        return FloatVector(self.coordinates / magnitude)
+
+    def times_scalar(self, c):
+        """Returns a new FloatVector with value of c times scalar self."""
+        return FloatVector(self.coordinates * float(c))
+
+    def plus(self, v):
+        """Returns a new FloatVector with value of v plus self."""
+        return FloatVector(self.coordinates + numpy.asarray(v.coordinates, dtype=numpy.float64))
+
+    def minus(self, v):
+        """Returns a new FloatVector with value of self minus v."""
+        return FloatVector(self.coordinates - numpy.asarray(v.coordinates, dtype=numpy.float64))
+
+    def dot(self, v):
+        """Returns a float with value of dot product of v and self."""
+        return float(numpy.dot(self.coordinates, numpy.asarray(v.coordinates, dtype=numpy.float64)))
+
+    def angle_with(self, v, in_degrees=False):
+        """Returns angle between v and self, see Vector.angle_with."""
+        try:
+            u1 = self.normalized()
+            u2 = FloatVector(v.coordinates).normalized()
+            angle_in_radians = float(numpy.arccos(numpy.clip(u1.dot(u2), -1.0, 1.0)))
+
+            if in_degrees:
+                return angle_in_radians * 180.0 / pi
+            else:
+                return angle_in_radians
+
+        except Exception as e:
+            if str(e) == self.CANNOT_NORMALIZE_ZERO_VECTOR_MSG:
+                raise Exception(self.CANNOT_COMPUTE_ANGLE_WITH_ZERO_VECTOR_MSG)
+            else:
+                raise e
+
+    def area_of_triangle_with(self, v):
+        """Returns area of triangle made up of self and v."""
+        return self.area_of_parallelogram_with(v) / 2.0
+
+    def cross(self, v):
+        """Returns cross product of self and v, see Vector.cross."""
+        if self.dimension not in (2, 3) or v.dimension != self.dimension:
+            raise Exception(self.ONLY_DEFINED_IN_TWO_THREE_DIMS_MSG)
+
+        a = self.coordinates
+        b = numpy.asarray(v.coordinates, dtype=numpy.float64)
+        if self.dimension == 2:
+            a = numpy.append(a, 0.0)
+            b = numpy.append(b, 0.0)
+        return FloatVector(numpy.cross(a, b))
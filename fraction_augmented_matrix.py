@@ -0,0 +1,154 @@
+from fractions import Fraction
+
+from fraction_vector import FractionVector
+from augmented_matrix import AugmentedMatrix
+from lu_factorization import FractionLUFactorization
+from solver_stats import SolverStats, timed
+
+try:
+    from math import gcd
+except ImportError:
+    from fractions import gcd
+
+
+class FractionAugmentedMatrix(AugmentedMatrix):
+
+    ZERO_TOLERANCE = Fraction(0)
+    ZERO = Fraction(0)
+    ONE = Fraction(1)
+
+    backend = 'fraction'
+    vector_class = FractionVector
+    factorization_class = FractionLUFactorization
+
+    def __init__(self, rows, constants, dimension, leading_indices=None, pivoting=AugmentedMatrix.NO_PIVOTING):
+        """Initialize FractionAugmentedMatrix object.
+
+        Same as AugmentedMatrix, but coefficients are exact Fractions and only
+        coefficients that are exactly zero count as zero, so rank never depends
+        on a tolerance.
+
+        compute_triangular_form and compute_rref run fraction-free Bareiss elimination:
+        each equation is scaled to integers once and every update
+            a[i][j] = (pivot * a[i][j] - a[i][col] * a[row][j]) / previous pivot
+        divides exactly, keeping entries as bounded as minors of the coefficients
+        and avoiding the gcd of every Fraction operation. Pivots are exact, so
+        the first nonzero coefficient of a column is taken whatever pivoting is.
+        compute_lu_factorization eliminates in Fractions to record the multipliers."""
+        AugmentedMatrix.__init__(self, rows, constants, dimension, leading_indices, pivoting)
+
+    @classmethod
+    def from_planes(cls, planes, dimension, leading_indices=None, pivoting=AugmentedMatrix.NO_PIVOTING):
+        """Returns a new FractionAugmentedMatrix holding coefficients of planes, see AugmentedMatrix.from_planes.
+
+        leading_indices found with a tolerance may be wrong for exact coefficients, they are looked up again."""
+        return super(FractionAugmentedMatrix, cls).from_planes(planes, dimension, None, pivoting)
+
+    def compute_triangular_form(self):
+        """Reduce self to triangular form in place by fraction-free Bareiss elimination."""
+        self.bareiss_eliminate(reduce_above=False)
+
+    def compute_rref(self):
+        """Reduce self to reduced row-echelon form in place by fraction-free Gauss-Jordan elimination.
+
+        Rows above each pivot are updated by the same exact formula, at the end every
+        pivot row is divided once by its pivot. Both happen in one pass, so stats time
+        the pass as triangular form and the divisions as back substitution."""
+        with timed(self.stats, SolverStats.TRIANGULAR_FORM):
+            self.bareiss_eliminate(reduce_above=True)
+
+        with timed(self.stats, SolverStats.BACK_SUBSTITUTION):
+            for i, col in enumerate(self.leading_indices):
+                if col < 0:
+                    continue
+                row = self.mutable_row(i)
+                pivot = row[col]
+                if pivot != self.ONE:
+                    row[col:] = [x / pivot for x in row[col:]]
+                    self.constants[i] /= pivot
+                    if self.stats is not None:
+                        self.stats.count_row_scalings(1, len(row) - col + 1)
+
+    def compute_lu_factorization(self):
+        """Reduce self to triangular form in place recording the multipliers used,
+        see AugmentedMatrix.compute_lu_factorization.
+
+        Bareiss rows are scaled by previous pivots, so plain Fraction elimination is
+        used instead to keep L and U the factors of the coefficients."""
+        num_equations = len(self.rows)
+        self.lower = [[self.ZERO] * num_equations for _ in range(num_equations)]
+        AugmentedMatrix.compute_triangular_form(self)
+        return self.factorization_class(self)
+
+    def bareiss_eliminate(self, reduce_above):
+        """Run Bareiss elimination in place below pivots, and above them if reduce_above."""
+        num_equations = len(self.rows)
+        self.scale_rows_to_integers()
+        rows = self.rows
+        constants = self.constants
+        stats = self.stats
+
+        previous = 1
+        row = 0
+        for col in range(self.dimension):
+            if row >= num_equations:
+                break
+
+            pivot_row = next((j for j in range(row, num_equations) if rows[j][col]), -1)
+            if pivot_row < 0:
+                continue
+            if pivot_row != row:
+                self.swap_rows(row, pivot_row)
+
+            source = rows[row]
+            pivot = source[col]
+            k = constants[row]
+            if stats is not None:
+                stats.record_pivot(pivot)
+            targets = range(num_equations) if reduce_above else range(row + 1, num_equations)
+            for j in targets:
+                if j == row:
+                    continue
+                target = rows[j]
+                c = target[col]
+                # every row is scaled by pivot / previous, the division is exact,
+                # rows above keep their own pivots left of col
+                start = 0 if j < row else col
+                target[start:] = [(pivot * y - c * x) // previous for x, y in zip(source[start:], target[start:])]
+                constants[j] = (pivot * constants[j] - c * k) // previous
+                if stats is not None:
+                    # two products, a difference and a division per term
+                    stats.count_row_additions(1, len(target) - start + 1, operations_per_term=4)
+
+            previous = pivot
+            row += 1
+
+        self.rows = [[Fraction(x) for x in r] for r in rows]
+        self.constants = [Fraction(k) for k in constants]
+        self.leading_indices = [self.first_nonzero_index(r) for r in self.rows]
+
+    def scale_rows_to_integers(self):
+        """Multiply every equation by the least common multiple of its denominators,
+        rows and constants become lists of ints."""
+        for i in range(len(self.rows)):
+            row = self.mutable_row(i)
+            multiple = 1
+            for x in row + [self.constants[i]]:
+                d = x.denominator
+                multiple = multiple * d // gcd(multiple, d)
+            self.rows[i] = [int(x * multiple) for x in row]
+            self.constants[i] = int(self.constants[i] * multiple)
+
+    def raise_exception_if_contradictory_equation(self):
+        """Raise exception with msg 'No solutions' when contradictory equation is found."""
+        for i, k in enumerate(self.constants):
+            if self.leading_indices[i] < 0 and k:
+                raise Exception(self.NO_SOLUTIONS_MSG)
+
+    @staticmethod
+    def first_nonzero_index(row, start=0):
+        """Returns index of first term in row from column start that is exactly nonzero, -1 if there is none."""
+        for k in range(start, len(row)):
+            if row[k]:
+                return k
+        return -1
@@ -0,0 +1,66 @@
+from fractions import Fraction
+
+from vector import Vector
+
+
+class FractionVector(Vector):
+
+    backend = 'fraction'
+
+    __slots__ = ()
+
+    def __init__(self, coordinates):
+        """Initialize FractionVector object.
+
+        Same API as Vector, but coordinates are stored as exact Fractions, so
+        arithmetic never rounds. Decimal, int, float and str coordinates are
+        converted exactly, e.g. '0.1' -> 1/10.
+
+        Raises:
+            ValueError: thrown with msg 'The coordinates must be nonempty'
+            TypeError: thrown with msg 'The coordinates must be an iterable'"""
+        try:
+            if not coordinates:
+                raise ValueError
+            self.coordinates = tuple([Fraction(x) for x in coordinates])
+            self.dimension = len(coordinates)
+
+        except ValueError:
+            raise ValueError('The coordinates must be nonempty')
+
+        except TypeError:
+            raise TypeError('The coordinates must be an iterable')
+
+    @staticmethod
+    def to_scalar(x):
+        """Returns x converted to the scalar type of this backend."""
+        return Fraction(x)
+
+    def times_scalar(self, c):
+        """Returns a new FractionVector with value of c times scalar self."""
+        c = Fraction(c)
+        return FractionVector.from_decimals(tuple([c * x for x in self.coordinates]))
+
+    def plus(self, v):
+        """Returns a new FractionVector with value of v plus self."""
+        return FractionVector.from_decimals(tuple([x + Fraction(y) for x, y in zip(self.coordinates, v.coordinates)]))
+
+    def minus(self, v):
+        """Returns a new FractionVector with value of self minus v."""
+        return FractionVector.from_decimals(tuple([x - Fraction(y) for x, y in zip(self.coordinates, v.coordinates)]))
+
+    def dot(self, v):
+        """Returns a Fraction with value of dot product of v and self."""
+        return sum([x * Fraction(y) for x, y in zip(self.coordinates, v.coordinates)])
+
+    def cross(self, v):
+        """Returns cross product of self and v, see Vector.cross."""
+        if self.dimension not in (2, 3) or v.dimension != self.dimension:
+            raise Exception(self.ONLY_DEFINED_IN_TWO_THREE_DIMS_MSG)
+
+        zero = Fraction(0)
+        x_1, y_1, z_1 = (self.coordinates + (zero,))[:3]
+        x_2, y_2, z_2 = (tuple([Fraction(y) for y in v.coordinates]) + (zero,))[:3]
+        return FractionVector([y_1 * z_2 - y_2 * z_1,
+                               -(x_1 * z_2 - x_2 * z_1),
+                               x_1 * y_2 - x_2 * y_1])
@@ -1,12 +1,18 @@
 from decimal import Decimal, getcontext
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
 from vector import Vector
-from util import MyDecimal
+from util import is_near_zero, normalized_terms, quantize_all, write_equation
 
 getcontext().prec = 30
 
 
 class Hyperplane(object):
 
+    NUM_DECIMAL_PLACES = 3
     NO_NONZERO_ELTS_FOUND_MSG = 'No nonzero elements found'
     EITHER_DIM_OR_NORMAL_VEC_MUST_BE_PROVIDED_MSG = (
         'Either the dimension of the hyperplane or the normal vector '
@@ -38,9 +44,22 @@ class Hyperplane(object):
 
         if not constant_term:
             constant_term = Decimal('0')
-        self.constant_term = Decimal(constant_term)
+        self.constant_term = normal_vector.to_scalar(constant_term)
+
+        self._basepoint = None
+        self._has_basepoint = False
 
-        self.set_basepoint()
+    @property
+    def basepoint(self):
+        """Returns base point of self, computed by set_basepoint on first access."""
+        if not self._has_basepoint:
+            self.set_basepoint()
+        return self._basepoint
+
+    @basepoint.setter
+    def basepoint(self, basepoint):
+        self._basepoint = basepoint
+        self._has_basepoint = True
 
     def set_basepoint(self):
         """Compute and set base point of self.
@@ -61,7 +80,7 @@ class Hyperplane(object):
             initial_coefficient = n[initial_index]
 
             basepoint_coords[initial_index] = c/initial_coefficient
-            self.basepoint = Vector(basepoint_coords)
+            self.basepoint = n.__class__(basepoint_coords)
 
         except Exception as e:
             if str(e) == Hyperplane.NO_NONZERO_ELTS_FOUND_MSG:
@@ -69,6 +88,21 @@ class Hyperplane(object):
             else:
                 raise e
 
+    def normalized_terms(self):
+        """Returns coefficients followed by the constant term, all divided by the first nonzero coefficient,
+        or as they are if the normal vector is zero, see util.normalized_terms."""
+        return normalized_terms(self.normal_vector, self.constant_term)
+
+    def canonical_form(self):
+        """Returns normalized_terms rounded to Vector.EQUALITY_PRECISION, as a tuple of Decimals.
+
+        Equations are equal when they are in the same dimension and have the same canonical form,
+        which is also what they are hashed by, so equations that are a multiple of each other are
+        equal and fall in the same bucket of sets and dicts. self may be any plane-like object."""
+        to_decimal = Vector.to_scalar
+        terms = normalized_terms(self.normal_vector, self.constant_term)
+        return quantize_all([to_decimal(x) for x in terms], Vector.EQUALITY_PRECISION)
+
     def is_parallel_to(self, p):
         """Returns whether self is parallel to p."""
         n1 = self.normal_vector
@@ -77,74 +111,28 @@ class Hyperplane(object):
         return n1.is_parallel_to(n2)
 
     def __eq__(self, p):
-
-        if self.normal_vector.is_zero():
-            if not p.normal_vector.is_zero():
-                return False
-            else:
-                diff = self.constant_term - p.constant_term
-                return MyDecimal(diff).is_near_zero()
-        elif p.normal_vector.is_zero():
-            return False
-
-        if not self.is_parallel_to(p):
+        if p.dimension != self.dimension:
             return False
+        return self.canonical_form() == Hyperplane.canonical_form(p)
 
-        x0 = self.basepoint
-        y0 = p.basepoint
-        basepoint_difference = x0.minus(y0)
+    def __ne__(self, p):
+        return not self == p
 
-        n = self.normal_vector
-        return basepoint_difference.is_orthogonal_to(n)
+    def __hash__(self):
+        return hash(self.canonical_form())
 
     def __str__(self):
+        output = StringIO()
+        self.write(output)
+        return output.getvalue()
 
-        num_decimal_places = 3
-
-        def write_coefficient(coefficient, is_initial_term=False):
-            coefficient = round(coefficient, num_decimal_places)
-            if coefficient % 1 == 0:
-                coefficient = int(coefficient)
-
-            output = ''
-
-            if coefficient < 0:
-                output += '-'
-            if coefficient > 0 and not is_initial_term:
-                output += '+'
-
-            if not is_initial_term:
-                output += ' '
-
-            if abs(coefficient) != 1:
-                output += '{}'.format(abs(coefficient))
-
-            return output
-
-        n = self.normal_vector
-
-        try:
-            initial_index = Hyperplane.first_nonzero_index(n)
-            terms = [write_coefficient(n[i], is_initial_term=(i==initial_index)) + 'x_{}'.format(i+1)
-                     for i in range(self.dimension) if round(n[i], num_decimal_places) != 0]
-            output = ' '.join(terms)
-
-        except Exception as e:
-            if str(e) == self.NO_NONZERO_ELTS_FOUND_MSG:
-                output = '0'
-            else:
-                raise e
-
-        constant = round(self.constant_term, num_decimal_places)
-        if constant % 1 == 0:
-            constant = int(constant)
-        output += ' = {}'.format(constant)
-
-        return output
+    def write(self, stream):
+        """Write current equation to stream, a file-like object, as __str__ returns it, see write_equation."""
+        write_equation(stream, self.normal_vector, self.constant_term, self.NUM_DECIMAL_PLACES)
 
     @staticmethod
     def first_nonzero_index(iterable):
         for k, item in enumerate(iterable):
-            if not MyDecimal(item).is_near_zero():
+            if not is_near_zero(item):
                 return k
         raise Exception(Hyperplane.NO_NONZERO_ELTS_FOUND_MSG)
\ No newline at end of file
@@ -1,10 +1,20 @@
-from decimal import Decimal, getcontext
-from copy import deepcopy
+from decimal import getcontext
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
 
-from vector import Vector
 from plane import Plane
 from parametrization import Parametrization
-from util import MyDecimal
+from echelon_basis import EchelonBasis
+from solution_cache import SolutionCache
+from solver_stats import SolverStats, timed
+from system_file import SystemFile
+from util import is_zero, write_equation
+from augmented_matrix import AugmentedMatrix
+from float_augmented_matrix import FloatAugmentedMatrix
+from sparse_augmented_matrix import SparseAugmentedMatrix
+from fraction_augmented_matrix import FractionAugmentedMatrix
 
 getcontext().prec = 30
 
@@ -13,23 +23,77 @@ class LinearSystem(object):
 
     ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG = 'All planes in the system should live in the same dimension'
     NO_SOLUTIONS_MSG = 'No solutions'
-
-    def __init__(self, planes):
+    UNKNOWN_PIVOTING_STRATEGY_MSG = AugmentedMatrix.UNKNOWN_PIVOTING_STRATEGY_MSG
+    UNKNOWN_BACKEND_MSG = 'Unknown numeric backend'
+
+    DECIMAL_BACKEND = AugmentedMatrix.backend
+    FLOAT64_BACKEND = FloatAugmentedMatrix.backend
+    SPARSE_BACKEND = SparseAugmentedMatrix.backend
+    FRACTION_BACKEND = FractionAugmentedMatrix.backend
+    MATRIX_CLASSES = {DECIMAL_BACKEND: AugmentedMatrix,
+                      FLOAT64_BACKEND: FloatAugmentedMatrix,
+                      SPARSE_BACKEND: SparseAugmentedMatrix,
+                      FRACTION_BACKEND: FractionAugmentedMatrix}
+
+    NO_PIVOTING = AugmentedMatrix.NO_PIVOTING
+    PARTIAL_PIVOTING = AugmentedMatrix.PARTIAL_PIVOTING
+    SCALED_PARTIAL_PIVOTING = AugmentedMatrix.SCALED_PARTIAL_PIVOTING
+    COMPLETE_PIVOTING = AugmentedMatrix.COMPLETE_PIVOTING
+
+    def __init__(self, planes, pivoting=NO_PIVOTING, backend=None, stats=None, threads=1):
         """Initialize LinearSystem object.
 
         Args:
             planes: linear equations to build linear system.
+            pivoting: pivoting strategy used by gaussian elimination, one of
+                      NO_PIVOTING (default), PARTIAL_PIVOTING, SCALED_PARTIAL_PIVOTING, COMPLETE_PIVOTING.
+                      With COMPLETE_PIVOTING the pivot variables are chosen by magnitude, so
+                      compute_triangular_form and compute_rref return rows that are reduced with
+                      respect to those variables rather than to their leading terms,
+                      use compute_solution to parametrize them.
+            backend: numeric backend used by gaussian elimination,
+                     DECIMAL_BACKEND -> Decimal arithmetic
+                     FLOAT64_BACKEND -> vectorized float64 arithmetic on numpy arrays
+                     SPARSE_BACKEND -> Decimal arithmetic on nonzero coefficients only, pivots are
+                                       chosen by Markowitz ordering to limit fill-in, see SparseAugmentedMatrix
+                     FRACTION_BACKEND -> exact Fraction arithmetic by fraction-free Bareiss elimination,
+                                         rank and solutions are exact, see FractionAugmentedMatrix
+                     None -> backend of the normal vector of the first plane (default)
+            stats: SolverStats recording row operations, pivots and time spent per phase by every
+                   solve of current linear system, None for no instrumentation (default).
+            threads: num of threads updating rows during blocked elimination of large systems
+                     on FLOAT64_BACKEND, see FloatAugmentedMatrix.compute_triangular_form (default 1).
 
         Raises:
             Exception: thrown with msg 'All planes in the system should live in the same dimension'
-                       when planes are not in same dimension"""
+                       when planes are not in same dimension
+            Exception: thrown with msg 'Unknown pivoting strategy' when pivoting is not supported
+            Exception: thrown with msg 'Unknown numeric backend' when backend is not supported"""
+        if pivoting not in AugmentedMatrix.PIVOTING_STRATEGIES:
+            raise Exception(self.UNKNOWN_PIVOTING_STRATEGY_MSG)
+        self.pivoting = pivoting
+
+        if backend is None:
+            backend = planes[0].normal_vector.backend
+        if backend not in self.MATRIX_CLASSES:
+            raise Exception(self.UNKNOWN_BACKEND_MSG)
+        self.backend = backend
+        self.stats = stats
+        self.threads = threads
+
         try:
-            d = planes[0].dimension
-            for p in planes:
-                assert p.dimension == d
+            if isinstance(planes, SystemFile):
+                # every equation of a file has its dimension, so they are not decoded to check it
+                d = planes.dimension
+            else:
+                d = planes[0].dimension
+                for p in planes:
+                    assert p.dimension == d
 
             self.planes = planes
             self.dimension = d
+            self._leading_indices = None
+            self._basis = None
 
         except AssertionError:
             raise Exception(self.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
@@ -63,80 +127,122 @@ class LinearSystem(object):
                                          constant_term=new_constant_term)
 
     def indices_of_first_nonzero_terms_in_each_row(self):
-        """Returns indices of first nonzero terms in each row."""
-        num_equations = len(self)
-        num_variables = self.dimension
+        """Returns indices of first nonzero terms in each row.
+
+        Indices are computed once and then kept up to date by row assignment,
+        systems returned by compute_triangular_form and compute_rref reuse the
+        indices tracked during elimination."""
+        if self._leading_indices is None:
+            self._leading_indices = [AugmentedMatrix.first_nonzero_index(p.normal_vector.coordinates)
+                                     for p in self.planes]
+        return list(self._leading_indices)
+
+    def to_augmented_matrix(self):
+        """Returns an AugmentedMatrix holding coefficients and constant terms of current linear system."""
+        matrix_class = self.MATRIX_CLASSES[self.backend]
+        planes = self.planes
+        if (isinstance(planes, SystemFile) and planes.dtype == SystemFile.FLOAT64_DTYPE and
+                self.backend == self.FLOAT64_BACKEND):
+            # the coefficient block of the file is copied at once instead of equation by equation
+            matrix = matrix_class(planes.coefficient_block(), planes.constants_column(), self.dimension,
+                                  None if self._leading_indices is None else list(self._leading_indices),
+                                  self.pivoting)
+        else:
+            matrix = matrix_class.from_planes(planes, self.dimension, self._leading_indices, self.pivoting)
+        matrix.stats = self.stats
+        matrix.threads = self.threads
+        return matrix
+
+    @staticmethod
+    def from_augmented_matrix(matrix):
+        """Returns a LinearSystem made up of rows of matrix, reusing its leading indices."""
+        system = LinearSystem(matrix.to_hyperplanes(), pivoting=matrix.pivoting, backend=matrix.backend)
+        system._leading_indices = matrix.indices_of_first_nonzero_terms_in_each_row()
+        return system
 
-        indices = [-1] * num_equations
+    def save(self, path):
+        """Write current linear system to path as a binary linear system file, see SystemFile."""
+        SystemFile.write(path, self.planes, self.dimension, self.backend, self.pivoting)
 
-        for i, p in enumerate(self.planes):
-            try:
-                indices[i] = p.first_nonzero_index(p.normal_vector)
-            except Exception as e:
-                if str(e) == Plane.NO_NONZERO_ELTS_FOUND_MSG:
-                    continue
-                else:
-                    raise e
+    @staticmethod
+    def load(path):
+        """Returns the LinearSystem of a file written by save.
 
-        return indices
+        The file is memory-mapped and only its header is read, equations are decoded
+        when they are accessed, see SystemFile.
 
-    def compute_triangular_form(self):
-        """Returns triangular form of current linear system."""
-        system = deepcopy(self)
-        num_equations = len(system)
-
-        for i in range(num_equations):
-            # check whether coefficient is zero, when it is, swap with a row below with none zero coefficient
-            indices = system.indices_of_first_nonzero_terms_in_each_row()
-            if indices[i] != i:
-                for j in range(i + 1, num_equations):
-                    if indices[j] == i:
-                        system.swap_rows(i, j)
-                        break
-
-            # eliminate the coefficient in column i underneath row i
-            for j in range(i + 1, num_equations):
-                c1 = system[i].normal_vector[i]
-                c2 = system[j].normal_vector[i]
-
-                coefficient = -c2 / c1
-                system.add_multiple_times_row_to_row(coefficient=coefficient,
-                                                     row_to_add=i,
-                                                     row_to_be_added_to=j)
-        return system
+        Raises:
+            Exception: thrown with msg 'Not a linear system file' when the file was not written by save"""
+        planes = SystemFile(path)
+        return LinearSystem(planes, pivoting=planes.pivoting, backend=planes.backend)
 
-    def compute_rref(self):
-        """Returns reduced row-echelon form of current linear system."""
-        tf = self.compute_triangular_form()
+    @staticmethod
+    def from_rows(rows, dimension=None, pivoting=NO_PIVOTING, backend=DECIMAL_BACKEND):
+        """Returns a LinearSystem equivalent to the equations of rows, in reduced row-echelon form.
 
-        num_equations = len(tf)
-        pivot_indices = tf.indices_of_first_nonzero_terms_in_each_row()
+        rows may be any iterable, for instance a generator reading a large file: each equation
+        is reduced as soon as it arrives against the equations kept so far (see EchelonBasis),
+        so only one equation per pivot variable is ever held in memory and no Hyperplane is
+        built for equations that turn out to be redundant.
 
-        for i in range(num_equations)[::-1]:
-            col = pivot_indices[i]
-            if col < 0:
-                continue
+        Args:
+            rows: iterable of (coefficients, constant_term) pairs, one per equation,
+                  the sparse backend also takes coefficients as a dict mapping index of variable to coefficient.
+            dimension: num of variables, taken from the first equation when None (default).
+            pivoting: pivoting strategy of the returned system, see LinearSystem.
+            backend: numeric backend used to reduce equations, see LinearSystem (default DECIMAL_BACKEND).
 
-            # scale to make coefficient equal 1
-            n = tf[i].normal_vector
-            times = Decimal('1.0') / n[col]
-            tf.multiply_coefficient_and_row(times, i)
+        Raises:
+            Exception: thrown with msg 'All planes in the system should live in the same dimension'
+                       when dimension is None and there are no rows, or rows are not in the same dimension
+            Exception: thrown with msg 'Unknown numeric backend' when backend is not supported"""
+        if backend not in LinearSystem.MATRIX_CLASSES:
+            raise Exception(LinearSystem.UNKNOWN_BACKEND_MSG)
+
+        rows = iter(rows)
+        basis = None
+        if dimension is None:
+            for coefficients, constant_term in rows:
+                basis = EchelonBasis(len(coefficients), LinearSystem.MATRIX_CLASSES[backend], pivoting)
+                basis.add(coefficients, constant_term)
+                break
+            else:
+                raise Exception(LinearSystem.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+        else:
+            basis = EchelonBasis(dimension, LinearSystem.MATRIX_CLASSES[backend], pivoting)
+        basis.extend(rows)
 
-            # clear coefficient above
-            for j in range(i):
-                c1 = tf[i].normal_vector[col]
-                c2 = tf[j].normal_vector[col]
+        matrix = basis.matrix
+        if not len(matrix.rows):
+            # every equation was '0 = 0', keep one so that the system knows its dimension
+            matrix.append_row([0] * matrix.dimension, 0)
+        return LinearSystem.from_augmented_matrix(matrix)
 
-                coefficient = -c2 / c1
-                tf.add_multiple_times_row_to_row(coefficient=coefficient,
-                                                 row_to_add=i,
-                                                 row_to_be_added_to=j)
+    def compute_triangular_form(self):
+        """Returns triangular form of current linear system."""
+        matrix = self.to_augmented_matrix()
+        with timed(self.stats, SolverStats.TRIANGULAR_FORM):
+            matrix.compute_triangular_form()
+        self.finish_solve()
+        return LinearSystem.from_augmented_matrix(matrix)
 
-        return tf
+    def compute_rref(self):
+        """Returns reduced row-echelon form of current linear system."""
+        matrix = self.to_augmented_matrix()
+        matrix.compute_rref()
+        self.finish_solve()
+        return LinearSystem.from_augmented_matrix(matrix)
 
-    def compute_solution(self):
+    def compute_solution(self, cache=None, deduplicate=False):
         """Returns parametrized solution of current linear system.
 
+                Args:
+                    cache: SolutionCache to look the solution up in and store it to, None to always
+                           solve (default). Systems with the same equations in any order and
+                           scaling share one cached result, see SolutionCache.
+                    deduplicate: whether to run remove_redundant_equations before gaussian elimination
+                                 (default False), worth it when many equations are multiples of others.
+
                 Returns:
                     One solution || Infinite solutions -> a parametrization object with parametrized solution
                     No solution -> "No solutions"
@@ -144,8 +250,12 @@ class LinearSystem(object):
                 Raises:
                     Exception: inner Exception whose msg is not 'No solutions'
                     """
+        if cache is not None:
+            return cache.solve(self, deduplicate)
+
         try:
-            return self.do_gaussian_elimination_and_parametrize_solution()
+            system = self.remove_redundant_equations() if deduplicate else self
+            return system.do_gaussian_elimination_and_parametrize_solution()
 
         except Exception as e:
             if str(e) == self.NO_SOLUTIONS_MSG:
@@ -153,67 +263,161 @@ class LinearSystem(object):
             else:
                 raise e
 
-    def do_gaussian_elimination_and_parametrize_solution(self):
-        """Returns parametrized solution after gaussian elimination is done."""
-        rref = self.compute_rref()
+    def remove_redundant_equations(self):
+        """Returns a LinearSystem without equations '0 = 0' and equations that are a multiple of an earlier one.
 
-        rref.raise_exception_if_contradictory_equation()
+        Each equation is hashed by its normalized coefficients (see SolutionCache.canonical_row),
+        so the pass takes expected O(num of equations * dimension) time. Equations with the
+        same normalized coefficients but a different constant term, and equations '0 = k',
+        are found to be contradictory without any elimination.
 
-        direction_vectors = rref.extract_direction_vectors_for_parametrization()
-        basepoint = rref.extract_basepoint_for_parametrization()
+                Raises:
+                    Exception: thrown with msg 'No solutions' when a contradictory equation or pair of equations is found
+                    """
+        constant_terms = {}
+        planes = []
+        for p in self.planes:
+            row = SolutionCache.canonical_row(p)
+            if row is None:
+                continue
 
-        return Parametrization(basepoint=basepoint, direction_vectors=direction_vectors)
+            coefficients = row[:-1]
+            constant_term = row[-1]
+            if coefficients not in constant_terms:
+                if not any(coefficients):
+                    raise Exception(self.NO_SOLUTIONS_MSG)
+                constant_terms[coefficients] = constant_term
+                planes.append(p)
+            elif not is_zero(constant_terms[coefficients] - constant_term):
+                raise Exception(self.NO_SOLUTIONS_MSG)
 
-    def extract_direction_vectors_for_parametrization(self):
-        """Returns direction vectors for parametrization."""
-        num_variables = self.dimension
-        pivot_indices = self.indices_of_first_nonzero_terms_in_each_row()
-        free_variable_indices = set(range(num_variables)) - set(pivot_indices)
+        if not planes:
+            # every equation was '0 = 0', keep one so that the system knows its dimension
+            planes = self.planes[:1]
+        return LinearSystem(planes, pivoting=self.pivoting, backend=self.backend, stats=self.stats,
+                            threads=self.threads)
 
-        direction_vectors = []
+    def solve_many(self, constant_terms):
+        """Returns parametrized solutions of current coefficients for many constant terms.
 
-        for free_var in free_variable_indices:
-            vector_coords = [0] * num_variables
-            vector_coords[free_var] = 1
-            for i, p in enumerate(self.planes):
-                pivot_var = pivot_indices[i]
-                if pivot_var < 0:
-                    break
-                vector_coords[pivot_var] = -p.normal_vector[free_var]
-            direction_vectors.append(Vector(vector_coords))
+        The coefficients are factored once, then every list of constant terms is solved
+        by forward and back substitution instead of a full gaussian elimination.
 
-        return direction_vectors
+                Args:
+                    constant_terms: iterable of lists of constant terms, one constant per equation.
 
-    def extract_basepoint_for_parametrization(self):
-        """Returns basepoint vector for parametrization."""
-        num_variables = self.dimension
-        pivot_indices = self.indices_of_first_nonzero_terms_in_each_row()
+                Returns:
+                    A list holding for each list of constant terms what compute_solution would return
+                    """
+        return self.factorize().solve_many(constant_terms)
+
+    def factorize(self):
+        """Returns LUFactorization of the coefficients of current linear system.
+
+        The factorization keeps permutations, multipliers, triangular coefficients, pivot columns
+        and rank, and can be pickled and reused to solve new constant terms, check them for
+        consistency or compute the determinant without eliminating again."""
+        matrix = self.to_augmented_matrix()
+        with timed(self.stats, SolverStats.TRIANGULAR_FORM):
+            factorization = matrix.compute_lu_factorization()
+        self.finish_solve()
+        return factorization
+
+    def echelon_basis(self):
+        """Returns EchelonBasis of current equations.
+
+        The basis is built once and then kept up to date by add_equation,
+        assigning a row discards it."""
+        if self._basis is None:
+            basis = EchelonBasis(self.dimension, self.MATRIX_CLASSES[self.backend], self.pivoting)
+            for p in self.planes:
+                basis.add(p.normal_vector.coordinates, p.constant_term)
+            self._basis = basis
+        return self._basis
+
+    def add_equation(self, plane):
+        """Append plane to current linear system and returns the updated solution.
+
+        The equation is only reduced against the cached reduced row-echelon form of the
+        equations already there, which costs O(num of equations * dimension)
+        instead of a full gaussian elimination.
 
-        basepoint_coords = [0] * num_variables
+                Returns:
+                    Same as compute_solution
 
-        for index, plane in enumerate(self.planes):
-            pivot_var = pivot_indices[index]
-            if pivot_var < 0:
-                break
-            basepoint_coords[pivot_var] = plane.constant_term
+                Raises:
+                    Exception: thrown with msg 'All planes in the system should live in the same dimension'
+                               when plane is not in the dimension of current linear system
+                    """
+        if plane.dimension != self.dimension:
+            raise Exception(self.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
 
-        return Vector(basepoint_coords)
+        if not isinstance(self.planes, list):
+            self.planes = list(self.planes)
+        self.planes.append(plane)
+        if self._leading_indices is not None:
+            self._leading_indices.append(AugmentedMatrix.first_nonzero_index(plane.normal_vector.coordinates))
 
-    def raise_exception_if_contradictory_equation(self):
-        """Raise exception with msg 'No solutions' when contradictory equation is found."""
-        for p in self.planes:
-            try:
-                p.first_nonzero_index(p.normal_vector)
+        if self._basis is None:
+            basis = self.echelon_basis()
+        else:
+            basis = self._basis
+            basis.add(plane.normal_vector.coordinates, plane.constant_term)
+        return basis.compute_solution()
+
+    def remove_equation(self, i):
+        """Remove equation i from current linear system and returns the updated solution.
+
+        A reduced row-echelon form cannot tell which equations its rows came from,
+        so the cached one is rebuilt from the remaining equations by online row reduction.
+
+                Returns:
+                    Same as compute_solution
+                    """
+        if not isinstance(self.planes, list):
+            self.planes = list(self.planes)
+        del self.planes[i]
+        if self._leading_indices is not None:
+            del self._leading_indices[i]
+
+        self._basis = None
+        return self.echelon_basis().compute_solution()
+
+    def do_gaussian_elimination_and_parametrize_solution(self):
+        """Returns parametrized solution after gaussian elimination is done."""
+        stats = self.stats
+        rref = self.to_augmented_matrix()
+        try:
+            rref.compute_rref()
+
+            with timed(stats, SolverStats.CONTRADICTION_CHECK):
+                rref.raise_exception_if_contradictory_equation()
 
-            except Exception as e:
-                if str(e) == Plane.NO_NONZERO_ELTS_FOUND_MSG:
+            with timed(stats, SolverStats.PARAMETRIZATION):
+                direction_vectors = rref.extract_direction_vectors_for_parametrization()
+                basepoint = rref.extract_basepoint_for_parametrization()
 
-                    constant_term = MyDecimal(p.constant_term)
-                    if not constant_term.is_near_zero():
-                        raise Exception(self.NO_SOLUTIONS_MSG)
+        finally:
+            self.finish_solve()
+
+        return Parametrization(basepoint=basepoint, direction_vectors=direction_vectors)
 
-                else:
-                    raise e
+    def finish_solve(self):
+        """Let stats know a solve is finished, if there are stats."""
+        if self.stats is not None:
+            self.stats.finish_solve()
+
+    def extract_direction_vectors_for_parametrization(self):
+        """Returns direction vectors for parametrization."""
+        return self.to_augmented_matrix().extract_direction_vectors_for_parametrization()
+
+    def extract_basepoint_for_parametrization(self):
+        """Returns basepoint vector for parametrization."""
+        return self.to_augmented_matrix().extract_basepoint_for_parametrization()
+
+    def raise_exception_if_contradictory_equation(self):
+        """Raise exception with msg 'No solutions' when contradictory equation is found."""
+        self.to_augmented_matrix().raise_exception_if_contradictory_equation()
 
     def __len__(self):
         return len(self.planes)
@@ -224,14 +428,28 @@ class LinearSystem(object):
     def __setitem__(self, i, x):
         try:
             assert x.dimension == self.dimension
+            if not isinstance(self.planes, list):
+                self.planes = list(self.planes)
             self.planes[i] = x
+            self._basis = None
+            if self._leading_indices is not None:
+                self._leading_indices[i] = AugmentedMatrix.first_nonzero_index(x.normal_vector.coordinates)
 
         except AssertionError:
             raise Exception(self.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
 
+    def write(self, stream):
+        """Write current linear system to stream, a file-like object, as __str__ returns it.
+
+        Equations are written one at a time, see write_equation, so the text of the whole
+        system is never held in memory and planes of a SystemFile are decoded one by one."""
+        stream.write('Linear System:')
+        for i, p in enumerate(self.planes):
+            stream.write('\nEquation {}: '.format(i + 1))
+            write_equation(stream, p.normal_vector, p.constant_term)
+
     def __str__(self):
-        ret = 'Linear System:\n'
-        temp = ['Equation {}: {}'.format(i+1,p) for i,p in enumerate(self.planes)]
-        ret += '\n'.join(temp)
-        return ret
+        output = StringIO()
+        self.write(output)
+        return output.getvalue()
 
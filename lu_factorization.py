@@ -0,0 +1,345 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from parametrization import Parametrization
+
+
+class LUFactorization(object):
+
+    NO_SOLUTIONS_MSG = 'No solutions'
+    CONSTANT_TERMS_MUST_MATCH_NUM_EQUATIONS_MSG = 'The num of constant terms should equal the num of equations'
+    ONLY_DEFINED_FOR_SQUARE_SYSTEMS_MSG = 'Determinant is only defined for square systems'
+
+    def __init__(self, matrix):
+        """Initialize LUFactorization object from an AugmentedMatrix reduced by compute_lu_factorization.
+
+        The coefficients of the system satisfy P A Q = L U, where
+            P: row_order, row i of P A is equation row_order[i]
+            Q: column_order, column k of A Q is variable column_order[k]
+            L: lower, unit lower triangular multipliers used by elimination
+            U: upper, coefficients in triangular form
+
+        Factoring costs as much as one elimination, afterwards each new set of
+        constant terms is solved by forward and back substitution only.
+        No reference to the matrix is kept besides its coefficients, so the
+        factorization can be pickled and stored to be reused later.
+
+        Args:
+            matrix: AugmentedMatrix after compute_lu_factorization."""
+        self.dimension = matrix.dimension
+        self.num_equations = len(matrix.rows)
+        self.row_order = list(matrix.row_order)
+        self.column_order = list(matrix.column_order)
+        self.lower = matrix.lower
+        self.upper = matrix.rows
+        self.pivot_columns = [k for k in matrix.leading_indices if k >= 0]
+        self.rank = len(self.pivot_columns)
+        self.vector_class = matrix.vector_class
+        self.zero_tolerance = matrix.ZERO_TOLERANCE
+        self.direction_vectors = self.compute_direction_vectors()
+
+    def indices_of_first_nonzero_terms_in_each_row(self):
+        """Returns indices of first nonzero terms in each row of U, -1 for rows without pivot.
+
+        Indices refer to the columns of U, see column_order for the variables they hold."""
+        return self.pivot_columns + [-1] * (self.num_equations - self.rank)
+
+    def pivot_variable_indices(self):
+        """Returns indices of pivot variables, in the order of rows of U."""
+        return [self.column_order[k] for k in self.pivot_columns]
+
+    def free_variable_indices(self):
+        """Returns indices of free variables in ascending order,
+        one per direction vector of the parametrized solution."""
+        return sorted(set(range(self.dimension)) - set(self.pivot_variable_indices()))
+
+    def determinant(self):
+        """Returns determinant of the coefficients.
+
+                Raises:
+                    Exception: thrown with msg 'Determinant is only defined for square systems'
+                               when num of equations differs from dimension
+                """
+        if self.num_equations != self.dimension:
+            raise Exception(self.ONLY_DEFINED_FOR_SQUARE_SYSTEMS_MSG)
+
+        to_scalar = self.vector_class.to_scalar
+        if self.rank < self.dimension:
+            return to_scalar(0)
+
+        determinant = to_scalar(self.permutation_sign(self.row_order) * self.permutation_sign(self.column_order))
+        for i, col in enumerate(self.pivot_columns):
+            determinant *= self.upper[i][col]
+        return determinant
+
+    def is_consistent(self, constant_terms):
+        """Returns whether the system has at least one solution for constant_terms."""
+        try:
+            self.raise_exception_if_contradictory_equation(self.forward_substitute(constant_terms))
+            return True
+        except Exception as e:
+            if str(e) == self.NO_SOLUTIONS_MSG:
+                return False
+            else:
+                raise e
+
+    def forward_substitute(self, constant_terms):
+        """Returns constant terms after applying the row operations of elimination to them."""
+        if len(constant_terms) != self.num_equations:
+            raise Exception(self.CONSTANT_TERMS_MUST_MATCH_NUM_EQUATIONS_MSG)
+
+        to_scalar = self.vector_class.to_scalar
+        c = [to_scalar(constant_terms[i]) for i in self.row_order]
+        lower = self.lower
+
+        for k in range(self.rank):
+            ck = c[k]
+            if not ck:
+                continue
+            for j in range(k + 1, self.num_equations):
+                factor = lower[j][k]
+                if factor:
+                    c[j] -= factor * ck
+
+        return c
+
+    def raise_exception_if_contradictory_equation(self, c):
+        """Raise exception with msg 'No solutions' when an equation without pivot keeps a nonzero constant."""
+        for k in c[self.rank:]:
+            if abs(k) >= self.zero_tolerance:
+                raise Exception(self.NO_SOLUTIONS_MSG)
+
+    def back_substitute(self, c):
+        """Returns values of variables, in the order of columns of U, with every free variable set to zero."""
+        x = [0] * self.dimension
+        upper = self.upper
+
+        for i in range(self.rank)[::-1]:
+            col = self.pivot_columns[i]
+            row = upper[i]
+            total = c[i]
+            for k in range(col + 1, self.dimension):
+                if x[k]:
+                    total -= row[k] * x[k]
+            x[col] = total / row[col]
+
+        return x
+
+    def compute_direction_vectors(self):
+        """Returns direction vectors for parametrization, one per free variable in variable order."""
+        order = self.column_order
+        free_columns = sorted(set(range(self.dimension)) - set(self.pivot_columns), key=order.__getitem__)
+        upper = self.upper
+
+        direction_vectors = []
+        for free_var in free_columns:
+            x = [0] * self.dimension
+            x[free_var] = 1
+
+            for i in range(self.rank)[::-1]:
+                col = self.pivot_columns[i]
+                row = upper[i]
+                total = 0
+                for k in range(col + 1, self.dimension):
+                    if x[k]:
+                        total -= row[k] * x[k]
+                x[col] = total / row[col]
+
+            direction_vectors.append(self.to_vector(x))
+
+        return direction_vectors
+
+    def to_vector(self, x):
+        """Returns a vector of values x given in the order of columns of U."""
+        return self.vector_class(self.restore_column_order(x))
+
+    def restore_column_order(self, x):
+        """Returns values x given in the order of columns of U in the original variable order."""
+        restored = [0] * self.dimension
+        for k, value in zip(self.column_order, x):
+            restored[k] = value
+        return restored
+
+    def compute_solution(self, constant_terms):
+        """Returns parametrized solution for constant_terms, one per equation.
+
+                Returns:
+                    One solution || Infinite solutions -> a parametrization object with parametrized solution
+                    No solution -> "No solutions"
+                    """
+        c = self.forward_substitute(constant_terms)
+        try:
+            self.raise_exception_if_contradictory_equation(c)
+        except Exception as e:
+            if str(e) == self.NO_SOLUTIONS_MSG:
+                return str(e)
+            else:
+                raise e
+
+        basepoint = self.to_vector(self.back_substitute(c))
+        return Parametrization(basepoint=basepoint, direction_vectors=list(self.direction_vectors))
+
+    def solve_many(self, constant_terms):
+        """Returns a list of parametrized solutions, one for each list of constant terms."""
+        return [self.compute_solution(k) for k in constant_terms]
+
+    @staticmethod
+    def permutation_sign(order):
+        """Returns 1 if order is an even permutation of its indices, -1 if it is odd."""
+        sign = 1
+        seen = [False] * len(order)
+        for i in range(len(order)):
+            if seen[i]:
+                continue
+            # a cycle of length n is made up of n - 1 transpositions
+            j = order[i]
+            seen[i] = True
+            while j != i:
+                seen[j] = True
+                sign = -sign
+                j = order[j]
+        return sign
+
+
+class FloatLUFactorization(LUFactorization):
+
+    def forward_substitute(self, constant_terms):
+        """Returns constant terms after applying the row operations of elimination to them.
+
+        constant_terms may also be a 2d array holding one set of constant terms per row."""
+        b = numpy.asarray(constant_terms, dtype=numpy.float64)
+        if b.shape[-1] != self.num_equations:
+            raise Exception(self.CONSTANT_TERMS_MUST_MATCH_NUM_EQUATIONS_MSG)
+
+        c = b[..., self.row_order]
+        lower = self.lower
+        for k in range(self.rank):
+            c[..., k + 1:] -= numpy.multiply.outer(c[..., k], lower[k + 1:, k])
+        return c
+
+    def determinant(self):
+        """Returns determinant of the coefficients, see LUFactorization.determinant."""
+        return float(LUFactorization.determinant(self))
+
+    def raise_exception_if_contradictory_equation(self, c):
+        """Raise exception with msg 'No solutions' when an equation without pivot keeps a nonzero constant."""
+        if numpy.any(numpy.abs(c[self.rank:]) >= self.zero_tolerance):
+            raise Exception(self.NO_SOLUTIONS_MSG)
+
+    def back_substitute(self, c):
+        """Returns values of variables, in the order of columns of U, with every free variable set to zero.
+
+        c may also be a 2d array holding one set of constant terms per row."""
+        x = numpy.zeros(c.shape[:-1] + (self.dimension,))
+        upper = self.upper
+
+        for i in range(self.rank)[::-1]:
+            col = self.pivot_columns[i]
+            x[..., col] = (c[..., i] - numpy.dot(x[..., col + 1:], upper[i, col + 1:])) / upper[i, col]
+
+        return x
+
+    def restore_column_order(self, x):
+        """Returns values x given in the order of columns of U in the original variable order."""
+        restored = numpy.empty_like(numpy.asarray(x, dtype=numpy.float64))
+        restored[..., self.column_order] = x
+        return restored
+
+    def solve_many(self, constant_terms):
+        """Returns a list of parametrized solutions, one for each list of constant terms.
+
+        All constant terms are substituted at once as rows of a single array."""
+        c = self.forward_substitute(numpy.asarray(constant_terms, dtype=numpy.float64).reshape(-1, self.num_equations))
+        consistent = numpy.all(numpy.abs(c[:, self.rank:]) < self.zero_tolerance, axis=1)
+        basepoints = self.restore_column_order(self.back_substitute(c))
+
+        solutions = []
+        for is_consistent, basepoint in zip(consistent, basepoints):
+            if not is_consistent:
+                solutions.append(self.NO_SOLUTIONS_MSG)
+            else:
+                solutions.append(Parametrization(basepoint=self.vector_class(basepoint),
+                                                 direction_vectors=list(self.direction_vectors)))
+        return solutions
+
+
+class FractionLUFactorization(LUFactorization):
+
+    def raise_exception_if_contradictory_equation(self, c):
+        """Raise exception with msg 'No solutions' when an equation without pivot keeps a constant that is exactly nonzero."""
+        for k in c[self.rank:]:
+            if k:
+                raise Exception(self.NO_SOLUTIONS_MSG)
+
+
+class SparseLUFactorization(LUFactorization):
+
+    def __init__(self, matrix):
+        """Initialize SparseLUFactorization object from a SparseAugmentedMatrix reduced by compute_lu_factorization.
+
+        Same as LUFactorization, but lower[i] maps pivot step to multiplier and
+        upper[i] maps variable to coefficient, both holding nonzeros only."""
+        LUFactorization.__init__(self, matrix)
+
+    def pivot_variable_indices(self):
+        """Returns indices of pivot variables, in the order of rows of U."""
+        return self.column_order[:self.rank]
+
+    def determinant(self):
+        """Returns determinant of the coefficients, see LUFactorization.determinant."""
+        if self.num_equations != self.dimension:
+            raise Exception(self.ONLY_DEFINED_FOR_SQUARE_SYSTEMS_MSG)
+
+        to_scalar = self.vector_class.to_scalar
+        if self.rank < self.dimension:
+            return to_scalar(0)
+
+        determinant = to_scalar(self.permutation_sign(self.row_order) * self.permutation_sign(self.column_order))
+        for i, var in enumerate(self.pivot_variable_indices()):
+            determinant *= self.upper[i][var]
+        return determinant
+
+    def forward_substitute(self, constant_terms):
+        """Returns constant terms after applying the row operations of elimination to them."""
+        if len(constant_terms) != self.num_equations:
+            raise Exception(self.CONSTANT_TERMS_MUST_MATCH_NUM_EQUATIONS_MSG)
+
+        to_scalar = self.vector_class.to_scalar
+        c = [to_scalar(constant_terms[i]) for i in self.row_order]
+
+        # row i is only ever reduced by pivot rows above it
+        for i, multipliers in enumerate(self.lower):
+            for k, factor in multipliers.items():
+                c[i] -= factor * c[k]
+        return c
+
+    def back_substitute(self, c):
+        """Returns values of variables as a dict mapping variable to nonzero value, every free variable set to zero."""
+        return self.substitute_pivot_variables(c, {})
+
+    def substitute_pivot_variables(self, c, x):
+        """Solve pivot variables from the last row of U up, given values x of free variables, updated in place."""
+        pivot_vars = self.pivot_variable_indices()
+        for i in range(self.rank)[::-1]:
+            var = pivot_vars[i]
+            row = self.upper[i]
+            total = c[i]
+            for k, a in row.items():
+                if k != var and k in x:
+                    total -= a * x[k]
+            if total:
+                x[var] = total / row[var]
+        return x
+
+    def compute_direction_vectors(self):
+        """Returns direction vectors for parametrization, one per free variable in variable order."""
+        zeros = [0] * self.rank
+        return [self.to_vector(self.substitute_pivot_variables(zeros, {k: 1}))
+                for k in self.column_order[self.rank:]]
+
+    def to_vector(self, x):
+        """Returns a SparseVector of values x, a dict mapping variable to value."""
+        return self.vector_class.from_entries(x, self.dimension)
+
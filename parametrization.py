@@ -1,3 +1,11 @@
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from util import round_to_places
+
+
 class Parametrization(object):
 
     BASEPT_AND_DIR_VECTORS_MUST_BE_IN_SAME_DIM = (
@@ -25,14 +33,43 @@ class Parametrization(object):
         except AssertionError:
             raise Exception(self.BASEPT_AND_DIR_VECTORS_MUST_BE_IN_SAME_DIM)
 
-    def __str__(self):
+    def write(self, stream, skip_zeros=False):
+        """Write current parametrization to stream, a file-like object, one line per variable:
+            x_1 = 1.000 + 0.000 t_1+ 2.000 t_2
+            ...
+
+        Each line is written as soon as it is built, so the text of the whole parametrization
+        is never held in memory.
 
-        output = ''
-        for coord in range(self.dimension):
-            output += 'x_{} = {} '.format(coord + 1,
-                                          round(self.basepoint[coord], 3))
-            for free_var, vector in enumerate(self.direction_vectors):
-                output += '+ {} t_{}'.format(round(vector[coord], 3),
-                                             free_var + 1)
-            output += '\n'
-        return output
\ No newline at end of file
+        Args:
+            stream: file-like object with a write method.
+            skip_zeros: whether to leave out terms of free variables whose coefficient rounds to 0,
+                        False to write every term as __str__ does (default). Only nonzero
+                        coordinates of direction vectors are visited when True."""
+        dimension = self.dimension
+        basepoint = self.basepoint.coordinate_list()
+        labels = [' t_{}'.format(j + 1) for j in range(len(self.direction_vectors))]
+
+        if skip_zeros:
+            # terms of each variable, built from nonzero coordinates of direction vectors
+            terms = [[] for _ in range(dimension)]
+            for j, v in enumerate(self.direction_vectors):
+                for i, x in v.nonzero_terms():
+                    x = round_to_places(x, 3)
+                    if x != 0:
+                        terms[i].append('+ {}{}'.format(x, labels[j]))
+        else:
+            columns = [v.coordinate_list() for v in self.direction_vectors]
+
+        for coord in range(dimension):
+            if skip_zeros:
+                line = terms[coord]
+            else:
+                line = ['+ {}{}'.format(round_to_places(column[coord], 3), label)
+                        for column, label in zip(columns, labels)]
+            stream.write('x_{} = {} {}\n'.format(coord + 1, round_to_places(basepoint[coord], 3), ''.join(line)))
+
+    def __str__(self):
+        output = StringIO()
+        self.write(output)
+        return output.getvalue()
@@ -29,7 +29,20 @@ class Plane(object):
             constant_term = Decimal('0')
         self.constant_term = Decimal(constant_term)
 
-        self.set_basepoint()
+        self._basepoint = None
+        self._has_basepoint = False
+
+    @property
+    def basepoint(self):
+        """Returns base point of self, computed by set_basepoint on first access."""
+        if not self._has_basepoint:
+            self.set_basepoint()
+        return self._basepoint
+
+    @basepoint.setter
+    def basepoint(self, basepoint):
+        self._basepoint = basepoint
+        self._has_basepoint = True
 
     def set_basepoint(self):
         """Compute and set base point of self.
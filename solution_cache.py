@@ -0,0 +1,104 @@
+from collections import OrderedDict
+from decimal import localcontext
+from fractions import Fraction
+
+from vector import Vector
+from util import is_zero, normalized_terms
+
+
+class SolutionCache(object):
+
+    DEFAULT_MAX_SIZE = 128
+    FINGERPRINT_PRECISION = 12
+    MAX_SIZE_MUST_BE_POSITIVE_MSG = 'The max size of the cache must be positive'
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """Initialize SolutionCache object.
+
+        A SolutionCache remembers what compute_solution returned for the most recently
+        solved systems. Systems are looked up by fingerprint, which is the same for
+        systems made up of the same equations in any order, each scaled by any nonzero
+        factor, so such a system gets back the result of the first one solved, a
+        Parametrization shared by both or 'No solutions'.
+
+        Args:
+            max_size: num of results kept, the least recently used one is evicted first.
+
+        Raises:
+            Exception: thrown with msg 'The max size of the cache must be positive' when max_size < 1"""
+        if max_size < 1:
+            raise Exception(self.MAX_SIZE_MUST_BE_POSITIVE_MSG)
+
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def solve(self, system, deduplicate=False):
+        """Returns what system.compute_solution returns, from the cache if an equivalent system was solved.
+
+        Args:
+            system: LinearSystem to solve.
+            deduplicate: whether compute_solution runs remove_redundant_equations first on a miss (default False),
+                         the fingerprint already ignores duplicate equations so hits are the same either way."""
+        key = self.fingerprint(system)
+        entries = self.entries
+        if key in entries:
+            self.hits += 1
+            # move to the most recently used end
+            result = entries.pop(key)
+            entries[key] = result
+            return result
+
+        self.misses += 1
+        result = system.compute_solution(deduplicate=deduplicate)
+        entries[key] = result
+        if len(entries) > self.max_size:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def clear(self):
+        """Drop every cached result, counters are kept."""
+        self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, system):
+        return self.fingerprint(system) in self.entries
+
+    @staticmethod
+    def fingerprint(system):
+        """Returns a hashable key identifying the equations of system up to order and scaling.
+
+        Equations are normalized by canonical_row, '0 = 0' equations and duplicates are dropped
+        and the rest are sorted. Backend, pivoting strategy and dimension are part of the key."""
+        rows = set()
+        for p in system.planes:
+            row = SolutionCache.canonical_row(p)
+            if row is not None:
+                rows.add(row)
+        return system.backend, system.pivoting, system.dimension, tuple(sorted(rows))
+
+    @staticmethod
+    def canonical_row(plane):
+        """Returns util.normalized_terms of plane rounded to FINGERPRINT_PRECISION significant digits,
+        None if the equation is '0 = 0'. Every equation '0 = k' gives the same row, ending with 1.
+
+        Rounding keeps scaling errors of Decimal and float arithmetic from changing the result,
+        Fractions are kept exact."""
+        terms = normalized_terms(plane.normal_vector, plane.constant_term)
+        if all(is_zero(x) for x in terms[:-1]):
+            if is_zero(terms[-1]):
+                return None
+            return (0,) * (len(terms) - 1) + (1,)
+
+        if all(isinstance(x, Fraction) for x in terms):
+            return terms
+
+        to_decimal = Vector.to_scalar
+        with localcontext() as context:
+            context.prec = SolutionCache.FINGERPRINT_PRECISION
+            return tuple([0 if is_zero(x) else to_decimal(x).normalize() for x in terms])
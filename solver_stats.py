@@ -0,0 +1,99 @@
+import time
+from contextlib import contextmanager
+
+
+class SolverStats(object):
+
+    TRIANGULAR_FORM = 'triangular_form'
+    BACK_SUBSTITUTION = 'back_substitution'
+    CONTRADICTION_CHECK = 'contradiction_check'
+    PARAMETRIZATION = 'parametrization'
+    PHASES = (TRIANGULAR_FORM, BACK_SUBSTITUTION, CONTRADICTION_CHECK, PARAMETRIZATION)
+
+    def __init__(self, callback=None):
+        """Initialize SolverStats object.
+
+        Set a SolverStats as the stats of a LinearSystem to record what its gaussian eliminations do:
+            row_swaps: num of rows exchanged
+            row_scalings: num of rows multiplied by a coefficient
+            row_additions: num of multiples of a row added to another row
+            arithmetic_operations: num of multiplications, divisions, additions and subtractions
+                                   on coefficients and constant terms done by the above
+            pivots: magnitude of every pivot in the order they were chosen
+            phase_seconds: wall time spent in each of PHASES
+            solves: num of solves recorded
+        Counters add up over solves until reset is called.
+
+        Args:
+            callback: function called with self after every solve, None for no callback (default)."""
+        self.callback = callback
+        self.reset()
+
+    def reset(self):
+        """Set every counter back to zero."""
+        self.row_swaps = 0
+        self.row_scalings = 0
+        self.row_additions = 0
+        self.arithmetic_operations = 0
+        self.pivots = []
+        self.phase_seconds = dict((phase, 0.0) for phase in self.PHASES)
+        self.solves = 0
+
+    def count_row_swap(self):
+        """Record an exchange of two rows."""
+        self.row_swaps += 1
+
+    def count_row_scalings(self, count, num_terms):
+        """Record count rows of num_terms terms each multiplied by a coefficient."""
+        self.row_scalings += count
+        self.arithmetic_operations += count * num_terms
+
+    def count_row_additions(self, count, num_terms, operations_per_term=2):
+        """Record count multiples of a row added to another row, touching num_terms terms each.
+
+        A term takes a multiplication and an addition, unless operations_per_term says otherwise."""
+        self.row_additions += count
+        self.arithmetic_operations += count * num_terms * operations_per_term
+
+    def record_pivot(self, pivot):
+        """Record the magnitude of a pivot."""
+        self.pivots.append(float(abs(pivot)))
+
+    def finish_solve(self):
+        """Count a finished solve and pass self to the callback."""
+        self.solves += 1
+        if self.callback is not None:
+            self.callback(self)
+
+    def as_dict(self):
+        """Returns every counter in a dict."""
+        return {'row_swaps': self.row_swaps,
+                'row_scalings': self.row_scalings,
+                'row_additions': self.row_additions,
+                'arithmetic_operations': self.arithmetic_operations,
+                'pivots': list(self.pivots),
+                'phase_seconds': dict(self.phase_seconds),
+                'solves': self.solves}
+
+    def __str__(self):
+        output = 'Solver stats over {} solves:\n'.format(self.solves)
+        output += 'row swaps: {}, row scalings: {}, row additions: {}, arithmetic operations: {}\n'.format(
+            self.row_swaps, self.row_scalings, self.row_additions, self.arithmetic_operations)
+        if self.pivots:
+            output += 'pivots: {} from {:.3g} to {:.3g}\n'.format(len(self.pivots), min(self.pivots), max(self.pivots))
+        output += '\n'.join(['{}: {:.6f}s'.format(phase, self.phase_seconds[phase]) for phase in self.PHASES])
+        return output
+
+
+@contextmanager
+def timed(stats, phase):
+    """Context manager adding wall time of its block to phase of stats, does nothing if stats is None."""
+    if stats is None:
+        yield
+        return
+
+    start = time.time()
+    try:
+        yield
+    finally:
+        stats.phase_seconds[phase] += time.time() - start
@@ -0,0 +1,327 @@
+import heapq
+from decimal import Decimal, getcontext
+
+from sparse_vector import SparseVector
+from hyperplane import Hyperplane
+from augmented_matrix import AugmentedMatrix
+from lu_factorization import SparseLUFactorization
+from solver_stats import SolverStats, timed
+
+getcontext().prec = 30
+
+
+class SparseAugmentedMatrix(AugmentedMatrix):
+
+    PIVOT_THRESHOLD = Decimal('0.1')
+    MARKOWITZ_SEARCH_ROWS = 4
+
+    backend = 'sparse'
+    vector_class = SparseVector
+    factorization_class = SparseLUFactorization
+
+    def __init__(self, rows, constants, dimension, leading_indices=None, pivoting=AugmentedMatrix.NO_PIVOTING):
+        """Initialize SparseAugmentedMatrix object.
+
+        Same as AugmentedMatrix, but each row is a dict mapping the index of a
+        variable to its nonzero coefficient, so row operations only touch nonzeros.
+
+        Elimination picks pivots by Markowitz ordering: the pivot (i, k) minimizes
+        (nonzeros in row i - 1) * (nonzeros in column k - 1), which bounds the fill-in
+        it can cause. Pivot rows and variables are then moved to the front, keeping
+        track of variables in column_order as complete pivoting does.
+        Unless pivoting is 'none', a pivot must also be at least PIVOT_THRESHOLD
+        times the largest coefficient of its column (threshold pivoting).
+
+        Args:
+            rows: list of dicts mapping index of variable to coefficient, one per equation.
+            see AugmentedMatrix for the others."""
+        AugmentedMatrix.__init__(self, rows, constants, dimension, leading_indices, pivoting)
+
+    @classmethod
+    def from_planes(cls, planes, dimension, leading_indices=None, pivoting=AugmentedMatrix.NO_PIVOTING):
+        """Returns a new SparseAugmentedMatrix holding coefficients of planes."""
+        to_scalar = cls.vector_class.to_scalar
+        rows = [dict((k, to_scalar(x)) for k, x in SparseVector.entries_of(p.normal_vector).items()) for p in planes]
+        constants = [to_scalar(p.constant_term) for p in planes]
+        if leading_indices is not None:
+            leading_indices = list(leading_indices)
+        return cls(rows, constants, dimension, leading_indices, pivoting)
+
+    def to_hyperplanes(self):
+        """Returns a list of Hyperplanes with SparseVector normal vectors, one per row."""
+        self.restore_column_order()
+        return [Hyperplane(normal_vector=SparseVector.from_entries(row, self.dimension), constant_term=k)
+                for row, k in zip(self.rows, self.constants)]
+
+    def restore_column_order(self):
+        """Undo column exchanges, rows are keyed by variable so only the bookkeeping changes."""
+        if self.column_order == list(range(self.dimension)):
+            return
+        self.column_order = list(range(self.dimension))
+        self.leading_indices = [self.first_nonzero_index(row) for row in self.rows]
+
+    def mutable_row(self, row):
+        """Returns row as a dict that can be updated in place."""
+        return self.rows[row]
+
+    def append_row(self, coefficients, constant_term):
+        """Append an equation at the bottom, returns its row.
+
+        coefficients may be a sequence or a dict mapping index of variable to coefficient."""
+        to_scalar = self.vector_class.to_scalar
+        items = coefficients.items() if hasattr(coefficients, 'items') else enumerate(coefficients)
+        row = len(self.rows)
+        self.rows.append(dict((k, to_scalar(x)) for k, x in items if x))
+        self.constants.append(to_scalar(constant_term))
+        self.leading_indices.append(self.first_nonzero_index(self.rows[row]))
+        self.row_order.append(row)
+        return row
+
+    def coefficient(self, row, col):
+        """Returns coefficient of variable col in row."""
+        return self.rows[row].get(col, self.ZERO)
+
+    def swap_columns(self, col1, col2):
+        """Swap coefficients of two variables in every equation, remembering the exchange in column_order."""
+        for r in self.rows:
+            x = r.pop(col1, None)
+            y = r.pop(col2, None)
+            if x is not None:
+                r[col2] = x
+            if y is not None:
+                r[col1] = y
+        order = self.column_order
+        order[col1], order[col2] = order[col2], order[col1]
+        self.leading_indices = [self.first_nonzero_index(row) for row in self.rows]
+
+    def multiply_coefficient_and_row(self, coefficient, row, start=0):
+        """Multiply a row with coefficient in equations, see AugmentedMatrix.multiply_coefficient_and_row."""
+        r = self.rows[row]
+        for k in r:
+            r[k] *= coefficient
+        self.constants[row] *= coefficient
+        self.leading_indices[row] = self.first_nonzero_index(r)
+        if self.stats is not None:
+            self.stats.count_row_scalings(1, len(r) + 1)
+
+    def add_multiple_times_row_to_row(self, coefficient, row_to_add, row_to_be_added_to, start=0):
+        """Multiply a row_to_add with coefficient and add it to row_to_be_added_to in equations,
+        see AugmentedMatrix.add_multiple_times_row_to_row."""
+        self.add_entries(coefficient, self.rows[row_to_add], self.rows[row_to_be_added_to])
+        self.constants[row_to_be_added_to] += coefficient * self.constants[row_to_add]
+        self.leading_indices[row_to_be_added_to] = self.first_nonzero_index(self.rows[row_to_be_added_to])
+        if self.stats is not None:
+            self.stats.count_row_additions(1, len(self.rows[row_to_add]) + 1)
+
+    def add_entries(self, coefficient, source, target, skip=None):
+        """Add coefficient times source to target, both dicts, dropping terms that cancel out.
+
+        Returns a pair of lists: variables that appeared in target and variables that left it."""
+        tolerance = self.ZERO_TOLERANCE
+        filled = []
+        cancelled = []
+        for k, x in source.items():
+            if k == skip:
+                continue
+            y = target.get(k)
+            if y is None:
+                target[k] = coefficient * x
+                filled.append(k)
+            else:
+                y += coefficient * x
+                if abs(y) < tolerance:
+                    del target[k]
+                    cancelled.append(k)
+                else:
+                    target[k] = y
+        return filled, cancelled
+
+    def find_markowitz_pivot(self, heap, column_rows, active):
+        """Returns (row, variable) of the pivot with least Markowitz cost, (-1, -1) if all active rows are zero.
+
+        Only a few of the shortest rows are searched, found through heap of (num of nonzeros, row)."""
+        rows = self.rows
+        threshold = self.ZERO if self.pivoting == self.NO_PIVOTING else self.PIVOT_THRESHOLD
+        searched = []
+        best = None
+
+        while heap and (best is None or len(searched) < self.MARKOWITZ_SEARCH_ROWS):
+            count, i = heapq.heappop(heap)
+            if i not in active or count != len(rows[i]):
+                continue
+            if count == 0:
+                # nothing left to eliminate with, leave the row behind
+                active.discard(i)
+                continue
+            searched.append((count, i))
+
+            for k, x in rows[i].items():
+                magnitude = abs(x)
+                if threshold and magnitude < threshold * max(abs(rows[j][k]) for j in column_rows[k]):
+                    continue
+                cost = ((count - 1) * (len(column_rows[k]) - 1), -magnitude, k)
+                if best is None or cost < best[0]:
+                    best = (cost, i, k)
+
+        for entry in searched:
+            heapq.heappush(heap, entry)
+
+        if best is None:
+            return -1, -1
+        return best[1], best[2]
+
+    def compute_triangular_form(self):
+        """Reduce self to triangular form in place.
+
+        Pivots are chosen by Markowitz ordering, pivot rows are moved to the top in the
+        order they were chosen and column_order lists pivot variables in the same order
+        followed by free variables, row i only has nonzeros at column_order[i] and after."""
+        rows = self.rows
+        constants = self.constants
+        lower = self.lower
+        stats = self.stats
+
+        column_rows = {}
+        for i, r in enumerate(rows):
+            for k in r:
+                column_rows.setdefault(k, set()).add(i)
+
+        active = set(range(len(rows)))
+        heap = [(len(r), i) for i, r in enumerate(rows)]
+        heapq.heapify(heap)
+        pivots = []
+
+        while active:
+            pivot_row, var = self.find_markowitz_pivot(heap, column_rows, active)
+            if pivot_row < 0:
+                break
+
+            source = rows[pivot_row]
+            active.discard(pivot_row)
+            for k in source:
+                column_rows[k].discard(pivot_row)
+
+            pivot = source[var]
+            if stats is not None:
+                stats.record_pivot(pivot)
+                stats.count_row_additions(len(column_rows[var]), len(source))
+            for j in list(column_rows[var]):
+                target = rows[j]
+                factor = target.pop(var) / pivot
+                if lower is not None:
+                    lower[j][len(pivots)] = factor
+
+                filled, cancelled = self.add_entries(-factor, source, target, skip=var)
+                constants[j] -= factor * constants[pivot_row]
+                for k in filled:
+                    column_rows.setdefault(k, set()).add(j)
+                for k in cancelled:
+                    column_rows[k].discard(j)
+                heapq.heappush(heap, (len(target), j))
+            column_rows[var] = set()
+
+            pivots.append((pivot_row, var))
+
+        self.reorder(pivots)
+
+    def reorder(self, pivots):
+        """Move pivot rows to the top and pivot variables to the front of column_order, in pivot order."""
+        pivot_rows = [i for i, _ in pivots]
+        pivot_vars = [k for _, k in pivots]
+        chosen_rows = set(pivot_rows)
+        chosen_vars = set(pivot_vars)
+        order = pivot_rows + [i for i in range(len(self.rows)) if i not in chosen_rows]
+
+        self.rows = [self.rows[i] for i in order]
+        self.constants = [self.constants[i] for i in order]
+        self.row_order = [self.row_order[i] for i in order]
+        if self.lower is not None:
+            self.lower = [self.lower[i] for i in order]
+
+        self.column_order = pivot_vars + [k for k in range(self.dimension) if k not in chosen_vars]
+        self.leading_indices = list(range(len(pivots))) + [-1] * (len(self.rows) - len(pivots))
+
+    def compute_lu_factorization(self):
+        """Reduce self to triangular form in place recording the multipliers used,
+        see AugmentedMatrix.compute_lu_factorization.
+
+        Multipliers are kept sparse as well, lower[i] maps pivot step to multiplier."""
+        self.lower = [{} for _ in self.rows]
+        self.compute_triangular_form()
+        return self.factorization_class(self)
+
+    def compute_rref(self):
+        """Reduce self to reduced row-echelon form in place, with respect to the pivot variables."""
+        with timed(self.stats, SolverStats.TRIANGULAR_FORM):
+            self.compute_triangular_form()
+
+        with timed(self.stats, SolverStats.BACK_SUBSTITUTION):
+            self.clear_pivot_columns_above()
+
+    def clear_pivot_columns_above(self):
+        """Reduce self from triangular form to reduced row-echelon form in place."""
+        rows = self.rows
+        constants = self.constants
+        stats = self.stats
+        rank = len([k for k in self.leading_indices if k >= 0])
+        pivot_vars = self.column_order[:rank]
+
+        # clearing a row above only brings in free variables, so pivot columns never fill in
+        pivot_positions = dict((k, i) for i, k in enumerate(pivot_vars))
+        column_rows = dict((k, []) for k in pivot_vars)
+        for i in range(rank):
+            for k in rows[i]:
+                if k in pivot_positions and pivot_positions[k] > i:
+                    column_rows[k].append(i)
+
+        for i in range(rank)[::-1]:
+            var = pivot_vars[i]
+            source = rows[i]
+
+            # scale to make coefficient equal 1
+            scale = self.ONE / source.pop(var)
+            for k in source:
+                source[k] *= scale
+            constants[i] *= scale
+            if stats is not None:
+                stats.count_row_scalings(1, len(source) + 1)
+                stats.count_row_additions(len(column_rows[var]), len(source) + 1)
+
+            for j in column_rows[var]:
+                target = rows[j]
+                c = target.pop(var)
+                self.add_entries(-c, source, target)
+                constants[j] -= c * constants[i]
+            source[var] = self.ONE
+
+    def pivot_variables(self):
+        """Returns index of the pivot variable of each row with a pivot, rows without one are at the bottom."""
+        return [self.column_order[k] for k in self.leading_indices if k >= 0]
+
+    def extract_direction_vectors_for_parametrization(self):
+        """Returns direction vectors for parametrization, self must be in reduced row-echelon form."""
+        pivot_vars = self.pivot_variables()
+        chosen_vars = set(pivot_vars)
+        free_vars = [k for k in range(self.dimension) if k not in chosen_vars]
+
+        entries = dict((k, {k: 1}) for k in free_vars)
+        for i, pivot_var in enumerate(pivot_vars):
+            for k, x in self.rows[i].items():
+                if k != pivot_var:
+                    entries[k][pivot_var] = -x
+
+        return [SparseVector.from_entries(entries[k], self.dimension) for k in free_vars]
+
+    def extract_basepoint_for_parametrization(self):
+        """Returns basepoint vector for parametrization, self must be in reduced row-echelon form."""
+        entries = dict(zip(self.pivot_variables(), self.constants))
+        return SparseVector.from_entries(entries, self.dimension)
+
+    @staticmethod
+    def first_nonzero_index(row, start=0):
+        """Returns index of first nonzero term in row from column start, -1 if there is none."""
+        tolerance = AugmentedMatrix.ZERO_TOLERANCE
+        indices = [k for k, x in row.items() if k >= start and abs(x) >= tolerance]
+        if not indices:
+            return -1
+        return min(indices)
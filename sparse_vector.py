@@ -0,0 +1,140 @@
+from math import sqrt
+from decimal import Decimal, getcontext
+
+from vector import Vector
+from util import quantize_all
+
+getcontext().prec = 30
+
+
+class SparseVector(Vector):
+
+    backend = 'sparse'
+
+    __slots__ = ('entries',)
+
+    def __init__(self, coordinates):
+        """Initialize SparseVector object.
+
+        Same API as Vector, but only nonzero coordinates are stored in entries,
+        a dict mapping index to Decimal value, so memory and arithmetic scale
+        with the num of nonzeros rather than with dimension.
+        Use from_entries to build a vector from a dict without listing its zeros.
+
+        Raises:
+            ValueError: thrown with msg 'The coordinates must be nonempty'
+            TypeError: thrown with msg 'The coordinates must be an iterable'"""
+        try:
+            if not coordinates:
+                raise ValueError
+            entries = {}
+            for i, x in enumerate(coordinates):
+                x = Decimal(x)
+                if x:
+                    entries[i] = x
+            self.entries = entries
+            self.dimension = len(coordinates)
+
+        except ValueError:
+            raise ValueError('The coordinates must be nonempty')
+
+        except TypeError:
+            raise TypeError('The coordinates must be an iterable')
+
+    @classmethod
+    def from_entries(cls, entries, dimension):
+        """Returns a new SparseVector of dimension holding entries, a dict mapping index to value."""
+        v = cls.__new__(cls)
+        v.entries = dict((i, Decimal(x)) for i, x in entries.items() if x)
+        v.dimension = dimension
+        return v
+
+    @classmethod
+    def from_decimals(cls, coordinates):
+        """Returns a new SparseVector holding coordinates, a nonempty tuple of Decimals."""
+        return cls(coordinates)
+
+    @property
+    def coordinates(self):
+        """Returns all coordinates as a tuple of Decimals, zeros included."""
+        zero = Decimal('0')
+        entries = self.entries
+        return tuple([entries.get(i, zero) for i in range(self.dimension)])
+
+    def coordinate_list(self):
+        """Returns coordinates as a list of Decimals, zeros included."""
+        zero = Decimal('0')
+        entries = self.entries
+        return [entries.get(i, zero) for i in range(self.dimension)]
+
+    def nonzero_terms(self):
+        """Returns (index, coordinate) of nonzero coordinates as a list, in order of index."""
+        return sorted(self.entries.items())
+
+    @staticmethod
+    def entries_of(v):
+        """Returns nonzero coordinates of any vector v as a dict mapping index to value."""
+        if isinstance(v, SparseVector):
+            return v.entries
+        return dict((i, x) for i, x in enumerate(v.coordinates) if x)
+
+    def magnitude(self):
+        """Returns a Decimal object with value of magnitude."""
+        return Decimal(sqrt(sum([x ** 2 for x in self.entries.values()])))
+
+    def times_scalar(self, c):
+        """Returns a new SparseVector with value of c times scalar self."""
+        c = Decimal(c)
+        return SparseVector.from_entries(dict((i, c * x) for i, x in self.entries.items()), self.dimension)
+
+    def plus(self, v):
+        """Returns a new SparseVector with value of v plus self."""
+        entries = dict(self.entries)
+        for i, y in self.entries_of(v).items():
+            entries[i] = entries.get(i, 0) + y
+        return SparseVector.from_entries(entries, self.dimension)
+
+    def minus(self, v):
+        """Returns a new SparseVector with value of self minus v."""
+        entries = dict(self.entries)
+        for i, y in self.entries_of(v).items():
+            entries[i] = entries.get(i, 0) - y
+        return SparseVector.from_entries(entries, self.dimension)
+
+    def dot(self, v):
+        """Returns a Decimal with value of dot product of v and self."""
+        a = self.entries
+        b = self.entries_of(v)
+        if len(b) < len(a):
+            a, b = b, a
+        return sum([x * b[i] for i, x in a.items() if i in b])
+
+    def __eq__(self, v):
+        if not isinstance(v, SparseVector):
+            return Vector.__eq__(self, v)
+        if v.dimension != self.dimension:
+            return False
+        a = self.entries
+        b = v.entries
+        zero = Decimal('0')
+        indices = set(a) | set(b)
+        precision = self.EQUALITY_PRECISION
+        return (quantize_all([a.get(i, zero) for i in indices], precision) ==
+                quantize_all([b.get(i, zero) for i in indices], precision))
+
+    __hash__ = Vector.__hash__
+
+    def __reduce__(self):
+        return SparseVector.from_entries, (self.entries, self.dimension)
+
+    def __iter__(self):
+        return iter(self.coordinates)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.coordinates[item]
+        if item < 0:
+            item += self.dimension
+        if not 0 <= item < self.dimension:
+            raise IndexError('tuple index out of range')
+        return self.entries.get(item, Decimal('0'))
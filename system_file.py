@@ -0,0 +1,249 @@
+import mmap
+import os
+import struct
+import tempfile
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from vector import Vector
+from float_vector import FloatVector
+from sparse_vector import SparseVector
+from fraction_vector import FractionVector
+from hyperplane import Hyperplane
+
+
+class SystemFile(object):
+
+    MAGIC = b'LSYS'
+    VERSION = 1
+    FLOAT64_DTYPE = b'<f8'
+    TEXT_DTYPE = b'text'
+    DTYPES = (FLOAT64_DTYPE, TEXT_DTYPE)
+    # magic, version, dtype, backend, pivoting, dimension, num of rows: 64 bytes, so the data is 8-byte aligned
+    HEADER = struct.Struct('<4sI8s16s16sQQ')
+    VECTOR_CLASSES = dict((c.backend, c) for c in (Vector, FloatVector, SparseVector, FractionVector))
+    NOT_A_SYSTEM_FILE_MSG = 'Not a linear system file'
+    UNSUPPORTED_VERSION_MSG = 'Unsupported linear system file version'
+    FLOAT64_FILE_REQUIRED_MSG = 'Only float64 linear system files can be viewed as arrays'
+
+    def __init__(self, path):
+        """Initialize SystemFile object, a linear system file opened by memory-mapping.
+
+        A linear system file starts with a header holding the dtype, backend, pivoting strategy,
+        dimension and num of equations of the system, followed by the equations in one of two dtypes:
+            FLOAT64_DTYPE -> float64 backend, the coefficients as one contiguous row-major block of
+                             little-endian float64 and then the column of constant terms
+            TEXT_DTYPE -> other backends, one line of text per equation holding its constant term and
+                          'index:coefficient' of its nonzero coefficients, then the offset of each line
+                          as little-endian uint64, so Decimals and Fractions are read back exactly
+        Opening a file only reads its header, whatever its size, and equations are decoded from
+        the mapped file when they are accessed: SystemFile is a read-only sequence of Hyperplanes
+        of its dimension.
+
+        Args:
+            path: path of a file written by write, equations are decoded
+                  with normal vectors of the backend it was written with.
+
+        Raises:
+            Exception: thrown with msg 'Not a linear system file' when the header is not valid
+            Exception: thrown with msg 'Unsupported linear system file version'
+                       when the file was written by another version"""
+        with open(path, 'rb') as f:
+            try:
+                self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files cannot be mapped
+                raise Exception(self.NOT_A_SYSTEM_FILE_MSG)
+
+        header = self.HEADER
+        if len(self.buffer) < header.size:
+            raise Exception(self.NOT_A_SYSTEM_FILE_MSG)
+        magic, version, dtype, backend, pivoting, dimension, num_rows = header.unpack_from(self.buffer, 0)
+        dtype = dtype.rstrip(b'\0')
+        if magic != self.MAGIC or dtype not in self.DTYPES:
+            raise Exception(self.NOT_A_SYSTEM_FILE_MSG)
+        if version != self.VERSION:
+            raise Exception(self.UNSUPPORTED_VERSION_MSG)
+
+        if dtype == self.FLOAT64_DTYPE:
+            data_size = 8 * num_rows * (dimension + 1)
+        else:
+            data_size = 8 * (num_rows + 1)
+        if len(self.buffer) < header.size + data_size:
+            raise Exception(self.NOT_A_SYSTEM_FILE_MSG)
+
+        self.dtype = dtype
+        self.backend = backend.rstrip(b'\0').decode('ascii')
+        self.pivoting = pivoting.rstrip(b'\0').decode('ascii')
+        self.dimension = dimension
+        self.num_rows = num_rows
+        self.row_format = struct.Struct('<{}d'.format(dimension))
+        self.constants_offset = header.size + 8 * num_rows * dimension
+        # offsets of the lines of a text file are at its end
+        self.offsets_offset = len(self.buffer) - 8 * (num_rows + 1)
+        self.vector_class = self.VECTOR_CLASSES.get(self.backend, Vector)
+
+    @staticmethod
+    def write(path, planes, dimension, backend, pivoting):
+        """Write planes, equations of dimension variables, to path as a linear system file.
+
+        The float64 backend is written as FLOAT64_DTYPE, other backends as TEXT_DTYPE holding
+        every coefficient converted to the scalar type of the backend, exactly.
+        Equations are written one at a time, planes may be any iterable of Hyperplanes.
+
+        The file is written next to path and then moved over it, so planes may be read from
+        a SystemFile mapping path itself, e.g. a system loaded from path and saved back."""
+        dtype = SystemFile.FLOAT64_DTYPE if backend == FloatVector.backend else SystemFile.TEXT_DTYPE
+        header = SystemFile.HEADER
+        directory, name = os.path.split(os.path.abspath(path))
+        fd, temporary_path = tempfile.mkstemp(prefix='.' + name, suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(header.pack(SystemFile.MAGIC, SystemFile.VERSION, dtype, backend.encode('ascii'),
+                                    pivoting.encode('ascii'), dimension, 0))
+                if dtype == SystemFile.FLOAT64_DTYPE:
+                    num_rows = SystemFile.write_float64_rows(f, planes, dimension)
+                else:
+                    num_rows = SystemFile.write_text_rows(f, planes, SystemFile.VECTOR_CLASSES.get(backend, Vector))
+
+                # num of rows is only known at the end
+                f.seek(0)
+                f.write(header.pack(SystemFile.MAGIC, SystemFile.VERSION, dtype, backend.encode('ascii'),
+                                    pivoting.encode('ascii'), dimension, num_rows))
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    @staticmethod
+    def write_float64_rows(f, planes, dimension):
+        """Write planes to f as a float64 block of coefficients followed by the column of constant terms,
+        returns the num of planes."""
+        row_format = struct.Struct('<{}d'.format(dimension))
+        constants = []
+        for p in planes:
+            v = p.normal_vector
+            if isinstance(v, FloatVector):
+                f.write(v.coordinates.astype('<f8').tobytes())
+            elif isinstance(v, SparseVector):
+                row = [0.0] * dimension
+                for i, x in v.entries.items():
+                    row[i] = float(x)
+                f.write(row_format.pack(*row))
+            else:
+                f.write(row_format.pack(*[float(x) for x in v.coordinates]))
+            constants.append(float(p.constant_term))
+
+        f.write(struct.pack('<{}d'.format(len(constants)), *constants))
+        return len(constants)
+
+    @staticmethod
+    def write_text_rows(f, planes, vector_class):
+        """Write planes to f as one line per equation, 'k i:x j:y ...' with nonzero coefficients only,
+        followed by the offsets of the lines and of the end of the last one, returns the num of planes.
+
+        Values are converted by vector_class.to_scalar and written by str,
+        which Decimal and Fraction read back exactly."""
+        to_scalar = vector_class.to_scalar
+        offsets = []
+        offset = f.tell()
+        for p in planes:
+            terms = ['{}:{}'.format(i, to_scalar(x)) for i, x in p.normal_vector.nonzero_terms()]
+            line = ' '.join([str(to_scalar(p.constant_term))] + terms).encode('ascii') + b'\n'
+            offsets.append(offset)
+            f.write(line)
+            offset += len(line)
+
+        offsets.append(offset)
+        f.write(struct.pack('<{}Q'.format(len(offsets)), *offsets))
+        return len(offsets) - 1
+
+    def text_row(self, i):
+        """Returns (constant term, dict mapping index to coefficient) of equation i of a text file, as strings."""
+        start, end = struct.unpack_from('<2Q', self.buffer, self.offsets_offset + 8 * i)
+        fields = self.buffer[start:end].decode('ascii').split()
+        entries = {}
+        for field in fields[1:]:
+            index, _, x = field.partition(':')
+            entries[int(index)] = x
+        return fields[0], entries
+
+    def coefficient_row(self, i):
+        """Returns coefficients of equation i as a tuple of floats,
+        or of scalars of the backend for a text file."""
+        if self.dtype == self.FLOAT64_DTYPE:
+            return self.row_format.unpack_from(self.buffer, self.HEADER.size + self.row_format.size * i)
+
+        to_scalar = self.vector_class.to_scalar
+        zero = to_scalar(0)
+        entries = self.text_row(i)[1]
+        return tuple([to_scalar(entries[j]) if j in entries else zero for j in range(self.dimension)])
+
+    def constant_term(self, i):
+        """Returns constant term of equation i as a float, or as a scalar of the backend for a text file."""
+        if self.dtype == self.FLOAT64_DTYPE:
+            return struct.unpack_from('<d', self.buffer, self.constants_offset + 8 * i)[0]
+        return self.vector_class.to_scalar(self.text_row(i)[0])
+
+    def coefficient_block(self):
+        """Returns every coefficient as a read-only float64 numpy array of shape (num of rows, dimension)
+        viewing the mapped file, nothing is copied.
+
+        Raises:
+            Exception: thrown with msg 'Only float64 linear system files can be viewed as arrays'
+                       when the file is not FLOAT64_DTYPE"""
+        if self.dtype != self.FLOAT64_DTYPE:
+            raise Exception(self.FLOAT64_FILE_REQUIRED_MSG)
+        return numpy.frombuffer(self.buffer, dtype=numpy.float64, count=self.num_rows * self.dimension,
+                                offset=self.HEADER.size).reshape(self.num_rows, self.dimension)
+
+    def constants_column(self):
+        """Returns every constant term as a read-only float64 numpy array viewing the mapped file.
+
+        Raises:
+            Exception: thrown with msg 'Only float64 linear system files can be viewed as arrays'
+                       when the file is not FLOAT64_DTYPE"""
+        if self.dtype != self.FLOAT64_DTYPE:
+            raise Exception(self.FLOAT64_FILE_REQUIRED_MSG)
+        return numpy.frombuffer(self.buffer, dtype=numpy.float64, count=self.num_rows, offset=self.constants_offset)
+
+    def close(self):
+        """Unmap the file, equations cannot be accessed afterwards."""
+        self.buffer.close()
+
+    def __len__(self):
+        return self.num_rows
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.num_rows))]
+        if i < 0:
+            i += self.num_rows
+        if not 0 <= i < self.num_rows:
+            raise IndexError('Equation index out of range')
+
+        if self.dtype == self.FLOAT64_DTYPE:
+            coordinates = self.coefficient_row(i)
+            constant_term = self.constant_term(i)
+            if self.vector_class is not FloatVector:
+                # the shortest decimal that rounds to each float
+                coordinates = [repr(x) for x in coordinates]
+                constant_term = repr(constant_term)
+            return Hyperplane(normal_vector=self.vector_class(coordinates), constant_term=constant_term)
+
+        constant_term, entries = self.text_row(i)
+        if self.vector_class is SparseVector:
+            normal_vector = SparseVector.from_entries(entries, self.dimension)
+        else:
+            coordinates = ['0'] * self.dimension
+            for j, x in entries.items():
+                coordinates[j] = x
+            normal_vector = self.vector_class(coordinates)
+        return Hyperplane(normal_vector=normal_vector, constant_term=constant_term)
+
+    def __iter__(self):
+        for i in range(self.num_rows):
+            yield self[i]
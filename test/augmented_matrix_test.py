@@ -0,0 +1,91 @@
+from __future__ import absolute_import
+from decimal import Decimal
+
+from vector import Vector
+from hyperplane import Hyperplane
+from augmented_matrix import AugmentedMatrix
+
+import unittest
+
+
+class AugmentedMatrixTest(unittest.TestCase):
+
+    def runTest(self):
+        self.test_row_operations()
+        self.test_compute_triangular_form()
+        self.test_compute_rref()
+        self.test_to_hyperplanes()
+
+    def test_row_operations(self):
+        m = AugmentedMatrix([[Decimal('1'), Decimal('2')], [Decimal('3'), Decimal('4')]],
+                            [Decimal('5'), Decimal('6')], 2)
+
+        m.swap_rows(0, 1)
+        self.assertEqual(m.rows, [[3, 4], [1, 2]])
+        self.assertEqual(m.constants, [6, 5])
+
+        m.multiply_coefficient_and_row(Decimal('2'), 1)
+        self.assertEqual(m.rows[1], [2, 4])
+        self.assertEqual(m.constants[1], 10)
+
+        m.add_multiple_times_row_to_row(Decimal('-1'), 1, 0)
+        self.assertEqual(m.rows[0], [1, 0])
+        self.assertEqual(m.constants[0], -4)
+
+    def test_compute_triangular_form(self):
+        p1 = Hyperplane(normal_vector=Vector(['0', '1', '1']), constant_term='1')
+        p2 = Hyperplane(normal_vector=Vector(['1', '-1', '1']), constant_term='2')
+        p3 = Hyperplane(normal_vector=Vector(['1', '2', '-5']), constant_term='3')
+        m = AugmentedMatrix.from_planes([p1, p2, p3], 3)
+        m.compute_triangular_form()
+        self.assertEqual([list(r) for r in m.rows], [[1, -1, 1], [0, 1, 1], [0, 0, -9]])
+        self.assertEqual(m.constants, [2, 1, -2])
+        self.assertEqual(m.indices_of_first_nonzero_terms_in_each_row(), [0, 1, 2])
+
+        # a column without pivot must not stop elimination of the next ones
+        p1 = Hyperplane(normal_vector=Vector(['0', '1', '1']), constant_term='1')
+        p2 = Hyperplane(normal_vector=Vector(['0', '1', '2']), constant_term='1')
+        m = AugmentedMatrix.from_planes([p1, p2], 3)
+        m.compute_triangular_form()
+        self.assertEqual([list(r) for r in m.rows], [[0, 1, 1], [0, 0, 1]])
+        self.assertEqual(m.indices_of_first_nonzero_terms_in_each_row(), [1, 2])
+
+    def test_compute_rref(self):
+        p1 = Hyperplane(normal_vector=Vector(['1', '1', '1']), constant_term='1')
+        p2 = Hyperplane(normal_vector=Vector(['1', '1', '1']), constant_term='2')
+        m = AugmentedMatrix.from_planes([p1, p2], 3)
+        m.compute_rref()
+        self.assertEqual(m.indices_of_first_nonzero_terms_in_each_row(), [0, -1])
+        try:
+            m.raise_exception_if_contradictory_equation()
+            self.assertFalse(True, 'last line should throws an error')
+        except Exception as e:
+            self.assertEqual(str(e), AugmentedMatrix.NO_SOLUTIONS_MSG)
+
+        p1 = Hyperplane(normal_vector=Vector(['0', '1', '1']), constant_term='1')
+        p2 = Hyperplane(normal_vector=Vector(['1', '-1', '1']), constant_term='2')
+        m = AugmentedMatrix.from_planes([p1, p2], 3)
+        m.compute_rref()
+        self.assertEqual(m.extract_basepoint_for_parametrization(), Vector(['3', '1', '0']))
+        self.assertEqual(m.extract_direction_vectors_for_parametrization(), [Vector(['-2', '-1', '1'])])
+
+    def test_to_hyperplanes(self):
+        p1 = Hyperplane(normal_vector=Vector(['1', '2']), constant_term='3')
+        p2 = Hyperplane(normal_vector=Vector(['4', '5']), constant_term='6')
+        m = AugmentedMatrix.from_planes([p1, p2], 2)
+        planes = m.to_hyperplanes()
+        self.assertTrue(planes[0] == p1 and planes[1] == p2)
+
+        # rows are copied on write, input planes are never mutated
+        m.multiply_coefficient_and_row(Decimal('2'), 0)
+        self.assertEqual(p1.normal_vector, Vector(['1', '2']))
+        self.assertTrue(m.rows[1] is p2.normal_vector.coordinates)
+
+        # rows left untouched are handed back as the planes they came from
+        planes = m.to_hyperplanes()
+        self.assertTrue(planes[1] is p2)
+        self.assertEqual(planes[0], Hyperplane(normal_vector=Vector(['2', '4']), constant_term='6'))
+
+        m.swap_rows(0, 1)
+        planes = m.to_hyperplanes()
+        self.assertTrue(planes[0] is p2)
@@ -0,0 +1,81 @@
+from __future__ import absolute_import
+
+from vector import Vector
+from float_vector import numpy, FloatVector
+from sparse_vector import SparseVector
+from fraction_vector import FractionVector
+from hyperplane import Hyperplane
+from linear_system import LinearSystem
+from batch_solver import BatchSolver
+
+import unittest
+
+
+class BatchSolverTest(unittest.TestCase):
+
+    def runTest(self):
+        self.test_encode_system()
+        self.test_solve()
+        self.test_invalid_arguments()
+
+    def test_encode_system(self):
+        p1 = Hyperplane(normal_vector=Vector(['1', '0.1', '0']), constant_term='3')
+        p2 = Hyperplane(normal_vector=Vector(['0', '1', '2']), constant_term='4')
+        s = LinearSystem([p1, p2])
+        self.assertEqual(BatchSolver.encode_system(s),
+                         ('decimal', 'none', 3, (('1', '0.1', '0'), ('0', '1', '2')), ('3', '4')))
+
+        p = Hyperplane(normal_vector=SparseVector(['1', '0.1', '0']), constant_term='3')
+        s = LinearSystem([p], pivoting=LinearSystem.PARTIAL_PIVOTING)
+        self.assertEqual(BatchSolver.encode_system(s),
+                         ('sparse', 'partial', 3, (((0, '1'), (1, '0.1')),), ('3',)))
+
+        s = LinearSystem([p1], backend=LinearSystem.FRACTION_BACKEND)
+        self.assertEqual(BatchSolver.encode_system(s),
+                         ('fraction', 'none', 3, (('1', '1/10', '0'),), ('3',)))
+
+    def test_solve(self):
+        coefficients = [[['1', '1', '1'], ['0', '1', '1']],
+                         [['1', '1', '1'], ['2', '2', '2']],
+                         [['1', '0', '0'], ['0', '1', '0'], ['0', '0', '1']],
+                         [['0', '1', '-1'], ['1', '0', '2']]]
+        constant_terms = [['1', '2'], ['1', '3'], ['4', '5', '6'], ['1', '3']]
+        vector_classes = [Vector, SparseVector, FractionVector]
+        if numpy is not None:
+            vector_classes.append(FloatVector)
+
+        systems = []
+        for vector_class in vector_classes:
+            for c, k in zip(coefficients, constant_terms):
+                planes = [Hyperplane(normal_vector=vector_class(row), constant_term=x) for row, x in zip(c, k)]
+                systems.append(LinearSystem(planes))
+                systems.append(LinearSystem(planes, pivoting=LinearSystem.COMPLETE_PIVOTING))
+
+        expected = [s.compute_solution() for s in systems]
+        for solver in [BatchSolver(max_workers=2, chunk_size=3), BatchSolver(max_workers=1)]:
+            solutions = solver.solve(systems)
+            self.assertEqual(len(solutions), len(systems))
+            for e, solution in zip(expected, solutions):
+                if e == LinearSystem.NO_SOLUTIONS_MSG:
+                    self.assertEqual(solution, e)
+                    continue
+                self.assertEqual(type(solution.basepoint), type(e.basepoint))
+                self.assertEqual(solution.basepoint, e.basepoint)
+                self.assertEqual(len(solution.direction_vectors), len(e.direction_vectors))
+                for v, w in zip(solution.direction_vectors, e.direction_vectors):
+                    self.assertEqual(v, w)
+
+        self.assertEqual(BatchSolver().solve([]), [])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(Exception) as context:
+            BatchSolver(max_workers=0)
+        self.assertEqual(str(context.exception), BatchSolver.MAX_WORKERS_MUST_BE_POSITIVE_MSG)
+
+        with self.assertRaises(Exception) as context:
+            BatchSolver(chunk_size=0)
+        self.assertEqual(str(context.exception), BatchSolver.CHUNK_SIZE_MUST_BE_POSITIVE_MSG)
+
+
+if __name__ == '__main__':
+    unittest.main()
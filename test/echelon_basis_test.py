@@ -0,0 +1,116 @@
+from __future__ import absolute_import
+
+from vector import Vector
+from hyperplane import Hyperplane
+from linear_system import LinearSystem
+from echelon_basis import EchelonBasis
+from sparse_augmented_matrix import SparseAugmentedMatrix
+
+import unittest
+
+
+class EchelonBasisTest(unittest.TestCase):
+
+    def runTest(self):
+        self.test_add()
+        self.test_redundant_and_contradictory_equations()
+        self.test_dimension()
+        self.test_from_rows()
+        self.test_add_and_remove_equation()
+
+    def test_add(self):
+        b = EchelonBasis(3)
+        self.assertTrue(b.add([0, 1, 1], 1))
+        self.assertTrue(b.add([1, -1, 1], 2))
+        # rows stay reduced and sorted by pivot variable
+        self.assertEqual([list(r) for r in b.matrix.rows], [[1, 0, 2], [0, 1, 1]])
+        self.assertEqual(b.matrix.constants, [3, 1])
+        self.assertEqual(b.rank(), 2)
+
+        s = b.compute_solution()
+        self.assertEqual(s.basepoint, Vector([3, 1, 0]))
+        self.assertEqual(s.direction_vectors, [Vector([-2, -1, 1])])
+
+        self.assertTrue(b.add([1, 2, -5], 3))
+        self.assertEqual(b.compute_solution().basepoint, Vector(['2.5555555', '0.7777777', '0.2222222']))
+
+    def test_redundant_and_contradictory_equations(self):
+        b = EchelonBasis(3, SparseAugmentedMatrix)
+        b.add({0: 1, 2: 1}, 1)
+        self.assertFalse(b.add([2, 0, 2], 2))
+        self.assertFalse(b.add([0, 0, 0], 0))
+        self.assertEqual(len(b), 1)
+        self.assertTrue(b.is_consistent())
+
+        # only the first contradictory equation is kept, at the bottom
+        self.assertTrue(b.add([1, 0, 1], 2))
+        self.assertFalse(b.add([0, 0, 0], 5))
+        self.assertTrue(b.add([0, 1, 0], 4))
+        self.assertEqual(b.matrix.leading_indices, [0, 1, -1])
+        self.assertFalse(b.is_consistent())
+        self.assertEqual(b.rank(), 2)
+        self.assertEqual(b.compute_solution(), 'No solutions')
+
+    def test_dimension(self):
+        b = EchelonBasis(3)
+        with self.assertRaises(Exception) as context:
+            b.add([1, 2], 3)
+        self.assertEqual(str(context.exception), LinearSystem.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+
+        with self.assertRaises(Exception) as context:
+            LinearSystem.from_rows([])
+        self.assertEqual(str(context.exception), LinearSystem.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+
+    def test_from_rows(self):
+        coefficients = [['0', '1', '1'], ['1', '-1', '1'], ['1', '2', '-5'], ['1', '0', '2']]
+        constant_terms = ['1', '2', '3', '3']
+        planes = [Hyperplane(normal_vector=Vector(c), constant_term=k) for c, k in zip(coefficients, constant_terms)]
+        expected = LinearSystem(planes).compute_solution()
+
+        for backend in LinearSystem.MATRIX_CLASSES:
+            rows = (pair for pair in zip(coefficients, constant_terms))
+            s = LinearSystem.from_rows(rows, backend=backend)
+            self.assertEqual(s.backend, backend)
+            self.assertEqual(len(s), 3)
+            self.assertEqual(s.indices_of_first_nonzero_terms_in_each_row(), [0, 1, 2])
+            self.assertEqual(s.compute_solution().basepoint, expected.basepoint)
+
+        s = LinearSystem.from_rows([([0, 0], 0)])
+        self.assertEqual(len(s), 1)
+        self.assertEqual(s.dimension, 2)
+        self.assertEqual(len(s.compute_solution().direction_vectors), 2)
+
+        s = LinearSystem.from_rows([], dimension=2, backend=LinearSystem.SPARSE_BACKEND)
+        self.assertEqual(s.dimension, 2)
+
+    def test_add_and_remove_equation(self):
+        p1 = Hyperplane(normal_vector=Vector(['0', '1', '1']), constant_term='1')
+        p2 = Hyperplane(normal_vector=Vector(['1', '-1', '1']), constant_term='2')
+        p3 = Hyperplane(normal_vector=Vector(['1', '2', '-5']), constant_term='3')
+        p4 = Hyperplane(normal_vector=Vector(['1', '1', '1']), constant_term='0')
+
+        s = LinearSystem([p1])
+        s.add_equation(p2)
+        self.assertEqual(s.echelon_basis().rank(), 2)
+        solution = s.add_equation(p3)
+        self.assertEqual(len(s), 3)
+        self.assertEqual(solution.basepoint, LinearSystem([p1, p2, p3]).compute_solution().basepoint)
+        self.assertEqual(s.indices_of_first_nonzero_terms_in_each_row(), [1, 0, 0])
+
+        self.assertEqual(s.add_equation(p4), 'No solutions')
+        solution = s.remove_equation(2)
+        self.assertEqual(solution.basepoint, LinearSystem([p1, p2, p4]).compute_solution().basepoint)
+        self.assertEqual(s.indices_of_first_nonzero_terms_in_each_row(), [1, 0, 0])
+
+        # assigning a row discards the cached basis
+        s[2] = p3
+        self.assertEqual(s.echelon_basis().compute_solution().basepoint,
+                         LinearSystem([p1, p2, p3]).compute_solution().basepoint)
+
+        with self.assertRaises(Exception) as context:
+            s.add_equation(Hyperplane(normal_vector=Vector([1, 1]), constant_term=1))
+        self.assertEqual(str(context.exception), LinearSystem.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+from __future__ import absolute_import
+from decimal import Decimal
+from fractions import Fraction
+
+from vector import Vector
+from sparse_vector import SparseVector
+from hyperplane import Hyperplane
+from linear_system import LinearSystem
+from equation_parser import EquationParser
+
+import unittest
+
+
+class EquationParserTest(unittest.TestCase):
+
+    def runTest(self):
+        self.test_parse_equation()
+        self.test_invalid_equation()
+        self.test_parse()
+        self.test_rows()
+
+    def test_parse_equation(self):
+        p = EquationParser()
+        self.assertEqual(p.parse_equation('x_1 + 2x_2 - x_3 = 4'),
+                         ({0: Decimal('1'), 1: Decimal('2'), 2: Decimal('-1')}, Decimal('4')))
+        self.assertEqual(p.parse_equation('  -2.500x_5 + 3 * x_2 + x_5=-1e3 '),
+                         ({4: Decimal('-1.5'), 1: Decimal('3')}, Decimal('-1000')))
+        self.assertEqual(p.parse_equation('0 = 3'), ({}, Decimal('3')))
+        self.assertEqual(p.parse_equation(' = 3'), ({}, Decimal('3')))
+        self.assertIsNone(p.parse_equation('   '))
+        self.assertIsNone(p.parse_equation('# comment'))
+
+        p = EquationParser(backend=LinearSystem.FRACTION_BACKEND)
+        self.assertEqual(p.parse_equation('0.1x_2 = 1/3'), ({1: Fraction(1, 10)}, Fraction(1, 3)))
+
+        p = EquationParser(EquationParser.MATRIX_FORMAT, backend=LinearSystem.FLOAT64_BACKEND)
+        self.assertEqual(p.parse_equation('1, 2.5,-1, 4'), ([1.0, 2.5, -1.0], 4.0))
+        self.assertEqual(p.parse_equation('1 2.5\t-1 4'), ([1.0, 2.5, -1.0], 4.0))
+
+        # every equation written by Hyperplane.__str__ is read back
+        for coordinates, constant_term in [(['1', '2', '-1'], '4'), (['0', '-2.5', '0.125'], '-1.5'), (['0', '0'], '3')]:
+            plane = Hyperplane(normal_vector=Vector(coordinates), constant_term=constant_term)
+            terms, k = EquationParser().parse_equation(str(plane))
+            self.assertEqual(terms, dict((i, Decimal(x)) for i, x in enumerate(coordinates) if Decimal(x)))
+            self.assertEqual(k, Decimal(constant_term))
+
+    def test_invalid_equation(self):
+        p = EquationParser()
+        for line in ['x_1 + x_2', 'x_1 x_2 = 1', '2y_1 = 3', 'x_0 = 1', 'x_1 + = 2', 'x_1 + 2 = 3',
+                     'x_1 = ', 'x_1 = -', 'x_1 = 1 = 2', '1 = 2', 'x_a = 1']:
+            with self.assertRaises(Exception) as context:
+                p.parse_equation(line)
+            self.assertTrue(str(context.exception).startswith(EquationParser.INVALID_EQUATION_MSG), line)
+
+        with self.assertRaises(Exception) as context:
+            EquationParser(EquationParser.MATRIX_FORMAT).parse_equation('1')
+        self.assertTrue(str(context.exception).startswith(EquationParser.INVALID_EQUATION_MSG))
+
+        with self.assertRaises(Exception) as context:
+            EquationParser(format='json')
+        self.assertEqual(str(context.exception), EquationParser.UNKNOWN_FORMAT_MSG)
+
+    def test_parse(self):
+        lines = ['# two equations', 'x_1 + x_3 = 1', '', 'x_2 - x_3 = 2']
+        s = EquationParser().parse(lines)
+        self.assertEqual(s.dimension, 3)
+        self.assertEqual(s[0].normal_vector, Vector([1, 0, 1]))
+        self.assertEqual(s[1].constant_term, Decimal('2'))
+        solution = s.compute_solution()
+        self.assertEqual(solution.basepoint, Vector([1, 2, 0]))
+        self.assertEqual(solution.direction_vectors, [Vector([-1, 1, 1])])
+
+        s = EquationParser(dimension=4, backend=LinearSystem.SPARSE_BACKEND).parse(lines)
+        self.assertEqual(s.dimension, 4)
+        self.assertIsInstance(s[0].normal_vector, SparseVector)
+        self.assertEqual(s[0].normal_vector.entries, {0: 1, 2: 1})
+
+        s = EquationParser(EquationParser.MATRIX_FORMAT).parse(['1,0,1,1', '0 1 -1 2'])
+        self.assertEqual(s.compute_solution().basepoint, Vector([1, 2, 0]))
+
+        for parser, lines in [(EquationParser(), ['0 = 1']),
+                              (EquationParser(), []),
+                              (EquationParser(dimension=2), ['x_3 = 1']),
+                              (EquationParser(EquationParser.MATRIX_FORMAT), ['1 2 3', '1 2'])]:
+            with self.assertRaises(Exception) as context:
+                parser.parse(lines)
+            self.assertEqual(str(context.exception), LinearSystem.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+
+    def test_rows(self):
+        lines = ['x_1 + x_3 = 1', 'x_2 - x_3 = 2', '2x_1 + x_2 + x_3 = 4']
+        rows = list(EquationParser(dimension=3).rows(lines))
+        self.assertEqual(rows[1], ([Decimal('0'), Decimal('1'), Decimal('-1')], Decimal('2')))
+
+        s = LinearSystem.from_rows(EquationParser(dimension=3).rows(lines), dimension=3)
+        self.assertEqual(len(s), 2)
+
+        with self.assertRaises(Exception) as context:
+            list(EquationParser().rows(lines))
+        self.assertEqual(str(context.exception), EquationParser.DIMENSION_REQUIRED_MSG)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+from __future__ import absolute_import
+import unittest
+
+from vector import Vector
+from float_vector import FloatVector, numpy
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class FloatVectorTest(unittest.TestCase):
+
+    def runTest(self):
+        self.test_initialize()
+        self.test_arithmetic()
+        self.test_angle_and_projection()
+        self.test_cross_product()
+
+    def test_initialize(self):
+        v = FloatVector(['1', 2, 3.5])
+        self.assertEqual(v.dimension, 3)
+        self.assertEqual(list(v), [1.0, 2.0, 3.5])
+        self.assertEqual(v.backend, 'float64')
+        self.assertFalse(hasattr(v, '__dict__'))
+        self.assertEqual(v.coordinate_list(), [1.0, 2.0, 3.5])
+        self.assertEqual(FloatVector([0, 2, 0, -1]).nonzero_terms(), [(1, 2.0), (3, -1.0)])
+
+        try:
+            FloatVector([])
+            self.assertFalse(True, 'last line should throws an error')
+        except ValueError as e:
+            self.assertEqual(str(e), 'The coordinates must be nonempty')
+
+    def test_arithmetic(self):
+        v = FloatVector([8.218, -9.341])
+        w = FloatVector([-1.129, 2.111])
+        self.assertEqual(v.plus(w), Vector(['7.089', '-7.23']))
+        self.assertEqual(v.minus(w), Vector(['9.347', '-11.452']))
+        self.assertEqual(v.times_scalar(2), Vector(['16.436', '-18.682']))
+        self.assertAlmostEqual(v.dot(w), -29.0, places=1)
+        self.assertAlmostEqual(FloatVector([3, 4]).magnitude(), 5.0)
+        self.assertEqual(FloatVector([3, 4]).normalized(), Vector(['0.6', '0.8']))
+
+        try:
+            FloatVector([0, 0]).normalized()
+            self.assertFalse(True, 'last line should throws an error')
+        except Exception as e:
+            self.assertEqual(str(e), Vector.CANNOT_NORMALIZE_ZERO_VECTOR_MSG)
+
+    def test_angle_and_projection(self):
+        v = FloatVector([3.183, -7.627])
+        w = FloatVector([-2.668, 5.319])
+        self.assertAlmostEqual(v.angle_with(w), 3.072, places=3)
+        self.assertTrue(v.is_parallel_to(v.times_scalar(-3)))
+        self.assertFalse(v.is_parallel_to(FloatVector([1, 1])))
+
+        v = FloatVector([3.039, 1.879])
+        b = FloatVector([0.825, 2.036])
+        self.assertEqual(v.component_parallel_to(b), Vector(['1.083', '2.672']))
+
+    def test_cross_product(self):
+        v = FloatVector([8.462, 7.893, -8.187])
+        w = FloatVector([6.984, -5.975, 4.778])
+        self.assertEqual(v.cross(w), Vector(['-11.205', '-97.609', '-105.685']))
+        self.assertEqual(FloatVector([1, 0]).cross(FloatVector([0, 1])), Vector([0, 0, 1]))
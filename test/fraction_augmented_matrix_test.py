@@ -0,0 +1,91 @@
+from __future__ import absolute_import
+from fractions import Fraction
+
+from vector import Vector
+from fraction_vector import FractionVector
+from hyperplane import Hyperplane
+from linear_system import LinearSystem
+from augmented_matrix import AugmentedMatrix
+from fraction_augmented_matrix import FractionAugmentedMatrix
+
+import unittest
+
+
+class FractionAugmentedMatrixTest(unittest.TestCase):
+
+    def runTest(self):
+        self.test_bareiss_elimination()
+        self.test_compute_solution()
+        self.test_exact_rank()
+        self.test_factorize()
+
+    @staticmethod
+    def build_planes(coefficients, constant_terms):
+        return [Hyperplane(normal_vector=FractionVector(c), constant_term=k)
+                for c, k in zip(coefficients, constant_terms)]
+
+    def test_bareiss_elimination(self):
+        planes = self.build_planes([['0', '1', '1'], ['1', '-1', '1'], ['1', '2', '-5']], ['1', '2', '3'])
+        m = FractionAugmentedMatrix.from_planes(planes, 3)
+        m.compute_triangular_form()
+        # every entry is an integer minor of the coefficients, the last pivot is the determinant
+        self.assertEqual(m.rows, [[1, -1, 1], [0, 1, 1], [0, 0, -9]])
+        self.assertEqual(m.constants, [2, 1, -2])
+
+        # denominators are cleared per equation before elimination
+        planes = self.build_planes([['1/2', '1/3'], ['1', '1']], ['1', '0.5'])
+        m = FractionAugmentedMatrix.from_planes(planes, 2)
+        m.compute_rref()
+        self.assertEqual(m.rows, [[1, 0], [0, 1]])
+        self.assertEqual(m.constants, [Fraction(5), Fraction(-9, 2)])
+
+        reference = FractionAugmentedMatrix.from_planes(planes, 2)
+        AugmentedMatrix.compute_rref(reference)
+        self.assertEqual(reference.constants, m.constants)
+
+    def test_compute_solution(self):
+        planes = self.build_planes([['0', '1', '1'], ['1', '-1', '1'], ['1', '2', '-5']], ['1', '2', '3'])
+        s = LinearSystem(planes)
+        self.assertEqual(s.backend, LinearSystem.FRACTION_BACKEND)
+        solution = s.compute_solution()
+        self.assertEqual(solution.basepoint.coordinates, (Fraction(23, 9), Fraction(7, 9), Fraction(2, 9)))
+
+        solution = LinearSystem(planes[:2]).compute_solution()
+        self.assertEqual(solution.basepoint.coordinates, (3, 1, 0))
+        self.assertEqual([v.coordinates for v in solution.direction_vectors], [(-2, -1, 1)])
+
+        planes = self.build_planes([['1', '1', '1'], ['2', '2', '2']], ['1', '3'])
+        self.assertEqual(LinearSystem(planes).compute_solution(), 'No solutions')
+
+        # dense Decimal planes can be solved exactly too
+        planes = [Hyperplane(normal_vector=Vector(['1', '2']), constant_term='1'),
+                  Hyperplane(normal_vector=Vector(['3', '4']), constant_term='0.1')]
+        solution = LinearSystem(planes, backend=LinearSystem.FRACTION_BACKEND).compute_solution()
+        self.assertEqual(solution.basepoint.coordinates, (Fraction(-19, 10), Fraction(29, 20)))
+
+    def test_exact_rank(self):
+        # rows differ by less than the 1e-10 tolerance of the other backends
+        tiny = Fraction(1, 10 ** 12)
+        planes = self.build_planes([[1, 1], [1, 1 + tiny]], [1, 1])
+        self.assertEqual(len(LinearSystem(planes, backend=LinearSystem.DECIMAL_BACKEND)
+                             .compute_solution().direction_vectors), 1)
+
+        s = LinearSystem(planes)
+        self.assertEqual(s.compute_rref().indices_of_first_nonzero_terms_in_each_row(), [0, 1])
+        self.assertEqual(s.compute_solution().basepoint.coordinates, (1, 0))
+        self.assertEqual(s.factorize().rank, 2)
+
+    def test_factorize(self):
+        planes = self.build_planes([['2', '1', '1'], ['4', '-6', '0'], ['-2', '7', '2']], [0, 0, 0])
+        f = LinearSystem(planes).factorize()
+        self.assertEqual(f.determinant(), -16)
+        self.assertEqual(f.compute_solution(['5', '-2', '9']).basepoint.coordinates, (1, 1, 2))
+
+        planes = self.build_planes([['1', '1'], ['2', '2']], [0, 0])
+        f = LinearSystem(planes).factorize()
+        self.assertTrue(f.is_consistent(['1', '2']))
+        self.assertFalse(f.is_consistent([1, 2 + Fraction(1, 10 ** 12)]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+from __future__ import absolute_import
+from fractions import Fraction
+
+from vector import Vector
+from fraction_vector import FractionVector
+
+import unittest
+
+
+class FractionVectorTest(unittest.TestCase):
+
+    def runTest(self):
+        self.test_initialize()
+        self.test_arithmetic()
+
+    def test_initialize(self):
+        v = FractionVector(['0.1', 2, '1/3'])
+        self.assertEqual(v.coordinates, (Fraction(1, 10), Fraction(2), Fraction(1, 3)))
+        self.assertEqual(v.backend, 'fraction')
+        self.assertFalse(hasattr(v, '__dict__'))
+
+        try:
+            FractionVector([])
+            self.fail('last line should throws an error')
+        except ValueError as e:
+            self.assertEqual(str(e), 'The coordinates must be nonempty')
+
+    def test_arithmetic(self):
+        v = FractionVector(['1/3', '1/3', '1/3'])
+        w = FractionVector(['2/3', '-1/3', 0])
+
+        self.assertEqual(v.plus(w).coordinates, (Fraction(1), Fraction(0), Fraction(1, 3)))
+        self.assertEqual(v.minus(w).coordinates, (Fraction(-1, 3), Fraction(2, 3), Fraction(1, 3)))
+        self.assertEqual(v.times_scalar(3).coordinates, (1, 1, 1))
+        self.assertEqual(v.dot(w), Fraction(1, 9))
+        self.assertEqual(v.cross(w).coordinates, (Fraction(1, 9), Fraction(2, 9), Fraction(-1, 3)))
+        self.assertTrue(v.is_parallel_to(v.times_scalar(-2)))
+        self.assertTrue(v == Vector(['0.333', '0.333', '0.333']))
+
+
+if __name__ == '__main__':
+    unittest.main()
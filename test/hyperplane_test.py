@@ -0,0 +1,76 @@
+from __future__ import absolute_import
+import unittest
+from fractions import Fraction
+
+from vector import Vector
+from sparse_vector import SparseVector
+from float_vector import FloatVector
+from fraction_vector import FractionVector
+from hyperplane import Hyperplane
+
+
+class HyperplaneTest(unittest.TestCase):
+
+    def runTest(self):
+        self.test_normalized_terms()
+        self.test_hash()
+        self.test_str()
+
+    def test_normalized_terms(self):
+        p = Hyperplane(normal_vector=Vector([0, -2, 4]), constant_term=6)
+        self.assertEqual(p.normalized_terms(), (0, 1, -2, -3))
+        p = Hyperplane(normal_vector=Vector([0, 0]), constant_term=6)
+        self.assertEqual(p.normalized_terms(), (0, 0, 6))
+        p = Hyperplane(normal_vector=FractionVector(['1/3', '1']), constant_term='1/6')
+        self.assertEqual(p.normalized_terms(), (1, 3, Fraction(1, 2)))
+
+    def test_hash(self):
+        p1 = Hyperplane(normal_vector=Vector([1, 2, 3]), constant_term=1)
+        p2 = Hyperplane(normal_vector=Vector([-2, -4, -6]), constant_term=-2)
+        p3 = Hyperplane(normal_vector=Vector([1, 2, 3]), constant_term=2)
+        self.assertEqual(p1, p2)
+        self.assertEqual(hash(p1), hash(p2))
+        self.assertEqual(p1.canonical_form(), p2.canonical_form())
+        self.assertNotEqual(p1, p3)
+        self.assertEqual(len({p1, p2, p3}), 2)
+
+        p4 = Hyperplane(normal_vector=Vector([0, 0, 0]), constant_term=1)
+        p5 = Hyperplane(normal_vector=Vector([0, 0, 0]), constant_term=2)
+        self.assertEqual(len({p4, p5, Hyperplane(normal_vector=Vector([0, 0, 0]), constant_term=1)}), 2)
+
+        # near a rounding boundary of the canonical form, equal hyperplanes still share one set element
+        a = Hyperplane(normal_vector=Vector(['1']), constant_term='0.0005')
+        b = Hyperplane(normal_vector=Vector(['1']), constant_term='0.00050001')
+        c = Hyperplane(normal_vector=Vector(['2']), constant_term='0.00100002')
+        d = Hyperplane(normal_vector=Vector(['1']), constant_term='0.00049999')
+        self.assertEqual(b, c)
+        self.assertEqual(len({b, c}), 1)
+        self.assertEqual(a, d)
+        self.assertEqual(len({a, d}), 1)
+        for p, q in [(a, b), (a, c), (b, d)]:
+            self.assertEqual(p == q, hash(p) == hash(q))
+            self.assertEqual(len({p, q}), 1 if p == q else 2)
+
+        p6 = Hyperplane(normal_vector=FloatVector([1e-30, 1]), constant_term=1e30)
+        p7 = Hyperplane(normal_vector=FloatVector([2e-30, 2]), constant_term=2e30)
+        self.assertEqual(len({p6, p7}), 1)
+
+    def test_str(self):
+        for vector_class in (Vector, SparseVector, FloatVector):
+            p = Hyperplane(normal_vector=vector_class([0, 1, -2, 0, -1]), constant_term=3)
+            self.assertEqual(str(p), 'x_2 - 2x_3 - x_5 = 3')
+        p = Hyperplane(normal_vector=Vector(['-1', '1.0004', '0']), constant_term='-2.5004')
+        self.assertEqual(str(p), '-x_1 + x_2 = -2.500')
+        p = Hyperplane(normal_vector=FractionVector(['1/2', '-3']), constant_term='1/3')
+        self.assertEqual(str(p), '0.500x_1 - 3x_2 = 0.333')
+        p = Hyperplane(normal_vector=FractionVector(['-1571/500', '1']), constant_term='0')
+        self.assertEqual(str(p), str(Hyperplane(normal_vector=Vector(['-3.142', '1']), constant_term='0')))
+        # the first term rounds to 0 but is not near zero, the next term is written as a later one
+        p = Hyperplane(normal_vector=Vector(['0.0001', '2']), constant_term='1')
+        self.assertEqual(str(p), '+ 2x_2 = 1')
+        p = Hyperplane(normal_vector=Vector(['0', '0']), constant_term='1')
+        self.assertEqual(str(p), '0 = 1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,6 +16,7 @@ class LinearSystemTest(unittest.TestCase):
         self.test_rref()
         self.test_compute_solution()
         self.test_parametrization()
+        self.test_str()
 
     def test_row_operations(self):
         p0 = Plane(normal_vector=Vector(['1', '1', '1']), constant_term='1')
@@ -187,3 +188,10 @@ class LinearSystemTest(unittest.TestCase):
         self.assertEqual(solution.direction_vectors[0], Vector(['-1.882', '1.0', '0']))
         self.assertEqual(solution.direction_vectors[1], Vector(['10.016', '0', '1.0']))
 
+    def test_str(self):
+        p1 = Plane(Vector(['1', '-2.5', '0']), '1')
+        p2 = Plane(Vector(['0', '0', '0']), '0')
+        s = LinearSystem([p1, p2])
+        expected = 'Linear System:\nEquation 1: x_1 - 2.500x_2 = 1\nEquation 2: 0 = 0'
+        self.assertEqual(str(s), expected)
+        self.assertEqual(str(s).splitlines()[1:], ['Equation {}: {}'.format(i + 1, p) for i, p in enumerate(s)])
@@ -1,9 +1,15 @@
 from __future__ import absolute_import
-from decimal import Decimal
+from decimal import Decimal, localcontext
+from io import StringIO
 
 from vector import Vector
 from hyperplane import Hyperplane
+from parametrization import Parametrization
+from sparse_vector import SparseVector
+from fraction_vector import FractionVector
 from linear_system import LinearSystem
+from float_vector import FloatVector, numpy
+from float_augmented_matrix import FloatAugmentedMatrix
 
 import unittest
 
@@ -16,6 +22,12 @@ class LinearSystemWithHyperplaneTest(unittest.TestCase):
         self.test_rref()
         self.test_compute_solution()
         self.test_parametrization()
+        self.test_indices_of_first_nonzero_terms_in_each_row()
+        self.test_pivoting()
+        self.test_float64_backend()
+        self.test_float64_blocked_elimination()
+        self.test_remove_redundant_equations()
+        self.test_write()
 
     def test_row_operations(self):
         p0 = Hyperplane(normal_vector=Vector(['1', '1', '1']), constant_term='1')
@@ -185,3 +197,186 @@ class LinearSystemWithHyperplaneTest(unittest.TestCase):
         self.assertEqual(solution.direction_vectors[0], Vector(['-1.882', '1.0', '0']))
         self.assertEqual(solution.direction_vectors[1], Vector(['10.016', '0', '1.0']))
 
+    def test_indices_of_first_nonzero_terms_in_each_row(self):
+        p1 = Hyperplane(normal_vector=Vector(['0', '1', '1']), constant_term='1')
+        p2 = Hyperplane(normal_vector=Vector(['1', '-1', '1']), constant_term='2')
+        p3 = Hyperplane(dimension=3, constant_term='0')
+        s = LinearSystem([p1, p2, p3])
+        self.assertEqual(s.indices_of_first_nonzero_terms_in_each_row(), [1, 0, -1])
+
+        s.swap_rows(0, 2)
+        self.assertEqual(s.indices_of_first_nonzero_terms_in_each_row(), [-1, 0, 1])
+
+        s[0] = Hyperplane(normal_vector=Vector(['0', '0', '1']), constant_term='1')
+        self.assertEqual(s.indices_of_first_nonzero_terms_in_each_row(), [2, 0, 1])
+
+        t = s.compute_triangular_form()
+        self.assertEqual(t.indices_of_first_nonzero_terms_in_each_row(), [0, 1, 2])
+
+        r = LinearSystem([p1, p2]).compute_rref()
+        self.assertEqual(r.indices_of_first_nonzero_terms_in_each_row(), [0, 1])
+
+    def test_pivoting(self):
+        p1 = Hyperplane(normal_vector=Vector(['0.00000001', '1']), constant_term='1')
+        p2 = Hyperplane(normal_vector=Vector(['1', '1']), constant_term='2')
+
+        with localcontext() as ctx:
+            ctx.prec = 6
+            solution = LinearSystem([p1, p2]).compute_solution()
+            self.assertNotEqual(solution.basepoint, Vector(['1', '1']))
+
+            for pivoting in [LinearSystem.PARTIAL_PIVOTING,
+                             LinearSystem.SCALED_PARTIAL_PIVOTING,
+                             LinearSystem.COMPLETE_PIVOTING]:
+                solution = LinearSystem([p1, p2], pivoting=pivoting).compute_solution()
+                self.assertEqual(solution.basepoint, Vector(['1', '1']))
+
+        p1 = Hyperplane(normal_vector=Vector(['1', '2']), constant_term='3')
+        s = LinearSystem([p1], pivoting=LinearSystem.COMPLETE_PIVOTING)
+        solution = s.compute_solution()
+        self.assertEqual(solution.basepoint, Vector(['0', '1.5']))
+        self.assertEqual(solution.direction_vectors, [Vector(['1', '-0.5'])])
+        r = s.compute_rref()
+        self.assertTrue(r[0] == p1)
+        self.assertEqual(r.pivoting, LinearSystem.COMPLETE_PIVOTING)
+
+        p1 = Hyperplane(normal_vector=Vector(['1', '1', '1']), constant_term='1')
+        p2 = Hyperplane(normal_vector=Vector(['1', '1', '1']), constant_term='2')
+        for pivoting in [LinearSystem.PARTIAL_PIVOTING, LinearSystem.COMPLETE_PIVOTING]:
+            s = LinearSystem([p1, p2], pivoting=pivoting)
+            self.assertEqual(s.compute_solution(), LinearSystem.NO_SOLUTIONS_MSG)
+
+        try:
+            LinearSystem([p1, p2], pivoting='best')
+            self.assertFalse(True, 'last line should throws an error')
+        except Exception as e:
+            self.assertEqual(str(e), LinearSystem.UNKNOWN_PIVOTING_STRATEGY_MSG)
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_float64_backend(self):
+        p1 = Hyperplane(normal_vector=Vector(['5.262', '2.739', '-9.878']), constant_term='-3.441')
+        p2 = Hyperplane(normal_vector=Vector(['5.111', '6.358', '7.638']), constant_term='-2.152')
+        p3 = Hyperplane(normal_vector=Vector(['2.016', '-9.924', '-1.367']), constant_term='-9.278')
+        p4 = Hyperplane(normal_vector=Vector(['2.167', '-13.543', '-18.883']), constant_term='-10.567')
+        s = LinearSystem([p1, p2, p3, p4], backend=LinearSystem.FLOAT64_BACKEND)
+        solution = s.compute_solution()
+        self.assertIsInstance(solution.basepoint, FloatVector)
+        self.assertEqual(solution.basepoint, Vector(['-1.177', '0.707', '-0.083']))
+
+        # the backend follows the normal vectors of the planes by default
+        p1 = Hyperplane(normal_vector=FloatVector([0.786, 0.786, 0.588]), constant_term=-0.714)
+        p2 = Hyperplane(normal_vector=FloatVector([-0.131, -0.131, 0.244]), constant_term=0.319)
+        s = LinearSystem([p1, p2])
+        self.assertEqual(s.backend, LinearSystem.FLOAT64_BACKEND)
+        solution = s.compute_solution()
+        self.assertEqual(solution.basepoint, Vector(['-1.346', '0', '0.585']))
+        self.assertEqual(solution.direction_vectors, [Vector(['-1.0', '1.0', '0'])])
+
+        r = s.compute_rref()
+        self.assertEqual(r.backend, LinearSystem.FLOAT64_BACKEND)
+        self.assertEqual(r[0].normal_vector, Vector(['1', '1', '0']))
+        self.assertAlmostEqual(r[0].constant_term, -1.346, places=3)
+
+        p1 = Hyperplane(normal_vector=FloatVector([1, 1, 1]), constant_term=1)
+        p2 = Hyperplane(normal_vector=FloatVector([1, 1, 1]), constant_term=2)
+        self.assertEqual(LinearSystem([p1, p2]).compute_solution(), LinearSystem.NO_SOLUTIONS_MSG)
+
+        try:
+            LinearSystem([p1, p2], backend='float16')
+            self.assertFalse(True, 'last line should throws an error')
+        except Exception as e:
+            self.assertEqual(str(e), LinearSystem.UNKNOWN_BACKEND_MSG)
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_float64_blocked_elimination(self):
+        rng = numpy.random.RandomState(0)
+        num_equations, dimension = 200, 150
+        coefficients = rng.randint(-9, 10, size=(num_equations, dimension)).astype(float)
+        x = rng.randint(-9, 10, size=dimension).astype(float)
+        # the last equations are combinations of the first ones, so a few variables are free
+        coefficients[150:] = coefficients[:50] - 2 * coefficients[50:100]
+        coefficients[:, -5:] = coefficients[:, :5]
+        constant_terms = coefficients.dot(x)
+        planes = [Hyperplane(normal_vector=FloatVector(c), constant_term=k)
+                  for c, k in zip(coefficients, constant_terms)]
+
+        for pivoting in [LinearSystem.PARTIAL_PIVOTING, LinearSystem.SCALED_PARTIAL_PIVOTING]:
+            for threads in [1, 3]:
+                s = LinearSystem(planes, pivoting=pivoting, threads=threads)
+                solution = s.compute_solution()
+                self.assertEqual(len(solution.direction_vectors), 5)
+                basepoint = solution.basepoint.coordinates
+                self.assertTrue(numpy.allclose(coefficients.dot(basepoint), constant_terms))
+                for v in solution.direction_vectors:
+                    self.assertTrue(numpy.allclose(coefficients.dot(v.coordinates), 0))
+
+            # the threshold set on one matrix reduces it column by column, other matrices are still blocked
+            blocked = s.to_augmented_matrix()
+            blocked.compute_triangular_form()
+            unblocked = s.to_augmented_matrix()
+            unblocked.BLOCKED_MIN_ROWS = num_equations + 1
+            unblocked.compute_triangular_form()
+            self.assertEqual(FloatAugmentedMatrix.BLOCKED_MIN_ROWS, 2 * FloatAugmentedMatrix.BLOCK_SIZE)
+            self.assertEqual(blocked.indices_of_first_nonzero_terms_in_each_row(),
+                             unblocked.indices_of_first_nonzero_terms_in_each_row())
+            self.assertTrue(numpy.allclose(blocked.rows, unblocked.rows))
+
+        constant_terms[-1] += 1
+        planes[-1] = Hyperplane(normal_vector=FloatVector(coefficients[-1]), constant_term=constant_terms[-1])
+        s = LinearSystem(planes, pivoting=LinearSystem.PARTIAL_PIVOTING, threads=3)
+        self.assertEqual(s.compute_solution(), LinearSystem.NO_SOLUTIONS_MSG)
+
+    def test_remove_redundant_equations(self):
+        p1 = Hyperplane(normal_vector=Vector(['0', '1', '1']), constant_term='1')
+        p2 = Hyperplane(normal_vector=Vector(['1', '-1', '1']), constant_term='2')
+        p3 = Hyperplane(normal_vector=Vector(['0', '-3', '-3']), constant_term='-3')
+        p4 = Hyperplane(normal_vector=Vector(['0', '0', '0']), constant_term='0')
+        p5 = Hyperplane(normal_vector=Vector(['0.1', '-0.1', '0.1']), constant_term='0.2')
+        s = LinearSystem([p1, p2, p3, p4, p5])
+
+        t = s.remove_redundant_equations()
+        self.assertEqual(len(t), 2)
+        self.assertTrue(t[0] is p1 and t[1] is p2)
+        self.assertEqual(len(s), 5)
+        self.assertEqual(s.compute_solution(deduplicate=True).basepoint, Vector([3, 1, 0]))
+
+        self.assertEqual(len(LinearSystem([p4, p4]).remove_redundant_equations()), 1)
+
+        # same coefficients up to scaling, different constant term
+        p6 = Hyperplane(normal_vector=Vector(['0', '2', '2']), constant_term='1')
+        for planes in ([p1, p2, p6], [p1, Hyperplane(normal_vector=Vector(['0', '0', '0']), constant_term='1')]):
+            with self.assertRaises(Exception) as context:
+                LinearSystem(planes).remove_redundant_equations()
+            self.assertEqual(str(context.exception), LinearSystem.NO_SOLUTIONS_MSG)
+            self.assertEqual(LinearSystem(planes).compute_solution(deduplicate=True), 'No solutions')
+
+    def test_write(self):
+        p1 = Hyperplane(normal_vector=Vector(['1', '0', '-2']), constant_term='1')
+        p2 = Hyperplane(normal_vector=Vector(['0', '0', '0']), constant_term='0')
+        s = LinearSystem([p1, p2])
+        expected = 'Linear System:\nEquation 1: x_1 - 2x_3 = 1\nEquation 2: 0 = 0'
+        self.assertEqual(str(s), expected)
+        output = StringIO()
+        s.write(output)
+        self.assertEqual(output.getvalue(), expected)
+
+        for vector_class in (Vector, SparseVector, FloatVector):
+            solution = Parametrization(basepoint=vector_class([1, 0, 2.5]),
+                                       direction_vectors=[vector_class([0, 1, 0]), vector_class([2, 0, 0])])
+            output = StringIO()
+            solution.write(output)
+            self.assertEqual(output.getvalue(), str(solution))
+            self.assertEqual(len(str(solution).splitlines()), 3)
+
+            output = StringIO()
+            solution.write(output, skip_zeros=True)
+            lines = output.getvalue().splitlines()
+            self.assertEqual(len(lines), 3)
+            self.assertTrue(lines[0].endswith(' t_2') and 't_1' not in lines[0])
+            self.assertTrue(lines[1].endswith(' t_1') and 't_2' not in lines[1])
+            self.assertTrue(lines[2].startswith('x_3 = 2.5') and 't_' not in lines[2])
+
+        solution = Parametrization(basepoint=Vector(['1', '2']), direction_vectors=[Vector(['0', '1'])])
+        self.assertEqual(str(solution), 'x_1 = 1.000 + 0.000 t_1\nx_2 = 2.000 + 1.000 t_1\n')
+        solution = Parametrization(basepoint=FractionVector(['1', '2']), direction_vectors=[FractionVector(['0', '1'])])
+        self.assertEqual(str(solution), 'x_1 = 1.000 + 0.000 t_1\nx_2 = 2.000 + 1.000 t_1\n')
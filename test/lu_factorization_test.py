@@ -0,0 +1,124 @@
+from __future__ import absolute_import
+import pickle
+
+from vector import Vector
+from float_vector import FloatVector, numpy
+from hyperplane import Hyperplane
+from linear_system import LinearSystem
+from augmented_matrix import AugmentedMatrix
+
+import unittest
+
+
+class LUFactorizationTest(unittest.TestCase):
+
+    def runTest(self):
+        self.test_solve_many_one_solution()
+        self.test_solve_many_infinite_solutions()
+        self.test_solve_many_no_solutions()
+        self.test_solve_many_float64()
+        self.test_factorize()
+        self.test_determinant()
+
+    def assert_solves_like_compute_solution(self, vector_class, coefficients, constant_terms):
+        for pivoting in AugmentedMatrix.PIVOTING_STRATEGIES:
+            s = LinearSystem([Hyperplane(normal_vector=vector_class(c)) for c in coefficients], pivoting=pivoting)
+            solutions = s.solve_many(constant_terms)
+            self.assertEqual(len(solutions), len(constant_terms))
+            for k, solution in zip(constant_terms, solutions):
+                planes = [Hyperplane(normal_vector=vector_class(c), constant_term=x) for c, x in zip(coefficients, k)]
+                expected = LinearSystem(planes, pivoting=pivoting).compute_solution()
+                self.assertEqual(str(solution), str(expected))
+
+    def test_solve_many_one_solution(self):
+        coefficients = [['0', '1', '1'], ['1', '-1', '1'], ['1', '2', '-5']]
+        constant_terms = [['1', '2', '3'], ['0', '0', '0'], ['-4', '7', '2.5']]
+        self.assert_solves_like_compute_solution(Vector, coefficients, constant_terms)
+
+        s = LinearSystem([Hyperplane(normal_vector=Vector(c)) for c in coefficients])
+        solution = s.solve_many([['1', '2', '3']])[0]
+        self.assertEqual(solution.basepoint, Vector(['2.556', '0.778', '0.222']))
+        self.assertEqual(solution.direction_vectors, [])
+
+    def test_solve_many_infinite_solutions(self):
+        coefficients = [['1', '1', '1'], ['2', '2', '2'], ['0', '1', '-1']]
+        constant_terms = [['1', '2', '3'], ['-1', '-2', '0']]
+        self.assert_solves_like_compute_solution(Vector, coefficients, constant_terms)
+
+    def test_solve_many_no_solutions(self):
+        p1 = Hyperplane(normal_vector=Vector(['1', '1', '1']))
+        p2 = Hyperplane(normal_vector=Vector(['2', '2', '2']))
+        s = LinearSystem([p1, p2])
+        solutions = s.solve_many([['1', '2'], ['1', '3']])
+        self.assertNotEqual(solutions[0], 'No solutions')
+        self.assertEqual(solutions[1], 'No solutions')
+
+        try:
+            s.solve_many([['1', '2', '3']])
+            self.fail('constant terms must match the num of equations')
+        except Exception as e:
+            self.assertEqual(str(e), 'The num of constant terms should equal the num of equations')
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_solve_many_float64(self):
+        coefficients = [['0', '1', '1'], ['1', '-1', '1'], ['1', '2', '-5']]
+        constant_terms = [['1', '2', '3'], ['0', '0', '0'], ['-4', '7', '2.5']]
+        self.assert_solves_like_compute_solution(FloatVector, coefficients, constant_terms)
+
+        coefficients = [['1', '1', '1'], ['2', '2', '2'], ['0', '1', '-1']]
+        constant_terms = [['1', '2', '3'], ['-1', '-2', '0']]
+        self.assert_solves_like_compute_solution(FloatVector, coefficients, constant_terms)
+
+        p1 = Hyperplane(normal_vector=FloatVector([1, 1, 1]))
+        p2 = Hyperplane(normal_vector=FloatVector([2, 2, 2]))
+        s = LinearSystem([p1, p2])
+        solutions = s.solve_many([['1', '2'], ['1', '3']])
+        self.assertEqual(solutions[1], 'No solutions')
+
+    def test_factorize(self):
+        p1 = Hyperplane(normal_vector=Vector(['0', '1', '1']), constant_term='1')
+        p2 = Hyperplane(normal_vector=Vector(['0', '2', '2']), constant_term='2')
+        p3 = Hyperplane(normal_vector=Vector(['1', '0', '3']), constant_term='0')
+        for pivoting in AugmentedMatrix.PIVOTING_STRATEGIES:
+            s = LinearSystem([p1, p2, p3], pivoting=pivoting)
+            f = pickle.loads(pickle.dumps(s.factorize()))
+            solution = s.compute_solution()
+
+            self.assertEqual(f.rank, 2)
+            self.assertEqual(len(f.free_variable_indices()), len(solution.direction_vectors))
+            self.assertEqual(sorted(f.pivot_variable_indices() + f.free_variable_indices()), [0, 1, 2])
+            self.assertEqual(f.indices_of_first_nonzero_terms_in_each_row()[2], -1)
+            self.assertTrue(f.is_consistent(['1', '2', '0']))
+            self.assertFalse(f.is_consistent(['1', '3', '0']))
+            self.assertEqual(str(f.compute_solution(['1', '2', '0'])), str(solution))
+
+        s = LinearSystem([p1, p2, p3])
+        self.assertEqual(s.factorize().free_variable_indices(), [2])
+        self.assertEqual(s.factorize().pivot_variable_indices(), [0, 1])
+
+    def test_determinant(self):
+        coefficients = [['2', '1', '1'], ['4', '-6', '0'], ['-2', '7', '2']]
+        for pivoting in AugmentedMatrix.PIVOTING_STRATEGIES:
+            s = LinearSystem([Hyperplane(normal_vector=Vector(c)) for c in coefficients], pivoting=pivoting)
+            self.assertEqual(s.factorize().determinant(), -16)
+
+        p1 = Hyperplane(normal_vector=Vector(['1', '2']))
+        p2 = Hyperplane(normal_vector=Vector(['2', '4']))
+        self.assertEqual(LinearSystem([p1, p2]).factorize().determinant(), 0)
+
+        s = LinearSystem([p1])
+        try:
+            s.factorize().determinant()
+            self.fail('determinant of a non square system')
+        except Exception as e:
+            self.assertEqual(str(e), 'Determinant is only defined for square systems')
+
+        if numpy is not None:
+            for pivoting in AugmentedMatrix.PIVOTING_STRATEGIES:
+                s = LinearSystem([Hyperplane(normal_vector=FloatVector(c)) for c in coefficients], pivoting=pivoting)
+                f = pickle.loads(pickle.dumps(s.factorize()))
+                self.assertAlmostEqual(f.determinant(), -16)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,7 @@ class PlaneTest(unittest.TestCase):
     def runTest(self):
         self.test_equal()
         self.test_is_parallel_to()
+        self.test_basepoint()
 
     def test_equal(self):
         p1 = Plane(Vector([1, 2, 3]), 1)
@@ -36,3 +37,13 @@ class PlaneTest(unittest.TestCase):
         p2 = Plane(Vector([1.03, -9.515, -1.82]), 8.65)
         self.assertTrue(p1.is_parallel_to(p2))
 
+
+    def test_basepoint(self):
+        p = Plane(Vector([0, 2, 3]), 4)
+        self.assertFalse(p._has_basepoint)
+        self.assertEqual(p.basepoint, Vector([0, 2, 0]))
+        self.assertIs(p.basepoint, p.basepoint)
+        self.assertIsNone(Plane(Vector([0, 0, 0]), 4).basepoint)
+
+        p.basepoint = Vector([1, 1, 1])
+        self.assertEqual(p.basepoint, Vector([1, 1, 1]))
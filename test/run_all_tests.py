@@ -4,13 +4,43 @@ from line_test import LineTest
 from plane_test import PlaneTest
 from linear_system_test import LinearSystemTest
 from linear_system_with_hyperplane_test import LinearSystemWithHyperplaneTest
+from augmented_matrix_test import AugmentedMatrixTest
+from float_vector_test import FloatVectorTest
+from lu_factorization_test import LUFactorizationTest
+from sparse_vector_test import SparseVectorTest
+from sparse_augmented_matrix_test import SparseAugmentedMatrixTest
+from fraction_vector_test import FractionVectorTest
+from fraction_augmented_matrix_test import FractionAugmentedMatrixTest
+from echelon_basis_test import EchelonBasisTest
+from solution_cache_test import SolutionCacheTest
+from vector_batch_test import VectorBatchTest
+from hyperplane_test import HyperplaneTest
+from solver_stats_test import SolverStatsTest
+from batch_solver_test import BatchSolverTest
+from system_file_test import SystemFileTest
+from equation_parser_test import EquationParserTest
 
 all_tests = unittest.TestSuite([
     LineTest(),
     VectorTest(),
     PlaneTest(),
     LinearSystemTest(),
-    LinearSystemWithHyperplaneTest()
+    LinearSystemWithHyperplaneTest(),
+    AugmentedMatrixTest(),
+    FloatVectorTest(),
+    LUFactorizationTest(),
+    SparseVectorTest(),
+    SparseAugmentedMatrixTest(),
+    FractionVectorTest(),
+    FractionAugmentedMatrixTest(),
+    EchelonBasisTest(),
+    SolutionCacheTest(),
+    VectorBatchTest(),
+    HyperplaneTest(),
+    SolverStatsTest(),
+    BatchSolverTest(),
+    SystemFileTest(),
+    EquationParserTest()
 ])
 
 all_tests.run(unittest.TestResult())
@@ -0,0 +1,110 @@
+from __future__ import absolute_import
+
+from vector import Vector
+from fraction_vector import FractionVector
+from hyperplane import Hyperplane
+from plane import Plane
+from linear_system import LinearSystem
+from solution_cache import SolutionCache
+
+import unittest
+
+
+class SolutionCacheTest(unittest.TestCase):
+
+    def runTest(self):
+        self.test_fingerprint()
+        self.test_hits_and_misses()
+        self.test_eviction()
+        self.test_planes()
+
+    def test_fingerprint(self):
+        p1 = Hyperplane(normal_vector=Vector(['0', '1', '1']), constant_term='1')
+        p2 = Hyperplane(normal_vector=Vector(['1', '-1', '1']), constant_term='2')
+        s1 = LinearSystem([p1, p2])
+        # same equations reordered, scaled, repeated and with a '0 = 0' equation
+        s2 = LinearSystem([Hyperplane(normal_vector=Vector(['3', '-3', '3']), constant_term='6'),
+                           Hyperplane(normal_vector=Vector(['0', '0', '0']), constant_term='0'),
+                           Hyperplane(normal_vector=Vector(['0', '-1', '-1']), constant_term='-1'),
+                           Hyperplane(normal_vector=Vector(['0', '0.1', '0.1']), constant_term='0.1')])
+        self.assertEqual(SolutionCache.fingerprint(s1), SolutionCache.fingerprint(s2))
+
+        s3 = LinearSystem([p1, Hyperplane(normal_vector=Vector(['1', '-1', '1']), constant_term='3')])
+        self.assertNotEqual(SolutionCache.fingerprint(s1), SolutionCache.fingerprint(s3))
+
+        s4 = LinearSystem([Hyperplane(normal_vector=FractionVector(['0', '1', '1']), constant_term='1'),
+                           Hyperplane(normal_vector=FractionVector(['1', '-1', '1']), constant_term='2')])
+        self.assertNotEqual(SolutionCache.fingerprint(s1), SolutionCache.fingerprint(s4))
+        self.assertEqual(SolutionCache.canonical_row(Hyperplane(normal_vector=FractionVector(['1/3', '1']),
+                                                                constant_term=1)),
+                         (1, 3, 3))
+        self.assertIsNone(SolutionCache.canonical_row(Hyperplane(normal_vector=Vector([0, 0]), constant_term=0)))
+        self.assertEqual(SolutionCache.canonical_row(Hyperplane(normal_vector=Vector([0, 0]), constant_term=5)),
+                         (0, 0, 1))
+
+    def test_hits_and_misses(self):
+        cache = SolutionCache()
+        s1 = LinearSystem([Hyperplane(normal_vector=Vector(['0', '1', '1']), constant_term='1'),
+                           Hyperplane(normal_vector=Vector(['1', '-1', '1']), constant_term='2')])
+        s2 = LinearSystem([Hyperplane(normal_vector=Vector(['2', '-2', '2']), constant_term='4'),
+                           Hyperplane(normal_vector=Vector(['0', '3', '3']), constant_term='3')])
+        solution = s1.compute_solution(cache=cache)
+        self.assertIs(s2.compute_solution(cache=cache), solution)
+        self.assertEqual(solution.basepoint, Vector([3, 1, 0]))
+        self.assertTrue(s2 in cache)
+
+        s3 = LinearSystem([Hyperplane(normal_vector=Vector(['1', '1']), constant_term='1'),
+                           Hyperplane(normal_vector=Vector(['1', '1']), constant_term='2')])
+        self.assertEqual(s3.compute_solution(cache=cache), 'No solutions')
+        self.assertEqual(s3.compute_solution(cache=cache), 'No solutions')
+        self.assertEqual((cache.hits, cache.misses, cache.evictions), (2, 2, 0))
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertFalse(s1 in cache)
+
+    def test_eviction(self):
+        cache = SolutionCache(max_size=2)
+        systems = [LinearSystem([Hyperplane(normal_vector=Vector(['1', '1']), constant_term=k)]) for k in range(3)]
+        systems[0].compute_solution(cache=cache)
+        systems[1].compute_solution(cache=cache)
+        systems[0].compute_solution(cache=cache)
+        # systems[1] is the least recently used
+        systems[2].compute_solution(cache=cache)
+        self.assertEqual(cache.evictions, 1)
+        self.assertTrue(systems[0] in cache)
+        self.assertFalse(systems[1] in cache)
+        self.assertEqual(len(cache), 2)
+
+        with self.assertRaises(Exception) as context:
+            SolutionCache(max_size=0)
+        self.assertEqual(str(context.exception), SolutionCache.MAX_SIZE_MUST_BE_POSITIVE_MSG)
+
+    def test_planes(self):
+        p1 = Plane(Vector(['0', '1', '1']), '1')
+        p2 = Plane(Vector(['1', '-1', '1']), '2')
+        p3 = Plane(Vector(['0', '-3', '-3']), '-3')
+        s = LinearSystem([p1, p2, p3])
+        cache = SolutionCache()
+        solution = s.compute_solution(cache=cache)
+        self.assertEqual(solution.basepoint, Vector([3, 1, 0]))
+        self.assertTrue(LinearSystem([p2, p1]) in cache)
+        self.assertEqual(s.compute_solution(deduplicate=True).basepoint, Vector([3, 1, 0]))
+        self.assertEqual(len(s.remove_redundant_equations()), 2)
+
+        # with a cache, deduplicate still finds the contradiction before any elimination
+        s = LinearSystem([p1, p2, Plane(Vector(['0', '2', '2']), '1')])
+        calls = []
+        remove_redundant_equations = s.remove_redundant_equations
+
+        def counted_remove_redundant_equations():
+            calls.append(1)
+            return remove_redundant_equations()
+
+        s.remove_redundant_equations = counted_remove_redundant_equations
+        self.assertEqual(s.compute_solution(cache=SolutionCache(), deduplicate=True), LinearSystem.NO_SOLUTIONS_MSG)
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
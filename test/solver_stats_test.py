@@ -0,0 +1,73 @@
+from __future__ import absolute_import
+
+from vector import Vector
+from hyperplane import Hyperplane
+from linear_system import LinearSystem
+from solver_stats import SolverStats
+
+import unittest
+
+
+class SolverStatsTest(unittest.TestCase):
+
+    def runTest(self):
+        self.test_counters()
+        self.test_callback()
+        self.test_backends()
+
+    @staticmethod
+    def build_planes():
+        p1 = Hyperplane(normal_vector=Vector(['0', '1', '1']), constant_term='1')
+        p2 = Hyperplane(normal_vector=Vector(['1', '-1', '1']), constant_term='2')
+        p3 = Hyperplane(normal_vector=Vector(['1', '2', '-5']), constant_term='3')
+        return [p1, p2, p3]
+
+    def test_counters(self):
+        stats = SolverStats()
+        s = LinearSystem(self.build_planes(), stats=stats)
+        s.compute_solution()
+
+        # swap p1 and p2, clear x_1 from p3, x_2 from p3, then x_3 and x_2 above
+        self.assertEqual(stats.row_swaps, 1)
+        self.assertEqual(stats.row_additions, 5)
+        self.assertEqual(stats.row_scalings, 3)
+        self.assertEqual(stats.pivots, [1, 1, 9])
+        self.assertEqual(stats.solves, 1)
+        self.assertTrue(stats.arithmetic_operations > 0)
+        for phase in SolverStats.PHASES:
+            self.assertTrue(stats.phase_seconds[phase] >= 0)
+
+        s.compute_triangular_form()
+        self.assertEqual(stats.row_swaps, 2)
+        self.assertEqual(stats.solves, 2)
+
+        stats.reset()
+        self.assertEqual(stats.as_dict()['row_additions'], 0)
+        self.assertEqual(stats.as_dict()['phase_seconds'][SolverStats.TRIANGULAR_FORM], 0)
+
+        # without stats nothing is recorded
+        LinearSystem(self.build_planes()).compute_solution()
+        self.assertEqual(stats.solves, 0)
+
+    def test_callback(self):
+        seen = []
+        stats = SolverStats(callback=seen.append)
+        planes = self.build_planes()
+        planes.append(Hyperplane(normal_vector=Vector(['1', '1', '1']), constant_term='0'))
+        s = LinearSystem(planes, stats=stats)
+        self.assertEqual(s.compute_solution(), 'No solutions')
+        self.assertEqual(seen, [stats])
+        self.assertEqual(stats.phase_seconds[SolverStats.PARAMETRIZATION], 0)
+        self.assertTrue('row swaps: 1' in str(stats))
+
+    def test_backends(self):
+        for backend in LinearSystem.MATRIX_CLASSES:
+            stats = SolverStats()
+            LinearSystem(self.build_planes(), backend=backend, stats=stats).compute_solution()
+            self.assertEqual(len(stats.pivots), 3, backend)
+            self.assertTrue(stats.row_additions >= 5, backend)
+            self.assertEqual(stats.row_scalings, 3, backend)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+from __future__ import absolute_import
+
+from vector import Vector
+from sparse_vector import SparseVector
+from hyperplane import Hyperplane
+from linear_system import LinearSystem
+from sparse_augmented_matrix import SparseAugmentedMatrix
+
+import unittest
+
+
+class SparseAugmentedMatrixTest(unittest.TestCase):
+
+    def runTest(self):
+        self.test_markowitz_ordering()
+        self.test_compute_solution()
+        self.test_factorize()
+
+    def test_markowitz_ordering(self):
+        # an arrow matrix: eliminating the dense first row or column first fills in everything,
+        # Markowitz ordering leaves it last and no fill-in occurs
+        n = 6
+        planes = [Hyperplane(normal_vector=SparseVector([1] * n), constant_term=n)]
+        for i in range(1, n):
+            planes.append(Hyperplane(normal_vector=SparseVector.from_entries({0: 1, i: 2}, n), constant_term=3))
+
+        m = SparseAugmentedMatrix.from_planes(planes, n)
+        m.compute_triangular_form()
+        self.assertEqual(sum(len(row) for row in m.rows), 2 * n - 1)
+        self.assertEqual(m.indices_of_first_nonzero_terms_in_each_row(), list(range(n)))
+
+        for i, row in enumerate(m.rows):
+            self.assertTrue(all(k in m.column_order[i:] for k in row))
+
+    def test_compute_solution(self):
+        p1 = Hyperplane(normal_vector=SparseVector(['0', '1', '1']), constant_term='1')
+        p2 = Hyperplane(normal_vector=SparseVector(['1', '-1', '1']), constant_term='2')
+        p3 = Hyperplane(normal_vector=SparseVector(['1', '2', '-5']), constant_term='3')
+        s = LinearSystem([p1, p2, p3])
+        self.assertEqual(s.backend, LinearSystem.SPARSE_BACKEND)
+        solution = s.compute_solution()
+        self.assertEqual(solution.basepoint, Vector(['2.556', '0.778', '0.222']))
+        self.assertTrue(isinstance(solution.basepoint, SparseVector))
+
+        s = LinearSystem([p1, p2])
+        solution = s.compute_solution()
+        self.assertEqual(len(solution.direction_vectors), 1)
+        for p in (p1, p2):
+            self.assertEqual(p.normal_vector.dot(solution.basepoint), p.constant_term)
+            self.assertEqual(round(p.normal_vector.dot(solution.direction_vectors[0]), 6), 0)
+
+        p3 = Hyperplane(normal_vector=SparseVector(['0', '2', '2']), constant_term='3')
+        self.assertEqual(LinearSystem([p1, p2, p3]).compute_solution(), 'No solutions')
+
+        # dense planes can be solved by the sparse backend as well
+        p1 = Hyperplane(normal_vector=Vector(['0', '1', '1']), constant_term='1')
+        p2 = Hyperplane(normal_vector=Vector(['1', '-1', '1']), constant_term='2')
+        s = LinearSystem([p1, p2], backend=LinearSystem.SPARSE_BACKEND)
+        self.assertEqual(len(s.compute_solution().direction_vectors), 1)
+
+        t = s.compute_rref()
+        self.assertEqual(t.indices_of_first_nonzero_terms_in_each_row(), [0, 1])
+        for p in t.planes:
+            self.assertTrue(isinstance(p.normal_vector, SparseVector))
+
+    def test_factorize(self):
+        coefficients = [['2', '1', '1'], ['4', '-6', '0'], ['-2', '7', '2']]
+        planes = [Hyperplane(normal_vector=SparseVector(c), constant_term=0) for c in coefficients]
+        f = LinearSystem(planes).factorize()
+        self.assertEqual(round(f.determinant(), 6), -16)
+        self.assertEqual(f.rank, 3)
+
+        dense = LinearSystem([Hyperplane(normal_vector=Vector(c), constant_term=0) for c in coefficients])
+        constant_terms = [['1', '2', '3'], ['0', '0', '0']]
+        for expected, solution in zip(dense.solve_many(constant_terms), f.solve_many(constant_terms)):
+            self.assertEqual(solution.basepoint, expected.basepoint)
+
+        planes = [Hyperplane(normal_vector=SparseVector(c), constant_term=0) for c in [['1', '1'], ['2', '2']]]
+        f = LinearSystem(planes).factorize()
+        self.assertEqual(f.rank, 1)
+        self.assertEqual(len(f.free_variable_indices()), 1)
+        self.assertTrue(f.is_consistent(['1', '2']))
+        self.assertEqual(f.compute_solution(['1', '3']), 'No solutions')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+from __future__ import absolute_import
+import pickle
+from decimal import Decimal
+
+from vector import Vector
+from sparse_vector import SparseVector
+
+import unittest
+
+
+class SparseVectorTest(unittest.TestCase):
+
+    def runTest(self):
+        self.test_initialize()
+        self.test_arithmetic()
+        self.test_interoperates_with_vector()
+
+    def test_initialize(self):
+        v = SparseVector([0, '1.5', 0, 0, -2])
+        self.assertEqual(v.dimension, 5)
+        self.assertEqual(v.entries, {1: Decimal('1.5'), 4: Decimal('-2')})
+        self.assertEqual(v.coordinates, tuple([Decimal(x) for x in [0, '1.5', 0, 0, -2]]))
+        self.assertEqual(v[3], 0)
+        self.assertEqual(v[-1], -2)
+        self.assertEqual(v.backend, 'sparse')
+        self.assertEqual(v.nonzero_terms(), [(1, Decimal('1.5')), (4, Decimal('-2'))])
+        self.assertEqual(v.coordinate_list(), list(v.coordinates))
+        self.assertEqual(Vector([0, '1.5', 0, 0, -2]).nonzero_terms(), v.nonzero_terms())
+        self.assertFalse(hasattr(v, '__dict__'))
+
+        w = SparseVector.from_entries({1: '1.5', 4: -2, 2: 0}, 5)
+        self.assertEqual(w.entries, v.entries)
+        self.assertEqual(pickle.loads(pickle.dumps(w)).entries, v.entries)
+
+        try:
+            SparseVector([])
+            self.fail('last line should throws an error')
+        except ValueError as e:
+            self.assertEqual(str(e), 'The coordinates must be nonempty')
+
+    def test_arithmetic(self):
+        v = SparseVector.from_entries({0: 1, 999: 2}, 1000)
+        w = SparseVector.from_entries({999: -2, 5: 3}, 1000)
+
+        self.assertEqual(v.plus(w).entries, {0: 1, 5: 3})
+        self.assertEqual(v.minus(w).entries, {0: 1, 5: -3, 999: 4})
+        self.assertEqual(v.times_scalar(2).entries, {0: 2, 999: 4})
+        self.assertEqual(v.dot(w), -4)
+        self.assertEqual(round(v.magnitude(), 3), round(Decimal(5).sqrt(), 3))
+        self.assertTrue(v.normalized().dimension == 1000)
+        self.assertTrue(v.is_orthogonal_to(SparseVector.from_entries({5: 1}, 1000)))
+        self.assertTrue(v.is_parallel_to(v.times_scalar(-3)))
+
+    def test_interoperates_with_vector(self):
+        v = SparseVector([1, 0, 2])
+        w = Vector([3, 4, 0])
+
+        self.assertEqual(v.plus(w), Vector([4, 4, 2]))
+        self.assertEqual(w.plus(v), Vector([4, 4, 2]))
+        self.assertEqual(v.dot(w), w.dot(v))
+        self.assertEqual(v.cross(w), Vector([1, 0, 2]).cross(w))
+        self.assertEqual(round(v.angle_with(w), 3), round(Vector([1, 0, 2]).angle_with(w), 3))
+        self.assertTrue(v == Vector([1, 0, 2]) and Vector([1, 0, 2]) == v)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+from __future__ import absolute_import
+import os
+import shutil
+import tempfile
+from decimal import Decimal
+from fractions import Fraction
+
+from vector import Vector
+from float_vector import FloatVector, numpy
+from sparse_vector import SparseVector
+from fraction_vector import FractionVector
+from hyperplane import Hyperplane
+from linear_system import LinearSystem
+from system_file import SystemFile
+
+import unittest
+
+
+class SystemFileTest(unittest.TestCase):
+
+    def runTest(self):
+        self.test_save_and_load()
+        self.test_lazy_equations()
+        self.test_invalid_file()
+        self.test_exact_backends()
+        self.test_save_over_loaded_file()
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'system.lsys')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_save_and_load(self):
+        vector_classes = [Vector, SparseVector, FractionVector]
+        if numpy is not None:
+            vector_classes.append(FloatVector)
+
+        for vector_class in vector_classes:
+            p1 = Hyperplane(normal_vector=vector_class(['5.262', '0', '-9.878']), constant_term='-3.441')
+            p2 = Hyperplane(normal_vector=vector_class(['0.25', '6.358', '0']), constant_term='2')
+            s = LinearSystem([p1, p2], pivoting=LinearSystem.PARTIAL_PIVOTING)
+            s.save(self.path)
+
+            t = LinearSystem.load(self.path)
+            self.assertEqual(t.backend, s.backend)
+            self.assertEqual(t.pivoting, LinearSystem.PARTIAL_PIVOTING)
+            self.assertEqual(t.dimension, 3)
+            self.assertEqual(len(t), 2)
+            for p, q in zip(s, t):
+                self.assertIsInstance(q.normal_vector, vector_class)
+                self.assertEqual(list(q.normal_vector.coordinates), list(p.normal_vector.coordinates))
+                self.assertEqual(q.constant_term, p.constant_term)
+
+            solution = t.compute_solution()
+            self.assertEqual(solution.basepoint, s.compute_solution().basepoint)
+            self.assertEqual(len(solution.direction_vectors), 1)
+            t.planes.close()
+
+        s = LinearSystem([Hyperplane(normal_vector=Vector(['1', '2']), constant_term='3')],
+                         backend=LinearSystem.FRACTION_BACKEND)
+        s.save(self.path)
+        t = LinearSystem.load(self.path)
+        self.assertEqual(t.backend, LinearSystem.FRACTION_BACKEND)
+        self.assertEqual(t[0].normal_vector.coordinates, (Fraction(1), Fraction(2)))
+        t.planes.close()
+
+    def test_lazy_equations(self):
+        planes = [Hyperplane(normal_vector=Vector([i, i + 1]), constant_term=i) for i in range(10)]
+        LinearSystem(planes).save(self.path)
+
+        f = SystemFile(self.path)
+        self.assertEqual(len(f), 10)
+        self.assertEqual(f.dimension, 2)
+        self.assertEqual(f.coefficient_row(3), (3.0, 4.0))
+        self.assertEqual(f.constant_term(3), 3.0)
+        self.assertEqual(f[-1].normal_vector, Vector([9, 10]))
+        self.assertEqual(f[-1].constant_term, Decimal('9'))
+        self.assertEqual([p.constant_term for p in f[2:5]], [2, 3, 4])
+        self.assertEqual(len(list(f)), 10)
+        with self.assertRaises(IndexError):
+            f[10]
+
+        # assigning an equation decodes the others
+        s = LinearSystem(f)
+        s[0] = Hyperplane(normal_vector=Vector([1, 0]), constant_term=1)
+        self.assertIsInstance(s.planes, list)
+        self.assertEqual(s[1].normal_vector, Vector([1, 2]))
+        f.close()
+
+    def test_exact_backends(self):
+        p1 = Hyperplane(normal_vector=FractionVector(['1/3']), constant_term='1')
+        p2 = Hyperplane(normal_vector=FractionVector(['1']), constant_term='3')
+        s = LinearSystem([p1, p2])
+        s.save(self.path)
+        t = LinearSystem.load(self.path)
+        self.assertEqual(t[0].normal_vector.coordinates, (Fraction(1, 3),))
+        self.assertEqual(t.compute_solution().basepoint.coordinates, (Fraction(3),))
+        self.assertEqual(t.planes.coefficient_row(0), (Fraction(1, 3),))
+        with self.assertRaises(Exception) as context:
+            t.planes.coefficient_block()
+        self.assertEqual(str(context.exception), SystemFile.FLOAT64_FILE_REQUIRED_MSG)
+        t.planes.close()
+
+        # more digits than a float holds
+        x = Decimal('0.123456789012345678901234567')
+        for vector_class in (Vector, SparseVector):
+            s = LinearSystem([Hyperplane(normal_vector=vector_class([x, '0', '-1e40']), constant_term=x)])
+            s.save(self.path)
+            f = SystemFile(self.path)
+            self.assertEqual(f.dtype, SystemFile.TEXT_DTYPE)
+            self.assertEqual(f[0].normal_vector.coordinates, (x, 0, Decimal('-1e40')))
+            self.assertEqual(f.constant_term(0), x)
+            if vector_class is SparseVector:
+                self.assertEqual(f[0].normal_vector.entries, {0: x, 2: Decimal('-1e40')})
+            f.close()
+
+    def test_save_over_loaded_file(self):
+        vector_classes = [Vector, FractionVector]
+        if numpy is not None:
+            vector_classes.append(FloatVector)
+
+        for vector_class in vector_classes:
+            planes = [Hyperplane(normal_vector=vector_class([i, '0.5']), constant_term=i) for i in range(100)]
+            LinearSystem(planes).save(self.path)
+            t = LinearSystem.load(self.path)
+            # planes of t are read from the file being written
+            t.save(self.path)
+            self.assertEqual(t[99].normal_vector, vector_class([99, '0.5']))
+            t.planes.close()
+
+            u = LinearSystem.load(self.path)
+            self.assertEqual(len(u), 100)
+            self.assertEqual(u[99].normal_vector, vector_class([99, '0.5']))
+            self.assertEqual(u[99].constant_term, 99)
+            u.planes.close()
+        self.assertEqual(os.listdir(self.directory), ['system.lsys'])
+
+    def test_invalid_file(self):
+        for content in [b'', b'not a linear system file', b'LSYS' + b'\0' * 60]:
+            with open(self.path, 'wb') as f:
+                f.write(content)
+            with self.assertRaises(Exception) as context:
+                SystemFile(self.path)
+            self.assertEqual(str(context.exception), SystemFile.NOT_A_SYSTEM_FILE_MSG)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+from __future__ import absolute_import
+import unittest
+
+from vector import Vector
+from float_vector import numpy
+from vector_batch import VectorBatch
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class VectorBatchTest(unittest.TestCase):
+
+    def runTest(self):
+        self.test_initialize()
+        self.test_dot_and_magnitude()
+        self.test_angle_and_projection()
+        self.test_cross_product()
+
+    def test_initialize(self):
+        b = VectorBatch([Vector([1, 2, 3]), [4, 5, 6]])
+        self.assertEqual(len(b), 2)
+        self.assertEqual(b.dimension, 3)
+        self.assertEqual(b[1], Vector([4, 5, 6]))
+        self.assertEqual(list(b), [Vector([1, 2, 3]), Vector([4, 5, 6])])
+
+        with self.assertRaises(Exception) as context:
+            VectorBatch([[1, 2], [1, 2, 3]])
+        self.assertEqual(str(context.exception), VectorBatch.ALL_VECTORS_MUST_BE_IN_SAME_DIM_MSG)
+
+        with self.assertRaises(ValueError):
+            VectorBatch([])
+
+        with self.assertRaises(Exception) as context:
+            b.dot(VectorBatch([[1, 2, 3]]))
+        self.assertEqual(str(context.exception), VectorBatch.BATCH_SIZES_MUST_MATCH_MSG)
+
+    def test_dot_and_magnitude(self):
+        v = [Vector([7.887, 4.138]), Vector([-5.955, -4.904, -1.874])]
+        w = [Vector([-8.802, 6.776]), Vector([-4.496, -8.755, 7.103])]
+        b = VectorBatch([v[0], w[0]])
+        self.assertAlmostEqual(b.dot(Vector([1, 1]))[0], 12.025)
+        self.assertAlmostEqual(b.magnitude()[1], float(w[0].magnitude()))
+        self.assertTrue(numpy.allclose(b.normalized().magnitude(), 1))
+
+        b = VectorBatch([v[1], w[1]])
+        self.assertAlmostEqual(b.dot(VectorBatch([w[1], v[1]]))[0], float(v[1].dot(w[1])))
+        self.assertTrue(numpy.allclose(b.times_scalar([1, 2]).minus(b).array, [[0, 0, 0], [float(x) for x in w[1]]]))
+
+        with self.assertRaises(Exception) as context:
+            VectorBatch([[1, 0], [0, 0]]).normalized()
+        self.assertEqual(str(context.exception), Vector.CANNOT_NORMALIZE_ZERO_VECTOR_MSG)
+
+    def test_angle_and_projection(self):
+        b = VectorBatch([[3.183, -7.627], [7.35, 0.221, 5.188][:2]])
+        w = VectorBatch([[-2.668, 5.319], [2.751, 8.259]])
+        angles = b.angle_with(w)
+        self.assertAlmostEqual(angles[0], float(Vector([3.183, -7.627]).angle_with(Vector([-2.668, 5.319]))))
+        self.assertAlmostEqual(b.angle_with(w, in_degrees=True)[0], 180 / numpy.pi * angles[0])
+
+        b = VectorBatch([[3.039, 1.879], [1, 0]])
+        basis = Vector([0.825, 2.036])
+        parallel = b.component_parallel_to(basis)
+        self.assertEqual(parallel[0], Vector([1.083, 2.672]))
+        self.assertTrue(numpy.allclose(parallel.plus(b.component_orthogonal_to(basis)).array, b.array))
+        self.assertTrue(numpy.allclose(b.component_orthogonal_to(basis).dot(basis), 0))
+
+        with self.assertRaises(Exception) as context:
+            b.component_parallel_to(Vector([0, 0]))
+        self.assertEqual(str(context.exception), Vector.NO_UNIQUE_PARALLEL_COMPONENT_MSG)
+
+        with self.assertRaises(Exception) as context:
+            b.angle_with(VectorBatch([[1, 1], [0, 0]]))
+        self.assertEqual(str(context.exception), Vector.CANNOT_COMPUTE_ANGLE_WITH_ZERO_VECTOR_MSG)
+
+    def test_cross_product(self):
+        b = VectorBatch([[8.462, 7.893, -8.187], [1, 0, 0]])
+        c = b.cross(Vector([6.984, -5.975, 4.778]))
+        self.assertEqual(c[0], Vector([-11.205, -97.609, -105.685]))
+        self.assertEqual(c[1], Vector([0, -4.778, -5.975]))
+        self.assertEqual(VectorBatch([[1, 0]]).cross([0, 1])[0], Vector([0, 0, 1]))
+
+        with self.assertRaises(Exception) as context:
+            VectorBatch([[1, 0, 0, 0]]).cross([0, 1, 0, 0])
+        self.assertEqual(str(context.exception), Vector.ONLY_DEFINED_IN_TWO_THREE_DIMS_MSG)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,9 @@
 from __future__ import absolute_import
 import unittest
 from vector import Vector
+from float_vector import FloatVector, numpy
+from sparse_vector import SparseVector
+from fraction_vector import FractionVector
 from decimal import Decimal
 
 
@@ -23,6 +26,8 @@ class VectorTest(unittest.TestCase):
         self.test_cross_product()
         self.test_area_of_parallelogram_with()
         self.test_area_of_triangle_with()
+        self.test_compact_representation()
+        self.test_hash()
 
     def test_initialize(self):
         # test basic initialize
@@ -131,6 +136,14 @@ class VectorTest(unittest.TestCase):
         # zero vector is parallel to any vector
         self.assertTrue(v.is_parallel_to(Vector([0])))
 
+        # opposite directions are parallel, an angle above tolerance is not
+        self.assertTrue(v.is_parallel_to(w.times_scalar(-1)))
+        self.assertFalse(Vector([1, 0]).is_parallel_to(Vector([1, '1e-5'])))
+        self.assertTrue(Vector([1, 0]).is_parallel_to(Vector([1, '1e-7'])))
+        self.assertTrue(Vector([1, 0]).is_parallel_to(Vector([1, '1e-5']), tolerance=1e-4))
+        self.assertTrue(Vector(['1e-11', 0]).is_zero())
+        self.assertFalse(Vector(['1e-9', 0]).is_zero())
+
     def test_is_orthogonal_to(self):
         # zero vector is orthogonal to itself
         v = Vector([0])
@@ -172,3 +185,33 @@ class VectorTest(unittest.TestCase):
         v = Vector([1.5, 9.547, 3.691])
         w = Vector([-6.007, 0.124, 5.772])
         self.assertEqual(round(v.area_of_triangle_with(w), 3), 42.565)
+
+    def test_compact_representation(self):
+        v = Vector([1, 2, 3])
+        self.assertFalse(hasattr(v, '__dict__'))
+        self.assertEqual(v.plus(v).coordinates, (Decimal(2), Decimal(4), Decimal(6)))
+        self.assertEqual(v.minus(v).dimension, 3)
+        self.assertEqual(v.times_scalar('0.5'), Vector(['0.5', '1', '1.5']))
+        self.assertEqual(Vector.from_decimals((Decimal(1), Decimal(2))), Vector([1, 2]))
+
+    def test_hash(self):
+        v = Vector(['1.0001', '2', '0'])
+        vectors = [Vector([1, 2, 0]), SparseVector.from_entries({0: 1, 1: 2}, 3), FractionVector(['10001/10000', 2, 0])]
+        if numpy is not None:
+            vectors.append(FloatVector([1, 2, 0]))
+        for w in vectors:
+            self.assertEqual(v, w)
+            self.assertEqual(hash(v), hash(w))
+        self.assertEqual(len(set(vectors + [v])), 1)
+        self.assertEqual(v.canonical_form(), (Decimal('1.000'), Decimal('2.000'), Decimal('0.000')))
+
+        self.assertNotEqual(Vector([1, 2]), Vector([1, 2, 0]))
+        self.assertNotEqual(Vector([1, 2]), Vector([1, '2.01']))
+        self.assertEqual({Vector([1, 2]): 'a'}[Vector(['1.0002', 2])], 'a')
+
+        # past 1e27 coordinates have more digits than the precision of 30 once quantized
+        large = [Vector(['1e30', '-2e35']), SparseVector(['1e30', '-2e35']), FractionVector([10 ** 30, -2 * 10 ** 35])]
+        if numpy is not None:
+            large.append(FloatVector([2.0 ** 100, -1e35]))
+        self.assertEqual(len(set(large)), 2 if numpy is not None else 1)
+        self.assertEqual(large[0].canonical_form()[0], Decimal(10 ** 30))
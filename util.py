@@ -1,4 +1,5 @@
-from decimal import Decimal
+from decimal import Decimal, localcontext
+from fractions import Fraction
 
 
 class MyDecimal(Decimal):
@@ -6,6 +7,83 @@ class MyDecimal(Decimal):
         return abs(self) < eps
 
 
+def is_near_zero(x, eps=1e-10):
+    return abs(x) < eps
+
+
+def is_zero(x, eps=1e-10):
+    """Returns whether x is near zero, Fractions are exact and must be zero."""
+    if isinstance(x, Fraction):
+        return x == 0
+    return abs(x) < eps
+
+
+def normalized_terms(normal_vector, constant_term):
+    """Returns coefficients of normal_vector followed by constant_term, all divided by the first nonzero
+    coefficient, or as they are if normal_vector is zero, for equations of Hyperplane, Plane and Line alike."""
+    terms = list(normal_vector.coordinates) + [constant_term]
+    leading = next((x for x in terms[:-1] if not is_zero(x)), None)
+    if leading is None:
+        return tuple(terms)
+    return tuple([x / leading for x in terms])
+
+
+def quantize_all(decimals, exponent):
+    """Returns a tuple of decimals quantized to exponent, e.g. Decimal('.001').
+
+    The precision is raised to hold every digit of the largest one: Decimal.quantize raises
+    InvalidOperation when the result has more digits than the precision, e.g. from 1e27 up
+    to 3 decimal places at precision 30."""
+    digits = max([x.adjusted() for x in decimals] or [0]) - exponent.adjusted() + 1
+    with localcontext() as context:
+        context.prec = max(context.prec, digits)
+        return tuple([x.quantize(exponent) for x in decimals])
+
+
+def round_to_places(x, num_decimal_places=3):
+    """Returns x rounded to num_decimal_places, Fractions are rounded as Decimals so that
+    every backend is written alike, e.g. Fraction(-1571, 500) -> Decimal('-3.142') rather than Fraction(-1571, 500)."""
+    if isinstance(x, Fraction):
+        x = Decimal(x.numerator) / x.denominator
+    return round(x, num_decimal_places)
+
+
+def rounded(x, num_decimal_places=3):
+    """Returns x rounded to num_decimal_places as equations are written, an int when it is a whole number."""
+    x = round_to_places(x, num_decimal_places)
+    if x % 1 == 0:
+        return int(x)
+    return x
+
+
+def write_equation(stream, normal_vector, constant_term, num_decimal_places=3):
+    """Write the equation of normal_vector and constant_term to stream, a file-like object,
+    as Hyperplane, Plane and Line write themselves, e.g. 'x_1 - 2x_3 = 1'.
+
+    Only nonzero coefficients are visited and each term is formatted once,
+    so the cost is linear in the num of nonzero coefficients, not in the dimension."""
+    terms = []
+    initial_term = True
+    for i, x in normal_vector.nonzero_terms():
+        coefficient = rounded(x, num_decimal_places)
+        # the initial term is the first one not near zero, even when it rounds to 0
+        is_initial_term = initial_term and not is_near_zero(x)
+        if is_initial_term:
+            initial_term = False
+        if coefficient == 0:
+            continue
+
+        if is_initial_term:
+            sign = '-' if coefficient < 0 else ''
+        else:
+            sign = '- ' if coefficient < 0 else '+ '
+        magnitude = abs(coefficient)
+        terms.append('{}{}x_{}'.format(sign, '' if magnitude == 1 else magnitude, i + 1))
+
+    output = '0' if initial_term else ' '.join(terms)
+    stream.write('{} = {}'.format(output, rounded(constant_term, num_decimal_places)))
+
+
 def clip(v, vmax, vmin):
     if v > vmax:
         return vmax
@@ -1,18 +1,28 @@
 from math import sqrt, acos, pi
+from operator import mul
 from decimal import Decimal, getcontext
+from fractions import Fraction
 
-from util import clip
+from util import clip, quantize_all
 
 getcontext().prec = 30
 
 
-class Vector:
+class Vector(object):
 
     CANNOT_NORMALIZE_ZERO_VECTOR_MSG = 'Cannot normalize the zero vector'
     CANNOT_COMPUTE_ANGLE_WITH_ZERO_VECTOR_MSG = 'Cannot compute angle with zero vector'
     NO_UNIQUE_PARALLEL_COMPONENT_MSG = 'No unique parallel component for zero vector'
     ONLY_DEFINED_IN_TWO_THREE_DIMS_MSG = 'Only defined in two, three dimensions'
 
+    ZERO_TOLERANCE = 1e-10
+    EQUALITY_PRECISION = Decimal('.001')
+
+    backend = 'decimal'
+
+    # no per-instance __dict__, a vector only ever holds its coordinates and dimension
+    __slots__ = ('coordinates', 'dimension')
+
     def __init__(self, coordinates):
         try:
             if not coordinates:
@@ -26,6 +36,21 @@ class Vector:
         except TypeError:
             raise TypeError('The coordinates must be an iterable')
 
+    @staticmethod
+    def to_scalar(x):
+        """Returns x converted to the scalar type of this backend."""
+        if isinstance(x, Fraction):
+            return Decimal(x.numerator) / x.denominator
+        return Decimal(x)
+
+    @classmethod
+    def from_decimals(cls, coordinates):
+        """Returns a new Vector holding coordinates, a nonempty tuple of Decimals, without converting them again."""
+        v = cls.__new__(cls)
+        v.coordinates = coordinates
+        v.dimension = len(coordinates)
+        return v
+
     def magnitude(self):
         """Returns a Decimal object with value of magnitude."""
         coordinates_squared = [x ** 2 for x in self.coordinates]
@@ -47,22 +72,20 @@ class Vector:
 
     def times_scalar(self, c):
         """Returns a new Vector with value of c times scalar self."""
-        new_coordinates = [Decimal(c) * x for x in self.coordinates]
-        return Vector(new_coordinates)
+        c = Decimal(c)
+        return Vector.from_decimals(tuple([c * x for x in self.coordinates]))
 
     def plus(self, v):
         """Returns a new Vector with value of v plus self."""
-        new_coordinates = [x + y for x, y in zip(self.coordinates, v.coordinates)]
-        return Vector(new_coordinates)
+        return Vector.from_decimals(tuple([x + y for x, y in zip(self.coordinates, v.coordinates)]))
 
     def minus(self, v):
         """Returns a new Vector with value of self minus v."""
-        new_coordinates = [x - y for x, y in zip(self.coordinates, v.coordinates)]
-        return Vector(new_coordinates)
+        return Vector.from_decimals(tuple([x - y for x, y in zip(self.coordinates, v.coordinates)]))
 
     def dot(self, v):
         """Returns a new Vector with value of dot product of v and self."""
-        return sum([x * y for x, y in zip(self.coordinates, v.coordinates)])
+        return sum(map(mul, self.coordinates, v.coordinates))
 
     def angle_with(self, v, in_degrees=False):
         """Returns angle between v and self.
@@ -167,18 +190,27 @@ class Vector:
 
                    Args:
                        v: vector to compare with.
-                       tolerance: tolerance used in comparision (default 1e-6)."""
-        return (self.is_zero() or
-                v.is_zero() or
-                abs(self.angle_with(v) - Decimal('0')) < tolerance or
-                abs(self.angle_with(v) - Decimal(pi)) < tolerance)
-
-    def is_zero(self, tolerance=1e-10):
+                       tolerance: tolerance on the sine of the angle between self and v (default 1e-6).
+
+                   By Cauchy-Schwarz (self . v)^2 <= |self|^2 |v|^2, with equality only for parallel
+                   vectors, and the gap relative to |self|^2 |v|^2 is the squared sine of the angle,
+                   so no sqrt or acos is needed."""
+        self_squared = self.dot(self)
+        v_squared = v.dot(v)
+        zero = self.to_scalar(self.ZERO_TOLERANCE) ** 2
+        if self_squared < zero or v_squared < zero:
+            return True
+        dot = self.dot(v)
+        product = self_squared * v_squared
+        return product - dot * dot < self.to_scalar(tolerance) ** 2 * product
+
+    def is_zero(self, tolerance=ZERO_TOLERANCE):
         """Returns whether self is zero vector.
 
                    Args:
-                       tolerance: tolerance used in comparision (default 1e-6)."""
-        return self.magnitude() < tolerance
+                       tolerance: tolerance on the magnitude used in comparision (default 1e-10),
+                                  the squared magnitude is compared to avoid a sqrt."""
+        return self.dot(self) < self.to_scalar(tolerance) ** 2
 
     def area_of_triangle_with(self, v):
         """Returns area of triangle made up of self and v."""
@@ -228,13 +260,32 @@ class Vector:
     def __str__(self):
         return 'Vector: {}'.format(self.coordinates)
 
+    def coordinate_list(self):
+        """Returns coordinates as a list of scalars, zeros included."""
+        return list(self.coordinates)
+
+    def nonzero_terms(self):
+        """Returns (index, coordinate) of nonzero coordinates as a list, in order of index."""
+        return [(i, x) for i, x in enumerate(self.coordinates) if x]
+
+    def canonical_form(self):
+        """Returns coordinates rounded to EQUALITY_PRECISION, as a tuple of Decimals.
+
+        Vectors are equal when they are in the same dimension and have the same canonical form,
+        which is also what they are hashed by, so vectors of any backend can be put in sets and dicts."""
+        to_decimal = Vector.to_scalar
+        return quantize_all([to_decimal(x) for x in self.coordinates], self.EQUALITY_PRECISION)
+
     def __eq__(self, v):
-        if not isinstance(v, Vector):
+        if not isinstance(v, Vector) or v.dimension != self.dimension:
             return False
-        for x, y in zip(self.coordinates, v.coordinates):
-            if x.quantize(Decimal('.001')) != y.quantize(Decimal('.001')):
-                return False
-        return True
+        return self.canonical_form() == v.canonical_form()
+
+    def __ne__(self, v):
+        return not self == v
+
+    def __hash__(self):
+        return hash(self.canonical_form())
 
     def __iter__(self):
         return self.coordinates.__iter__()
@@ -0,0 +1,173 @@
+from math import pi
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from vector import Vector
+from float_vector import FloatVector
+
+
+class VectorBatch(object):
+
+    ALL_VECTORS_MUST_BE_IN_SAME_DIM_MSG = 'All vectors in the batch should live in the same dimension'
+    BATCH_SIZES_MUST_MATCH_MSG = 'Batches should hold the same num of vectors'
+
+    def __init__(self, vectors):
+        """Initialize VectorBatch object.
+
+        A VectorBatch holds many vectors of one dimension as the rows of a single float64
+        numpy array, every operation runs over the whole batch in one vectorized call
+        instead of one method call and a few intermediate Vectors per vector.
+
+        Operations taking another operand accept either a VectorBatch of the same size,
+        pairing vectors row by row, or a single vector that every vector is paired with.
+        Operations returning one number per vector return a numpy array,
+        operations returning one vector per vector return a VectorBatch.
+
+        Args:
+            vectors: iterable of Vectors or of coordinate sequences.
+
+        Raises:
+            Exception: thrown with msg 'The float64 backend requires numpy' when numpy is not installed
+            ValueError: thrown with msg 'The vectors must be nonempty'
+            Exception: thrown with msg 'All vectors in the batch should live in the same dimension'
+                       when vectors are not in same dimension"""
+        if numpy is None:
+            raise Exception(FloatVector.NUMPY_REQUIRED_MSG)
+
+        rows = [v.coordinates if isinstance(v, Vector) else v for v in vectors]
+        if not rows:
+            raise ValueError('The vectors must be nonempty')
+        try:
+            array = numpy.array(rows, dtype=numpy.float64)
+        except ValueError:
+            raise Exception(self.ALL_VECTORS_MUST_BE_IN_SAME_DIM_MSG)
+        if array.ndim != 2:
+            raise Exception(self.ALL_VECTORS_MUST_BE_IN_SAME_DIM_MSG)
+
+        self.array = array
+        self.dimension = array.shape[1]
+
+    @classmethod
+    def from_array(cls, array):
+        """Returns a new VectorBatch holding the rows of array, a 2-dimension float64 numpy array, without copying it."""
+        batch = cls.__new__(cls)
+        batch.array = array
+        batch.dimension = array.shape[1]
+        return batch
+
+    def operand(self, v):
+        """Returns coordinates of v as an array that broadcasts against the batch."""
+        if isinstance(v, VectorBatch):
+            if len(v) != len(self):
+                raise Exception(self.BATCH_SIZES_MUST_MATCH_MSG)
+            return v.array
+        if isinstance(v, Vector):
+            v = v.coordinates
+        return numpy.asarray(v, dtype=numpy.float64)
+
+    def dot(self, v):
+        """Returns an array with value of dot product of each vector and v."""
+        return numpy.einsum('ij,ij->i', self.array, numpy.broadcast_to(self.operand(v), self.array.shape))
+
+    def magnitude(self):
+        """Returns an array with value of magnitude of each vector."""
+        return numpy.sqrt(numpy.einsum('ij,ij->i', self.array, self.array))
+
+    def normalized(self):
+        """Returns a VectorBatch of each vector normalized.
+
+                Raises:
+                    Exception: Throws with msg 'Cannot normalize the zero vector'
+                               when the batch holds a zero vector
+                """
+        magnitude = self.magnitude()
+        if not numpy.all(magnitude):
+            raise Exception(Vector.CANNOT_NORMALIZE_ZERO_VECTOR_MSG)
+        return VectorBatch.from_array(self.array / magnitude[:, None])
+
+    def times_scalar(self, c):
+        """Returns a VectorBatch of each vector times c, a scalar or an array of one scalar per vector."""
+        c = numpy.asarray(c, dtype=numpy.float64)
+        if c.ndim:
+            c = c[:, None]
+        return VectorBatch.from_array(self.array * c)
+
+    def plus(self, v):
+        """Returns a VectorBatch of each vector plus v."""
+        return VectorBatch.from_array(self.array + self.operand(v))
+
+    def minus(self, v):
+        """Returns a VectorBatch of each vector minus v."""
+        return VectorBatch.from_array(self.array - self.operand(v))
+
+    def angle_with(self, v, in_degrees=False):
+        """Returns an array of angles between each vector and v, see Vector.angle_with.
+
+                Raises:
+                    Exception: Throws with msg 'Cannot compute angle with zero vector'
+                               when either vector of a pair is zero
+                """
+        other = numpy.broadcast_to(self.operand(v), self.array.shape)
+        magnitudes = self.magnitude() * numpy.sqrt(numpy.einsum('ij,ij->i', other, other))
+        if not numpy.all(magnitudes):
+            raise Exception(Vector.CANNOT_COMPUTE_ANGLE_WITH_ZERO_VECTOR_MSG)
+
+        cosines = numpy.einsum('ij,ij->i', self.array, other) / magnitudes
+        angles_in_radians = numpy.arccos(numpy.clip(cosines, -1.0, 1.0))
+        if in_degrees:
+            return angles_in_radians * 180.0 / pi
+        return angles_in_radians
+
+    def component_parallel_to(self, basis):
+        """Returns a VectorBatch of the projection of each vector on basis, see Vector.component_parallel_to.
+
+                Raises:
+                    Exception: Throws with msg 'No unique parallel component for zero vector'
+                               when a basis vector is zero
+                """
+        basis = numpy.broadcast_to(self.operand(basis), self.array.shape)
+        squared = numpy.einsum('ij,ij->i', basis, basis)
+        if not numpy.all(squared):
+            raise Exception(Vector.NO_UNIQUE_PARALLEL_COMPONENT_MSG)
+
+        weights = numpy.einsum('ij,ij->i', self.array, basis) / squared
+        return VectorBatch.from_array(basis * weights[:, None])
+
+    def component_orthogonal_to(self, basis):
+        """Returns a VectorBatch of each vector minus its projection on basis, see Vector.component_orthogonal_to."""
+        return VectorBatch.from_array(self.array - self.component_parallel_to(basis).array)
+
+    def cross(self, v):
+        """Returns a VectorBatch of cross product of each vector and v, see Vector.cross.
+
+        Vectors in two dimensions are embedded in three dimensions first.
+
+                Raises:
+                    Exception: Throws with msg 'Only defined in two, three dimensions'
+                               when vectors are in other dimensions
+                """
+        other = numpy.broadcast_to(self.operand(v), self.array.shape)
+        if self.dimension not in (2, 3) or other.shape[1] != self.dimension:
+            raise Exception(Vector.ONLY_DEFINED_IN_TWO_THREE_DIMS_MSG)
+
+        a = self.array
+        if self.dimension == 2:
+            a = numpy.column_stack([a, numpy.zeros(len(a))])
+            other = numpy.column_stack([other, numpy.zeros(len(other))])
+        return VectorBatch.from_array(numpy.cross(a, other))
+
+    def to_vectors(self):
+        """Returns a list of FloatVectors, one per vector."""
+        return [FloatVector(row) for row in self.array]
+
+    def __len__(self):
+        return self.array.shape[0]
+
+    def __getitem__(self, i):
+        return FloatVector(self.array[i])
+
+    def __iter__(self):
+        return iter(self.to_vectors())